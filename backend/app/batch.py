@@ -0,0 +1,34 @@
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable, List, Sequence, Tuple
+
+
+async def iter_batch(
+    items: Sequence[Any],
+    handler: Callable[[Any], Awaitable[Any]],
+    concurrency: int
+) -> AsyncIterator[Tuple[int, Any, Exception]]:
+    """항목들을 최대 concurrency개씩 동시에 처리하고 완료되는 순서대로 (index, 결과, 오류)를 내보냅니다.
+
+    작업자 수만큼만 태스크를 만들고 결과는 꺼내는 즉시 버리므로, 큰 배치도 전체를 메모리에 쌓지 않습니다.
+    concurrency가 0 이하면 다른 동시 처리 설정처럼 제한 없이 모든 항목을 동시에 처리합니다.
+    """
+    if concurrency <= 0:
+        concurrency = max(1, len(items))
+    pending = iter(enumerate(items))
+    finished: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def worker() -> None:
+        for index, item in pending:
+            try:
+                await finished.put((index, await handler(item), None))
+            except Exception as e:
+                await finished.put((index, None, e))
+
+    workers: List[asyncio.Task] = [asyncio.create_task(worker()) for _ in range(min(concurrency, len(items)))]
+    try:
+        for _ in range(len(items)):
+            yield await finished.get()
+    finally:
+        # 클라이언트 연결이 끊기는 등 중간에 종료되면 남은 작업 취소
+        for task in workers:
+            task.cancel()
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+def normalize_value(value: Any) -> Any:
+    """대소문자, 공백, 유니코드 조합 차이로 같은 요청이 다른 키가 되지 않도록 정규화합니다."""
+    if isinstance(value, str):
+        return ' '.join(unicodedata.normalize('NFC', value).lower().split())
+    if isinstance(value, dict):
+        return {k: normalize_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [normalize_value(v) for v in value]
+    return value
+
+
+def make_cache_key(namespace: str, fields: Dict[str, Any], model: str, prompt_version: str) -> str:
+    payload = json.dumps(
+        {'fields': normalize_value(fields), 'model': model, 'prompt_version': prompt_version},
+        ensure_ascii=False, sort_keys=True, default=str
+    )
+    return f"{namespace}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+
+class ResultCache:
+    """생성 결과 캐시의 공통 인터페이스. 값은 JSON으로 직렬화 가능한 dict입니다."""
+
+    backend = 'none'
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.stale_hits = 0
+
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Dict[str, Any]]:
+        """allow_stale이면 만료 후 TTL 한 주기 안의 항목도 돌려줍니다 (장애 시 대체 응답용)."""
+        value = self._get(key, allow_stale)
+        if value is None:
+            self.misses += 1
+        elif allow_stale:
+            self.stale_hits += 1
+        else:
+            self.hits += 1
+        return value
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        self._set(key, value)
+
+    def size(self) -> int:
+        return 0
+
+    def stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            'backend': self.backend,
+            'hits': self.hits,
+            'misses': self.misses,
+            'stale_hits': self.stale_hits,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'size': self.size(),
+        }
+
+    def _get(self, key: str, allow_stale: bool) -> Optional[Dict[str, Any]]:
+        return None
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        pass
+
+
+class MemoryCache(ResultCache):
+    """프로세스 내부 LRU + TTL 캐시"""
+
+    backend = 'memory'
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        super().__init__(ttl_seconds, max_entries)
+        self._entries: 'OrderedDict[str, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: str, allow_stale: bool) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at + self.ttl_seconds < now:
+                del self._entries[key]
+                return None
+            if expires_at < now and not allow_stale:
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[key] = (time.time() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteCache(ResultCache):
+    """여러 uvicorn 워커가 같은 파일을 공유할 수 있는 로컬 디스크 캐시"""
+
+    backend = 'sqlite'
+
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        super().__init__(ttl_seconds, max_entries)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cache ('
+            'key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS cache_accessed_at ON cache (accessed_at)')
+        self._conn.commit()
+
+    def size(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM cache').fetchone()[0]
+
+    def _get(self, key: str, allow_stale: bool) -> Optional[Dict[str, Any]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] < now and not (allow_stale and row[1] + self.ttl_seconds >= now):
+                return None
+            self._conn.execute('UPDATE cache SET accessed_at = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+        return json.loads(row[0])
+
+    def _set(self, key: str, value: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)',
+                (key, json.dumps(value, ensure_ascii=False), now + self.ttl_seconds, now)
+            )
+            # 만료 후 TTL 한 주기가 지난 항목과 최대 개수를 넘는 오래된 항목 정리
+            self._conn.execute('DELETE FROM cache WHERE expires_at < ?', (now - self.ttl_seconds,))
+            self._conn.execute(
+                'DELETE FROM cache WHERE key IN ('
+                'SELECT key FROM cache ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                (self.max_entries,)
+            )
+            self._conn.commit()
+
+
+def create_cache(backend: str, ttl_seconds: float, max_entries: int, sqlite_path: str) -> ResultCache:
+    if backend == 'memory':
+        return MemoryCache(ttl_seconds, max_entries)
+    if backend == 'sqlite':
+        return SQLiteCache(sqlite_path, ttl_seconds, max_entries)
+    return ResultCache(ttl_seconds, max_entries)
@@ -1,5 +1,7 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
+from .lazy import Lazy
 
 class Settings(BaseSettings):
     environment: str = "development"
@@ -9,10 +11,61 @@ class Settings(BaseSettings):
     
     # Gemini API 설정
     gemini_api_key: Optional[str] = None
-    gemini_model: str = "gemini-2.5-pro"
+    gemini_model: str = "gemini-2.5-pro"             # 본문 생성 (섹션/보정 포함)
+    gemini_title_model: str = "gemini-2.5-flash"
+    gemini_keyword_model: str = "gemini-2.5-flash"
+    title_pool_size: int = 5  # 제목 호출 한 번에 받을 후보 수 (남은 후보는 캐시해 다시 요청 시 바로 제공)
+    gemini_fast_model: str = "gemini-2.5-flash"      # 본문 생성 시간 예산이 부족할 때 전환할 모델 (비우면 전환하지 않음)
+    gemini_output_mode: str = "text"  # 제목/키워드/본문 응답 형식 (text, json). 스트리밍은 항상 섹션 마커 형식
+    gemini_max_concurrency: int = 8  # 동시에 진행할 수 있는 Gemini 호출 수
+    gemini_interactive_reserved_slots: int = 2  # 동시 호출 수 중 제목/키워드 호출 몫으로 남겨 둘 수 (본문 생성이 모두 차지하지 않도록)
+    gemini_requests_per_minute: int = 150  # 분당 요청 한도 (0이면 제한 없음)
+    gemini_tokens_per_minute: int = 2000000  # 분당 토큰 한도 (0이면 제한 없음)
+    
+    # 모델 응답 시간 기반 전환: 기본 모델의 평균 응답 시간이 남은 예산 * budget_ratio를 넘으면 빠른 모델 사용
+    routing_latency_alpha: float = 0.3    # 응답 시간 이동 평균 가중치
+    routing_budget_ratio: float = 0.8
+    routing_probe_seconds: float = 60.0   # 전환 중에도 이 간격으로 기본 모델을 다시 시도
+    
+    # 호출별 제한 시간과 장애 시 차단(circuit breaker) 설정
+    gemini_interactive_timeout_seconds: float = 15.0  # 제목/키워드
+    gemini_content_timeout_seconds: float = 55.0      # 본문 한 번에 생성 (스트리밍은 전체 응답까지)
+    gemini_section_timeout_seconds: float = 30.0      # 목차/섹션별 생성 및 보정
+    circuit_failure_threshold: int = 5
+    circuit_recovery_seconds: float = 30.0
+    
+    # 생성 결과 캐시 설정 (memory, sqlite, none)
+    cache_backend: str = "memory"
+    cache_ttl_seconds: int = 3600
+    cache_max_entries: int = 1000
+    cache_sqlite_path: str = "aimax_cache.sqlite3"
+    
+    # 일괄 생성 설정
+    batch_max_items: int = 100
+    batch_max_concurrency: int = 8  # 배치 하나에서 동시에 처리할 항목 수 (0이면 제한 없음)
+    
+    # SEO 기준 미달 시 부분 재생성 설정
+    repair_max_rounds: int = 2
+    repair_deadline_seconds: float = 50.0  # 생성 시작 후 이 시간이 지나면 보정을 중단
+    
+    # 비동기 작업(job) 설정 (작업자 수가 0이면 이 프로세스에서는 작업을 처리하지 않음)
+    job_worker_concurrency: int = 2
+    job_store_path: str = "aimax_jobs.sqlite3"
+    job_poll_interval_seconds: float = 1.0
+    job_max_attempts: int = 3
+    job_retention_seconds: int = 86400  # 완료된 작업 보관 기간
+    job_lease_seconds: float = 30.0     # 처리 중 작업 임대 시간 (처리하던 프로세스가 이 시간 동안 연장하지 않으면 다시 대기열로)
+
+    # 콜드 스타트: 서버 시작 시 모델 클라이언트를 미리 준비 (끄면 첫 모델 호출 때 준비)
+    warm_up_on_startup: bool = False
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
 
-settings = Settings()
\ No newline at end of file
+@lru_cache()
+def get_settings() -> Settings:
+    return Settings()
+
+# import 시점에 .env를 읽지 않고 처음 사용할 때 읽음
+settings: Settings = Lazy(get_settings)  # type: ignore[assignment]
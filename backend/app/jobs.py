@@ -0,0 +1,276 @@
+import asyncio
+import json
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+QUEUED = 'queued'
+RUNNING = 'running'
+SUCCEEDED = 'succeeded'
+FAILED = 'failed'
+FINISHED = (SUCCEEDED, FAILED)
+
+
+class JobFailed(Exception):
+    """작업 처리기가 HTTP 상태 코드와 함께 실패를 알릴 때 사용합니다."""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class JobStore:
+    """작업 상태를 로컬 SQLite 파일에 저장해 서버가 재시작되어도 대기/진행 중인 작업을 이어서 처리합니다.
+
+    여러 프로세스가 같은 파일을 함께 쓸 수 있도록 진행 중인 작업에는 처리하는 프로세스(owner)와 임대 만료 시각을 기록합니다.
+    처리 중에는 renew_leases()로 임대를 연장하고, 임대가 만료된 작업만 다른 프로세스가 다시 대기열에 넣습니다.
+    """
+
+    def __init__(self, path: str, max_attempts: int, retention_seconds: float, lease_seconds: float = 30.0):
+        self.max_attempts = max_attempts
+        self.retention_seconds = retention_seconds
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=5, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS jobs ('
+            'id TEXT PRIMARY KEY, job_type TEXT NOT NULL, payload TEXT NOT NULL, status TEXT NOT NULL, '
+            'attempts INTEGER NOT NULL DEFAULT 0, completed_sections TEXT NOT NULL DEFAULT \'[]\', '
+            'result TEXT, error TEXT, created_at REAL NOT NULL, updated_at REAL NOT NULL, '
+            'owner TEXT, lease_expires_at REAL)'
+        )
+        # 임대 열이 없던 이전 버전의 작업 파일
+        columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(jobs)')}
+        for column, column_type in (('owner', 'TEXT'), ('lease_expires_at', 'REAL')):
+            if column not in columns:
+                self._conn.execute(f'ALTER TABLE jobs ADD COLUMN {column} {column_type}')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS jobs_status_created_at ON jobs (status, created_at)')
+        self._conn.commit()
+
+    def create(self, job_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO jobs (id, job_type, payload, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?)',
+                (job_id, job_type, json.dumps(payload, ensure_ascii=False), QUEUED, now, now)
+            )
+            # 보관 기간이 지난 완료 작업 정리
+            self._conn.execute(
+                f'DELETE FROM jobs WHERE status IN ({",".join("?" * len(FINISHED))}) AND updated_at < ?',
+                (*FINISHED, now - self.retention_seconds)
+            )
+            self._conn.commit()
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def claim_next(self) -> Optional[Dict[str, Any]]:
+        """임대가 만료된 작업을 대기열로 되돌린 뒤, 가장 오래된 대기 작업 하나를 이 프로세스 소유의 진행 중 작업으로 바꾸고 반환합니다."""
+        with self._lock:
+            # BEGIN IMMEDIATE로 같은 파일을 쓰는 다른 프로세스와 같은 작업을 중복으로 가져가지 않음
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                now = time.time()
+                self._requeue_expired(now)
+                row = self._conn.execute(
+                    'SELECT id FROM jobs WHERE status = ? ORDER BY created_at LIMIT 1', (QUEUED,)
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute(
+                        'UPDATE jobs SET status = ?, attempts = attempts + 1, owner = ?, lease_expires_at = ?, updated_at = ? WHERE id = ?',
+                        (RUNNING, self.owner, now + self.lease_seconds, now, row['id'])
+                    )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+        return self.get(row['id']) if row else None
+
+    def renew_leases(self) -> int:
+        """이 프로세스가 처리 중인 작업의 임대를 연장합니다."""
+        with self._lock:
+            renewed = self._conn.execute(
+                'UPDATE jobs SET lease_expires_at = ? WHERE status = ? AND owner = ?',
+                (time.time() + self.lease_seconds, RUNNING, self.owner)
+            ).rowcount
+            self._conn.commit()
+        return renewed
+
+    def release_leases(self) -> int:
+        """종료할 때 처리 중이던 작업을 임대 만료를 기다리지 않고 바로 대기열로 되돌립니다."""
+        with self._lock:
+            released = self._conn.execute(
+                'UPDATE jobs SET status = ?, owner = NULL, lease_expires_at = NULL, completed_sections = \'[]\', updated_at = ? '
+                'WHERE status = ? AND owner = ?',
+                (QUEUED, time.time(), RUNNING, self.owner)
+            ).rowcount
+            self._conn.commit()
+        return released
+
+    def add_completed_section(self, job_id: str, section: str) -> None:
+        job = self.get(job_id)
+        if job is None or section in job['completed_sections']:
+            return
+        self._update(job_id, completed_sections=json.dumps(job['completed_sections'] + [section], ensure_ascii=False))
+
+    def succeed(self, job_id: str, result: Dict[str, Any]) -> bool:
+        return self._finish(job_id, status=SUCCEEDED, result=json.dumps(result, ensure_ascii=False))
+
+    def fail(self, job_id: str, status_code: int, detail: str) -> bool:
+        return self._finish(job_id, status=FAILED, error=json.dumps({'status_code': status_code, 'detail': detail}, ensure_ascii=False))
+
+    def requeue_expired(self) -> int:
+        """임대가 만료된(처리하던 프로세스가 멈췄거나 종료된) 작업을 다시 대기열에 넣습니다. 재시도 횟수를 다 쓴 작업은 실패 처리합니다."""
+        with self._lock:
+            requeued = self._requeue_expired(time.time())
+            self._conn.commit()
+        return requeued
+
+    def _requeue_expired(self, now: float) -> int:
+        # 임대 열이 비어 있는 진행 중 작업은 이전 버전이 남긴 작업
+        expired = 'status = ? AND (lease_expires_at IS NULL OR lease_expires_at < ?)'
+        error = json.dumps({'status_code': 500, 'detail': '작업을 처리하던 서버가 응답하지 않아 재시도 횟수를 초과했습니다.'}, ensure_ascii=False)
+        self._conn.execute(
+            f'UPDATE jobs SET status = ?, error = ?, owner = NULL, lease_expires_at = NULL, updated_at = ? WHERE {expired} AND attempts >= ?',
+            (FAILED, error, now, RUNNING, now, self.max_attempts)
+        )
+        return self._conn.execute(
+            f'UPDATE jobs SET status = ?, owner = NULL, lease_expires_at = NULL, completed_sections = \'[]\', updated_at = ? WHERE {expired}',
+            (QUEUED, now, RUNNING, now)
+        ).rowcount
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute('SELECT status, COUNT(*) FROM jobs GROUP BY status').fetchall()
+        return {status: count for status, count in rows}
+
+    def _finish(self, job_id: str, **fields: Any) -> bool:
+        # 임대가 만료되어 다른 프로세스가 다시 가져간 작업의 결과로 덮어쓰지 않음
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        with self._lock:
+            updated = self._conn.execute(
+                f'UPDATE jobs SET {assignments}, owner = NULL, lease_expires_at = NULL, updated_at = ? '
+                'WHERE id = ? AND status = ? AND owner = ?',
+                (*fields.values(), time.time(), job_id, RUNNING, self.owner)
+            ).rowcount
+            self._conn.commit()
+        return bool(updated)
+
+    def _update(self, job_id: str, **fields: Any) -> None:
+        assignments = ', '.join(f'{name} = ?' for name in fields)
+        with self._lock:
+            self._conn.execute(
+                f'UPDATE jobs SET {assignments}, updated_at = ? WHERE id = ?',
+                (*fields.values(), time.time(), job_id)
+            )
+            self._conn.commit()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            'id': row['id'],
+            'job_type': row['job_type'],
+            'payload': json.loads(row['payload']),
+            'status': row['status'],
+            'attempts': row['attempts'],
+            'completed_sections': json.loads(row['completed_sections']),
+            'result': json.loads(row['result']) if row['result'] else None,
+            'error': json.loads(row['error']) if row['error'] else None,
+            'created_at': row['created_at'],
+            'updated_at': row['updated_at']
+        }
+
+
+# 처리기: (작업 id, 요청 payload) -> 결과 dict
+JobHandler = Callable[[str, Dict[str, Any]], Awaitable[Dict[str, Any]]]
+
+
+class JobWorkerPool:
+    """대기 작업을 꺼내 처리하는 백그라운드 작업자들. 새 작업이 들어오면 바로 깨우고, 그 외에는 주기적으로 확인합니다.
+
+    저장소 호출은 다른 프로세스의 잠금을 기다리는 동안(최대 5초) 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+    """
+
+    def __init__(self, store: JobStore, handlers: Dict[str, JobHandler], concurrency: int, poll_interval: float):
+        self.store = store
+        self.handlers = handlers
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self._wakeup = asyncio.Event()
+        self._workers: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        # 다른 프로세스가 처리 중인 작업은 건드리지 않고 임대가 만료된 작업만 되돌림
+        await asyncio.to_thread(self.store.requeue_expired)
+        if self.concurrency > 0:
+            self._workers = [asyncio.create_task(self._run()) for _ in range(self.concurrency)]
+            self._workers.append(asyncio.create_task(self._heartbeat()))
+
+    async def stop(self) -> None:
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # 처리 중이던 작업은 바로 대기열로 되돌려 다른 프로세스나 다음 시작 때 이어서 처리
+        await asyncio.to_thread(self.store.release_leases)
+
+    async def _heartbeat(self) -> None:
+        # 임대 시간의 1/3마다 연장해 한두 번 늦어져도 만료되지 않도록 함
+        while True:
+            await asyncio.sleep(self.store.lease_seconds / 3)
+            try:
+                await asyncio.to_thread(self.store.renew_leases)
+            except sqlite3.OperationalError:
+                # 다른 프로세스가 쓰는 중이라 잠긴 경우 다음 주기에 다시 시도
+                continue
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                job = await asyncio.to_thread(self.store.claim_next)
+            except sqlite3.OperationalError:
+                # 다른 프로세스가 쓰는 중이라 잠긴 경우 작업자를 끝내지 않고 확인 주기 뒤 다시 시도
+                job = None
+            if job is None:
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._process(job)
+
+    async def _process(self, job: Dict[str, Any]) -> None:
+        try:
+            result = await self.handlers[job['job_type']](job['id'], job['payload'])
+        except asyncio.CancelledError:
+            raise
+        except JobFailed as e:
+            await self._save(self.store.fail, job['id'], e.status_code, e.detail)
+        except Exception as e:
+            await self._save(self.store.fail, job['id'], 500, str(e))
+        else:
+            await self._save(self.store.succeed, job['id'], result)
+
+    async def _save(self, write: Callable[..., bool], *args: Any) -> bool:
+        # 결과 저장이 잠금 때문에 실패해도 작업 실패로 바꾸지 않고 확인 주기마다 다시 저장
+        while True:
+            try:
+                return await asyncio.to_thread(write, *args)
+            except sqlite3.OperationalError:
+                await asyncio.sleep(self.poll_interval)
@@ -0,0 +1,113 @@
+import re
+import unicodedata
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# 키워드 바로 뒤에 붙어도 같은 키워드로 인정하는 조사/어미 ("키워드를" → "키워드")
+PARTICLES = frozenset([
+    '이', '가', '은', '는', '을', '를', '의', '에', '에서', '에게', '께', '한테', '으로', '로',
+    '와', '과', '도', '만', '까지', '부터', '처럼', '보다', '이나', '나', '이랑', '랑', '하고',
+    '에는', '에서는', '으로는', '로는', '에도', '와의', '과의', '으로서', '로서', '으로써', '로써',
+    '이다', '입니다', '이며', '이고', '이라', '라', '이란', '란', '이라는', '라는', '이에요', '예요',
+    '들', '들이', '들은', '들을', '들의', '들도',
+])
+
+# 어절: 공백과 문장부호로 구분되는 글자/숫자 묶음
+TOKEN = re.compile(r'[^\W_]+')
+
+
+def normalize_text(text: str) -> str:
+    """NFC 정규화, 소문자 변환, 연속 공백을 한 칸으로 합친 검색용 버퍼를 만듭니다."""
+    return ' '.join(unicodedata.normalize('NFC', text).lower().split())
+
+
+class NormalizedText(NamedTuple):
+    buffer: str       # normalize_text와 같은 검색용 버퍼
+    token_count: int  # 공백/문장부호로 구분한 어절 수 (TOKEN 기준)
+
+
+@lru_cache(maxsize=64)
+def prepare_text(text: str) -> NormalizedText:
+    """검색용 버퍼와 어절 수를 한 번에 만듭니다.
+
+    같은 초안/섹션을 다시 채점하면(보정 계획, 보정 후 바뀌지 않은 섹션) 정규화 결과를 재사용합니다.
+    """
+    words = unicodedata.normalize('NFC', text).lower().split()
+    # 글자/숫자로만 된 어절(str.isalnum은 [^\W_]와 같음)은 하나로 세고, 문장부호가 섞인 어절만 정규식으로 나눠 셈
+    mixed = ' '.join(word for word in words if not word.isalnum())
+    token_count = sum(map(str.isalnum, words)) + sum(1 for _ in TOKEN.finditer(mixed))
+    return NormalizedText(' '.join(words), token_count)
+
+
+class KeywordMatches(NamedTuple):
+    counts: Dict[str, int]           # 정규화된 키워드별 등장 횟수
+    positions: Dict[str, List[int]]  # 정규화된 버퍼 기준 시작 위치
+    token_count: int                 # 공백/문장부호로 구분한 어절 수
+
+    def count(self, keyword: str) -> int:
+        return self.counts.get(normalize_text(keyword), 0)
+
+
+class KeywordMatcher:
+    """여러 키워드를 미리 컴파일한 정규식 하나로 정규화된 버퍼에서 한 번에 찾습니다.
+
+    키워드는 어절 시작에서만 인정하고, 끝은 어절 경계이거나 어절의 남은 부분이 조사일 때만 인정합니다.
+    """
+
+    def __init__(self, keywords: Sequence[str]):
+        self.keywords: List[str] = list(dict.fromkeys(k for k in map(normalize_text, keywords) if k))
+        self._pattern = self._compile() if self.keywords else None
+
+    def _compile(self) -> re.Pattern:
+        keywords = self.keywords
+        # 키워드 뒤에 조사가 붙거나 붙지 않은 채로 어절이 끝나야 인정
+        # 대부분 키워드 바로 뒤에서 어절이 끝나므로 조사 없는 경우를 먼저 확인(??)하고, 조사는 긴 것부터 시도
+        particles = '|'.join(re.escape(particle) for particle in sorted(PARTICLES, key=len, reverse=True))
+        ending = rf'(?:{particles})??(?![^\W_])'
+        # 키워드 첫 글자 집합으로 시작해야 정규식 엔진이 후보 위치로 바로 건너뜀 (전방탐색으로 시작하면 모든 위치를 시도)
+        first = '[' + ''.join(sorted({re.escape(keyword[0]) for keyword in keywords})) + ']'
+        # 긴 키워드부터 시도하는 그룹 하나씩: 첫 글자를 읽은 뒤 (?<=첫 글자)나머지 형태로 확인하고, lastindex로 어느 키워드인지 앎
+        order = sorted(range(len(keywords)), key=lambda index: len(keywords[index]), reverse=True)
+        alternatives = '|'.join(rf'((?<={re.escape(keywords[index][0])}){re.escape(keywords[index][1:])})' for index in order)
+        self._group_keywords = [-1] + order
+        # 같은 위치에서 겹치는 키워드("다이어트 방법" 안의 "다이어트")는 긴 키워드의 앞부분이므로 따로 셈
+        # 앞부분 바로 뒤가 공백/문장부호면 항상 인정하고, 글자가 이어지면 조사와 어절 경계를 버퍼에서 확인
+        self._prefixes: List[List[Tuple[int, Optional[re.Pattern]]]] = [
+            [
+                (index, re.compile(re.escape(prefix) + ending) if keyword[len(prefix)].isalnum() else None)
+                for index, prefix in enumerate(keywords)
+                if len(prefix) < len(keyword) and keyword.startswith(prefix)
+            ]
+            for keyword in keywords
+        ]
+        # (?<![^\W_].): 읽은 첫 글자 앞이 글자/숫자가 아니어야 어절 시작
+        return re.compile(rf'{first}(?<![^\W_].)(?=(?:{alternatives}){ending})')
+
+    def find(self, text: str) -> KeywordMatches:
+        buffer, token_count = prepare_text(text)
+        positions: List[List[int]] = [[] for _ in self.keywords]
+
+        if self._pattern is not None:
+            for match in self._pattern.finditer(buffer):
+                start = match.start()
+                index = self._group_keywords[match.lastindex]
+                positions[index].append(start)
+                for prefix_index, check in self._prefixes[index]:
+                    if check is None or check.match(buffer, start):
+                        positions[prefix_index].append(start)
+
+        return KeywordMatches(
+            counts={keyword: len(found) for keyword, found in zip(self.keywords, positions)},
+            positions=dict(zip(self.keywords, positions)),
+            token_count=token_count
+        )
+
+
+@lru_cache(maxsize=256)
+def _cached_matcher(keywords: Tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(keywords)
+
+
+def get_matcher(keywords: Sequence[str]) -> KeywordMatcher:
+    """같은 키워드 조합의 컴파일된 정규식을 재사용해 여러 초안을 적은 비용으로 채점할 수 있게 합니다."""
+    return _cached_matcher(tuple(keywords))
@@ -0,0 +1,37 @@
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+T = TypeVar('T')
+
+
+class Lazy(Generic[T]):
+    """처음 속성에 접근할 때 factory로 객체를 만들고, 이후에는 그 객체에 속성 접근을 넘기는 프록시.
+
+    서버리스 콜드 스타트에서 import만으로 설정 파일을 읽거나 클라이언트를 만들지 않도록 모듈 수준 싱글턴에 사용합니다.
+    감싼 객체의 속성(get, _lock 등)을 가리지 않도록 프록시 자신의 속성은 모두 _lazy_로 시작합니다.
+    """
+
+    def __init__(self, factory: Callable[[], T]):
+        object.__setattr__(self, '_lazy_factory', factory)
+        object.__setattr__(self, '_lazy_instance', None)
+        object.__setattr__(self, '_lazy_lock', threading.Lock())
+
+    def _lazy_resolve(self) -> T:
+        instance = self._lazy_instance
+        if instance is None:
+            with self._lazy_lock:
+                instance = self._lazy_instance
+                if instance is None:
+                    instance = self._lazy_factory()
+                    object.__setattr__(self, '_lazy_instance', instance)
+        return instance
+
+    @property
+    def _lazy_loaded(self) -> bool:
+        return self._lazy_instance is not None
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._lazy_resolve(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._lazy_resolve(), name, value)
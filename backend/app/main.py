@@ -1,12 +1,30 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from pydantic import BaseModel, ValidationError
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple, Type
+import asyncio
+import json
+import time
 from .config import settings
+from .batch import iter_batch
+from .jobs import FINISHED, JobFailed, JobStore, JobWorkerPool
+from .lazy import Lazy
+from .metrics import SEO_REJECTIONS, render_metrics
 from .models import (
-    ContentGenerationRequest, ContentGenerationResponse,
+    ContentGenerationRequest, ContentGenerationResponse, PipelineRequest,
     TitleGenerationRequest, TitleGenerationResponse,
-    KeywordRecommendationRequest, KeywordRecommendationResponse
+    KeywordRecommendationRequest, KeywordRecommendationResponse,
+    BatchItemError,
+    BatchTitleGenerationRequest, BatchTitleItemResult, BatchTitleGenerationResponse,
+    BatchKeywordRecommendationRequest, BatchKeywordItemResult, BatchKeywordRecommendationResponse,
+    BatchContentGenerationRequest, BatchContentItemResult, BatchContentGenerationResponse,
+    JobType, JobCreateRequest, JobResponse
+)
+from .services import (
+    gemini_service,
+    MIN_SEO_SCORE, MIN_KEYWORD_DENSITY, MIN_CHAR_COUNT, MAX_GENERATION_TIME
 )
-from .services import gemini_service
 
 app = FastAPI(
     title="AIMAX API",
@@ -31,6 +49,29 @@ async def root():
 async def health_check():
     return {"status": "healthy"}
 
+@app.get("/api/warm-up")
+async def warm_up():
+    """모델 클라이언트를 미리 준비합니다. 서버리스 환경에서 주기적으로 호출해 첫 요청의 지연을 줄일 수 있습니다."""
+    timings = await asyncio.to_thread(gemini_service.warm_up)
+    return {"status": "ready", "timings": {name: round(seconds, 6) for name, seconds in timings.items()}}
+
+@app.get("/api/stats")
+async def service_stats():
+    """캐시 적중률 등 서비스 상태 지표를 반환합니다."""
+    return {
+        "cache": gemini_service.cache.stats(),
+        "single_flight": gemini_service.single_flight.stats(),
+        "scheduler": gemini_service.scheduler.stats(),
+        "circuit_breaker": gemini_service.breaker.stats(),
+        "model_router": gemini_service.router.stats(),
+        "jobs": await asyncio.to_thread(job_store.stats)
+    }
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """단계별 소요 시간과 대체 응답/파싱 실패/SEO 거절/캐시 조회 횟수를 Prometheus 형식으로 반환합니다."""
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
 @app.post("/api/generate-title", response_model=TitleGenerationResponse)
 async def generate_title(request: TitleGenerationRequest):
     """키워드/주제를 기반으로 SEO 최적화된 제목을 생성합니다."""
@@ -49,40 +90,257 @@ async def recommend_keywords(request: KeywordRecommendationRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"키워드 추천 중 오류가 발생했습니다: {str(e)}")
 
+def _validate_content_result(result: ContentGenerationResponse) -> None:
+    # SEO 기준 검증
+    if result.seo_metrics.seo_score < MIN_SEO_SCORE:
+        SEO_REJECTIONS.inc(reason='seo_score')
+        raise HTTPException(
+            status_code=400, 
+            detail=f"SEO 점수가 기준({MIN_SEO_SCORE}점)에 미달합니다. 현재 점수: {result.seo_metrics.seo_score}점"
+        )
+
+    if result.seo_metrics.keyword_density < MIN_KEYWORD_DENSITY:
+        SEO_REJECTIONS.inc(reason='keyword_density')
+        raise HTTPException(
+            status_code=400,
+            detail=f"키워드 포함률이 기준({MIN_KEYWORD_DENSITY}%)에 미달합니다. 현재 포함률: {result.seo_metrics.keyword_density}%"
+        )
+
+    if result.total_char_count < MIN_CHAR_COUNT:
+        SEO_REJECTIONS.inc(reason='char_count')
+        raise HTTPException(
+            status_code=400,
+            detail=f"글자 수가 기준({MIN_CHAR_COUNT:,}자)에 미달합니다. 현재 글자 수: {result.total_char_count}자"
+        )
+
+    if result.generation_time > MAX_GENERATION_TIME:
+        SEO_REJECTIONS.inc(reason='generation_time')
+        raise HTTPException(
+            status_code=400,
+            detail=f"생성 시간이 기준({MAX_GENERATION_TIME}초)을 초과했습니다. 소요 시간: {result.generation_time:.1f}초"
+        )
+
+async def _generate_validated_content(request: ContentGenerationRequest) -> ContentGenerationResponse:
+    result = await gemini_service.generate_content(request)
+    _validate_content_result(result)
+    return result
+
+def _sse_event(event: str, data: str) -> str:
+    return f"event: {event}\ndata: {data}\n\n"
+
+def _sse_response(source: AsyncIterator[Tuple[str, BaseModel]]) -> StreamingResponse:
+    """(이벤트 이름, 결과) 스트림을 SSE로 전송합니다. complete 결과는 SEO 기준으로 검증하고, 오류는 error 이벤트로 보냅니다."""
+    async def event_stream():
+        try:
+            async for kind, payload in source:
+                if kind == 'complete':
+                    _validate_content_result(payload)
+                yield _sse_event(kind, payload.model_dump_json())
+        except HTTPException as e:
+            yield _sse_event('error', json.dumps({"status_code": e.status_code, "detail": e.detail}, ensure_ascii=False))
+        except Exception as e:
+            yield _sse_event('error', json.dumps({"status_code": 500, "detail": f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}"}, ensure_ascii=False))
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/generate-content", response_model=ContentGenerationResponse)
 async def generate_content(request: ContentGenerationRequest):
     """SEO 기준을 만족하는 블로그 글을 생성합니다."""
     try:
-        result = await gemini_service.generate_content(request)
-        
-        # SEO 기준 검증
-        if result.seo_metrics.seo_score < 80:
-            raise HTTPException(
-                status_code=400, 
-                detail=f"SEO 점수가 기준(80점)에 미달합니다. 현재 점수: {result.seo_metrics.seo_score}점"
-            )
-        
-        if result.seo_metrics.keyword_density < 2:
-            raise HTTPException(
-                status_code=400,
-                detail=f"키워드 포함률이 기준(2%)에 미달합니다. 현재 포함률: {result.seo_metrics.keyword_density}%"
-            )
-        
-        if result.total_char_count < 1000:
-            raise HTTPException(
-                status_code=400,
-                detail=f"글자 수가 기준(1,000자)에 미달합니다. 현재 글자 수: {result.total_char_count}자"
-            )
-        
-        if result.generation_time > 60:
-            raise HTTPException(
-                status_code=400,
-                detail=f"생성 시간이 기준(60초)을 초과했습니다. 소요 시간: {result.generation_time:.1f}초"
-            )
-        
-        return result
+        return await _generate_validated_content(request)
         
     except HTTPException:
         raise
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"콘텐츠 생성 중 오류가 발생했습니다: {str(e)}")
+
+@app.post("/api/generate-content/stream")
+async def generate_content_stream(request: ContentGenerationRequest):
+    """블로그 글을 섹션이 완성되는 대로 SSE(server-sent events)로 전송합니다."""
+    return _sse_response(gemini_service.stream_content(request))
+
+@app.post("/api/pipeline/stream")
+async def pipeline_stream(request: PipelineRequest):
+    """주제만으로 키워드 추천과 제목 생성을 동시에 실행하고 이어서 본문을 생성합니다.
+    
+    keywords, title 이벤트가 완료 순서대로 전송된 뒤 /api/generate-content/stream과 같은 section, complete 이벤트가 이어집니다.
+    """
+    return _sse_response(gemini_service.stream_pipeline(request))
+
+def _batch_item_result(result_type: Type[BaseModel], index: int, result: Any, error: Optional[Exception], error_prefix: str) -> BaseModel:
+    if error is None:
+        return result_type(index=index, result=result)
+    if isinstance(error, HTTPException):
+        return result_type(index=index, error=BatchItemError(status_code=error.status_code, detail=str(error.detail)))
+    return result_type(index=index, error=BatchItemError(status_code=500, detail=f"{error_prefix}: {str(error)}"))
+
+async def _run_batch(
+    items: List[BaseModel],
+    handler: Callable[[Any], Awaitable[Any]],
+    result_type: Type[BaseModel],
+    response_type: Type[BaseModel],
+    error_prefix: str,
+    stream: bool
+):
+    if len(items) > settings.batch_max_items:
+        raise HTTPException(
+            status_code=400,
+            detail=f"한 번에 요청할 수 있는 항목 수({settings.batch_max_items}개)를 초과했습니다. 요청 항목 수: {len(items)}개"
+        )
+    
+    start_time = time.time()
+    results = iter_batch(items, handler, settings.batch_max_concurrency)
+    
+    if stream:
+        # NDJSON: 완료되는 순서대로 한 줄씩 전송 (index로 요청 위치 확인)
+        async def ndjson_stream():
+            async for index, result, error in results:
+                yield _batch_item_result(result_type, index, result, error, error_prefix).model_dump_json() + "\n"
+        return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+    
+    collected = [
+        _batch_item_result(result_type, index, result, error, error_prefix)
+        async for index, result, error in results
+    ]
+    collected.sort(key=lambda item: item.index)
+    return response_type(results=collected, total_time=time.time() - start_time)
+
+@app.post("/api/batch/generate-title", response_model=BatchTitleGenerationResponse)
+async def batch_generate_title(request: BatchTitleGenerationRequest, stream: bool = False):
+    """여러 주제의 제목을 동시에 생성합니다. stream=true이면 NDJSON으로 완료 순서대로 전송합니다."""
+    return await _run_batch(
+        request.items, gemini_service.generate_seo_title,
+        BatchTitleItemResult, BatchTitleGenerationResponse,
+        "제목 생성 중 오류가 발생했습니다", stream
+    )
+
+@app.post("/api/batch/recommend-keywords", response_model=BatchKeywordRecommendationResponse)
+async def batch_recommend_keywords(request: BatchKeywordRecommendationRequest, stream: bool = False):
+    """여러 주제의 키워드를 동시에 추천합니다. stream=true이면 NDJSON으로 완료 순서대로 전송합니다."""
+    return await _run_batch(
+        request.items, gemini_service.recommend_keywords,
+        BatchKeywordItemResult, BatchKeywordRecommendationResponse,
+        "키워드 추천 중 오류가 발생했습니다", stream
+    )
+
+@app.post("/api/batch/generate-content", response_model=BatchContentGenerationResponse)
+async def batch_generate_content(request: BatchContentGenerationRequest, stream: bool = False):
+    """여러 블로그 글을 동시에 생성합니다. 항목별 SEO 기준 미달은 해당 항목의 error로 반환합니다."""
+    return await _run_batch(
+        request.items, _generate_validated_content,
+        BatchContentItemResult, BatchContentGenerationResponse,
+        "콘텐츠 생성 중 오류가 발생했습니다", stream
+    )
+
+async def _run_title_job(job_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    result = await gemini_service.generate_seo_title(TitleGenerationRequest(**payload))
+    return result.model_dump(mode="json")
+
+async def _run_keywords_job(job_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    result = await gemini_service.recommend_keywords(KeywordRecommendationRequest(**payload))
+    return result.model_dump(mode="json")
+
+async def _run_content_job(job_id: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    # 섹션이 완성될 때마다 진행 상황을 저장
+    async for kind, result in gemini_service.stream_content(ContentGenerationRequest(**payload)):
+        if kind == 'section':
+            await asyncio.to_thread(job_store.add_completed_section, job_id, result.section)
+            continue
+        try:
+            _validate_content_result(result)
+        except HTTPException as e:
+            raise JobFailed(e.status_code, e.detail)
+        return result.model_dump(mode="json")
+    raise JobFailed(500, "콘텐츠 생성 결과가 없습니다.")
+
+JOB_REQUEST_TYPES: Dict[JobType, Type[BaseModel]] = {
+    JobType.TITLE: TitleGenerationRequest,
+    JobType.KEYWORDS: KeywordRecommendationRequest,
+    JobType.CONTENT: ContentGenerationRequest
+}
+
+def _create_job_store() -> JobStore:
+    return JobStore(settings.job_store_path, settings.job_max_attempts, settings.job_retention_seconds, settings.job_lease_seconds)
+
+def _create_job_workers() -> JobWorkerPool:
+    return JobWorkerPool(
+        job_store,
+        {
+            JobType.TITLE.value: _run_title_job,
+            JobType.KEYWORDS.value: _run_keywords_job,
+            JobType.CONTENT.value: _run_content_job
+        },
+        settings.job_worker_concurrency,
+        settings.job_poll_interval_seconds
+    )
+
+# import 시점에는 설정을 읽거나 작업 저장소 파일을 열지 않음
+job_store: JobStore = Lazy(_create_job_store)  # type: ignore[assignment]
+job_workers: JobWorkerPool = Lazy(_create_job_workers)  # type: ignore[assignment]
+
+@app.on_event("startup")
+async def start_job_workers():
+    # 작업 저장소 파일을 열고 테이블을 준비하는 동안(다른 프로세스가 잠근 경우 대기 포함) 이벤트 루프를 막지 않도록 스레드에서 생성
+    await asyncio.to_thread(job_store._lazy_resolve)
+    await job_workers.start()
+
+@app.on_event("startup")
+async def warm_up_service():
+    if settings.warm_up_on_startup:
+        # SDK import가 이벤트 루프를 막지 않도록 별도 스레드에서 준비
+        await asyncio.to_thread(gemini_service.warm_up)
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    if job_workers._lazy_loaded:
+        await job_workers.stop()
+
+async def _get_job(job_id: str) -> JobResponse:
+    job = await asyncio.to_thread(job_store.get, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다.")
+    return JobResponse(**job)
+
+@app.post("/api/jobs", response_model=JobResponse, status_code=202)
+async def create_job(request: JobCreateRequest):
+    """생성 작업을 대기열에 넣고 작업 ID를 바로 반환합니다. 결과는 /api/jobs/{id}로 확인합니다."""
+    try:
+        payload = JOB_REQUEST_TYPES[request.job_type](**request.payload)
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    
+    job = await asyncio.to_thread(job_store.create, request.job_type.value, payload.model_dump(mode="json"))
+    job_workers.notify()
+    return JobResponse(**job)
+
+@app.get("/api/jobs/{job_id}", response_model=JobResponse)
+async def get_job(job_id: str):
+    """작업 상태, 완성된 섹션, 결과 또는 오류를 반환합니다."""
+    return await _get_job(job_id)
+
+@app.get("/api/jobs/{job_id}/events")
+async def job_events(job_id: str):
+    """작업 상태가 바뀔 때마다 상태 이름(queued, running, succeeded, failed)을 이벤트로 SSE 전송합니다."""
+    job = await _get_job(job_id)
+    
+    async def event_stream():
+        current = job
+        last_update = None
+        while True:
+            if current.updated_at != last_update:
+                last_update = current.updated_at
+                yield _sse_event(current.status.value, current.model_dump_json())
+            if current.status.value in FINISHED:
+                return
+            await asyncio.sleep(settings.job_poll_interval_seconds)
+            current = await _get_job(job_id)
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -0,0 +1,146 @@
+import bisect
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 모델 호출(수십 초)부터 파싱/지표 계산(밀리초 미만)까지 담을 수 있는 구간
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 20.0, 30.0, 60.0)
+
+
+def _format_labels(names: Sequence[str], values: Tuple[str, ...], extra: str = '') -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(tuple(str(labels[name]) for name in self.labelnames), 0)
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} counter']
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f'{self.name}{_format_labels(self.labelnames, key)} {value:g}')
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 라벨 조합별 [구간별 개수..., 합계, 전체 개수]
+        self._values: Dict[Tuple[str, ...], List[float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.setdefault(key, [0] * (len(self.buckets) + 2))
+            if index < len(self.buckets):
+                state[index] += 1
+            state[-2] += value
+            state[-1] += 1
+
+    def render(self) -> List[str]:
+        lines = [f'# HELP {self.name} {self.documentation}', f'# TYPE {self.name} histogram']
+        with self._lock:
+            for key, state in sorted(self._values.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets, state):
+                    cumulative += count
+                    labels = _format_labels(self.labelnames, key, 'le="%g"' % bound)
+                    lines.append(f'{self.name}_bucket{labels} {cumulative:g}')
+                labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+                lines.append(f'{self.name}_bucket{labels} {state[-1]:g}')
+                lines.append(f'{self.name}_sum{_format_labels(self.labelnames, key)} {state[-2]:g}')
+                lines.append(f'{self.name}_count{_format_labels(self.labelnames, key)} {state[-1]:g}')
+        return lines
+
+
+STAGE_SECONDS = Histogram(
+    'aimax_stage_duration_seconds', '생성 단계별 소요 시간 (prompt_build, model_call, parse, seo_metrics, outline, fallback)', ['stage']
+)
+FALLBACKS = Counter('aimax_fallbacks_total', '대체 응답 제공 횟수', ['operation', 'reason', 'source'])
+PARSE_FAILURES = Counter('aimax_parse_failures_total', '모델 응답에서 찾지 못해 기본 내용으로 채운 섹션 수', ['section'])
+SEO_REJECTIONS = Counter('aimax_seo_rejections_total', 'SEO 기준 미달로 거절한 응답 수', ['reason'])
+OUTPUT_PARSE = Counter(
+    'aimax_output_parse_total', '출력 형식(json, text)별 모델 응답 파싱 결과 (ok, repaired, partial, text_fallback, failed)', ['operation', 'mode', 'result']
+)
+CACHE_REQUESTS = Counter('aimax_cache_requests_total', '생성 결과 캐시 조회 수 (hit, miss, bypass)', ['operation', 'result'])
+
+REGISTRY = (STAGE_SECONDS, FALLBACKS, PARSE_FAILURES, OUTPUT_PARSE, SEO_REJECTIONS, CACHE_REQUESTS)
+
+
+def render_metrics() -> str:
+    """Prometheus 텍스트 형식(0.0.4)으로 모든 지표를 출력합니다."""
+    lines: List[str] = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return '\n'.join(lines) + '\n'
+
+
+# 요청별 단계 소요 시간을 모으는 dict (collect_timings 안에서만 설정됨)
+_request_timings: ContextVar[Optional[Dict[str, float]]] = ContextVar('aimax_request_timings', default=None)
+
+
+@contextmanager
+def collect_timings() -> Iterator[Dict[str, float]]:
+    """블록 안에서 기록된 단계별 소요 시간(초)을 단계 이름별로 합산해 담습니다. 병렬 섹션 생성은 각 호출 시간의 합입니다."""
+    timings: Dict[str, float] = {}
+    token = _request_timings.set(timings)
+    try:
+        yield timings
+    finally:
+        try:
+            _request_timings.reset(token)
+        except ValueError:
+            # 중단된 비동기 제너레이터가 다른 컨텍스트에서 정리될 때
+            pass
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        STAGE_SECONDS.observe(elapsed, stage=name)
+        timings = _request_timings.get()
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+
+
+def timed(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """동기 함수 전체를 하나의 단계로 기록하는 데코레이터"""
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with stage(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -1,17 +1,24 @@
 from pydantic import BaseModel, Field, validator
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from enum import Enum
 
 class ContentType(str, Enum):
     INFORMATIONAL = "informational"
     SALES = "sales"
 
+class GenerationMode(str, Enum):
+    SINGLE = "single"
+    FAN_OUT = "fan_out"
+
 class ContentGenerationRequest(BaseModel):
     topic: str = Field(..., min_length=1, max_length=500, description="키워드 또는 주제")
     title: str = Field(..., min_length=1, max_length=200, description="SEO 최적화된 제목")
     content_type: ContentType = Field(..., description="글의 성격 (정보성 또는 판매성)")
     primary_keyword: str = Field(..., min_length=1, max_length=100, description="핵심 키워드")
     sub_keywords: List[str] = Field(..., min_items=3, description="보조 키워드 (최소 3개)")
+    generation_mode: GenerationMode = Field(GenerationMode.SINGLE, description="생성 방식 (single: 한 번에 생성, fan_out: 목차 생성 후 섹션별 병렬 생성)")
+    bypass_cache: bool = Field(False, description="캐시된 결과 대신 새로 생성")
+    include_timings: bool = Field(False, description="응답에 단계별 소요 시간(timings) 포함")
     
     @validator('sub_keywords')
     def validate_sub_keywords(cls, v):
@@ -19,11 +26,21 @@ class ContentGenerationRequest(BaseModel):
             raise ValueError('보조 키워드는 최소 3개 이상 입력해야 합니다.')
         return [k.strip() for k in v if k.strip()]
 
+class PipelineRequest(BaseModel):
+    topic: str = Field(..., min_length=1, max_length=500, description="키워드 또는 주제")
+    content_type: ContentType = Field(..., description="글의 성격 (정보성 또는 판매성)")
+    generation_mode: GenerationMode = Field(GenerationMode.SINGLE, description="본문 생성 방식")
+    bypass_cache: bool = Field(False, description="캐시된 결과 대신 새로 생성")
+
 class ContentSections(BaseModel):
     introduction: str = Field(..., description="도입부")
     body: List[str] = Field(..., description="본문 섹션들")
     conclusion: str = Field(..., description="결론")
 
+class ContentSectionEvent(BaseModel):
+    section: str = Field(..., description="섹션 이름 (도입부, 본문N, 결론)")
+    content: str = Field(..., description="섹션 내용")
+
 class SEOMetrics(BaseModel):
     seo_score: int = Field(..., ge=0, le=100, description="SEO 점수 (0-100)")
     keyword_density: float = Field(..., ge=0, le=100, description="키워드 포함률 (%)")
@@ -37,17 +54,115 @@ class ContentGenerationResponse(BaseModel):
     seo_metrics: SEOMetrics = Field(..., description="SEO 지표")
     total_char_count: int = Field(..., description="총 글자 수")
     generation_time: float = Field(..., description="생성 소요 시간 (초)")
+    repair_rounds: int = Field(0, description="SEO 기준 보정을 위해 섹션을 재생성한 횟수")
+    is_fallback: bool = Field(False, description="모델 대신 대체 응답을 제공했는지 여부")
+    fallback_reason: Optional[str] = Field(None, description="대체 응답 사유 (not_configured, circuit_open, queue_timeout, timeout, upstream_error, missing_sections)")
+    model: Optional[str] = Field(None, description="응답을 생성한 모델 (시뮬레이션이면 없음)")
+    fallback_source: Optional[str] = Field(None, description="대체 응답 출처 (simulation, cache, partial)")
+    missing_sections: List[str] = Field(default_factory=list, description="생성하지 못해 기본 구조로 채운 섹션 (있으면 fallback_reason=missing_sections)")
+    timings: Optional[Dict[str, float]] = Field(None, description="단계별 소요 시간 (초, include_timings 요청 시)")
 
 class TitleGenerationRequest(BaseModel):
     topic: str = Field(..., min_length=1, max_length=500, description="키워드 또는 주제")
+    candidates: int = Field(1, ge=1, le=10, description="반환할 제목 후보 수 (점수순)")
+    exclude_titles: List[str] = Field(default_factory=list, description="이미 받은 제목 (다른 제목 요청 시 제외)")
+    bypass_cache: bool = Field(False, description="캐시된 결과 대신 새로 생성")
+    include_timings: bool = Field(False, description="응답에 단계별 소요 시간(timings) 포함")
+
+class TitleCandidate(BaseModel):
+    title: str = Field(..., description="제목 후보")
+    score: int = Field(..., ge=0, le=100, description="길이, 키워드 위치, 중복도 기준 점수")
 
 class TitleGenerationResponse(BaseModel):
     title: str = Field(..., description="생성된 SEO 제목")
+    candidates: List[TitleCandidate] = Field(default_factory=list, description="점수순 제목 후보 (title이 첫 번째)")
     generation_time: float = Field(..., description="생성 소요 시간 (초)")
+    is_fallback: bool = Field(False, description="모델 대신 대체 응답을 제공했는지 여부")
+    fallback_reason: Optional[str] = Field(None, description="대체 응답 사유 (not_configured, circuit_open, queue_timeout, timeout, upstream_error)")
+    model: Optional[str] = Field(None, description="응답을 생성한 모델 (시뮬레이션이면 없음)")
+    fallback_source: Optional[str] = Field(None, description="대체 응답 출처 (simulation, cache)")
+    timings: Optional[Dict[str, float]] = Field(None, description="단계별 소요 시간 (초, include_timings 요청 시)")
 
 class KeywordRecommendationRequest(BaseModel):
     topic: str = Field(..., min_length=1, max_length=500, description="주제")
+    bypass_cache: bool = Field(False, description="캐시된 결과 대신 새로 생성")
+    include_timings: bool = Field(False, description="응답에 단계별 소요 시간(timings) 포함")
 
 class KeywordRecommendationResponse(BaseModel):
     primary_keyword: str = Field(..., description="추천 핵심 키워드")
-    sub_keywords: List[str] = Field(..., description="추천 보조 키워드")
\ No newline at end of file
+    sub_keywords: List[str] = Field(..., description="추천 보조 키워드")
+    is_fallback: bool = Field(False, description="모델 대신 대체 응답을 제공했는지 여부")
+    fallback_reason: Optional[str] = Field(None, description="대체 응답 사유 (not_configured, circuit_open, queue_timeout, timeout, upstream_error)")
+    model: Optional[str] = Field(None, description="응답을 생성한 모델 (시뮬레이션이면 없음)")
+    fallback_source: Optional[str] = Field(None, description="대체 응답 출처 (simulation, cache)")
+    timings: Optional[Dict[str, float]] = Field(None, description="단계별 소요 시간 (초, include_timings 요청 시)")
+
+class BatchItemError(BaseModel):
+    status_code: int = Field(..., description="HTTP 상태 코드")
+    detail: str = Field(..., description="오류 내용")
+
+class BatchTitleGenerationRequest(BaseModel):
+    items: List[TitleGenerationRequest] = Field(..., min_items=1, description="제목 생성 요청 목록")
+
+class BatchTitleItemResult(BaseModel):
+    index: int = Field(..., description="요청 목록에서의 위치")
+    result: Optional[TitleGenerationResponse] = None
+    error: Optional[BatchItemError] = None
+
+class BatchTitleGenerationResponse(BaseModel):
+    results: List[BatchTitleItemResult] = Field(..., description="요청 순서대로 정렬된 결과")
+    total_time: float = Field(..., description="전체 소요 시간 (초)")
+
+class BatchKeywordRecommendationRequest(BaseModel):
+    items: List[KeywordRecommendationRequest] = Field(..., min_items=1, description="키워드 추천 요청 목록")
+
+class BatchKeywordItemResult(BaseModel):
+    index: int = Field(..., description="요청 목록에서의 위치")
+    result: Optional[KeywordRecommendationResponse] = None
+    error: Optional[BatchItemError] = None
+
+class BatchKeywordRecommendationResponse(BaseModel):
+    results: List[BatchKeywordItemResult] = Field(..., description="요청 순서대로 정렬된 결과")
+    total_time: float = Field(..., description="전체 소요 시간 (초)")
+
+class BatchContentGenerationRequest(BaseModel):
+    items: List[ContentGenerationRequest] = Field(..., min_items=1, description="콘텐츠 생성 요청 목록")
+
+class BatchContentItemResult(BaseModel):
+    index: int = Field(..., description="요청 목록에서의 위치")
+    result: Optional[ContentGenerationResponse] = None
+    error: Optional[BatchItemError] = None
+
+class BatchContentGenerationResponse(BaseModel):
+    results: List[BatchContentItemResult] = Field(..., description="요청 순서대로 정렬된 결과")
+    total_time: float = Field(..., description="전체 소요 시간 (초)")
+
+class JobType(str, Enum):
+    TITLE = "title"
+    KEYWORDS = "keywords"
+    CONTENT = "content"
+
+class JobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+class JobCreateRequest(BaseModel):
+    job_type: JobType = Field(JobType.CONTENT, description="작업 종류 (title, keywords, content)")
+    payload: Dict[str, Any] = Field(..., description="작업 종류에 맞는 생성 요청 (예: content이면 ContentGenerationRequest)")
+
+class JobError(BaseModel):
+    status_code: int = Field(..., description="동기 API였다면 반환했을 HTTP 상태 코드")
+    detail: str = Field(..., description="오류 내용")
+
+class JobResponse(BaseModel):
+    id: str = Field(..., description="작업 ID")
+    job_type: JobType
+    status: JobStatus
+    attempts: int = Field(0, description="처리 시도 횟수 (서버 재시작 시 증가)")
+    completed_sections: List[str] = Field(default_factory=list, description="완성된 섹션 이름 (content 작업)")
+    result: Optional[Dict[str, Any]] = Field(None, description="작업 종류에 맞는 생성 응답")
+    error: Optional[JobError] = None
+    created_at: float
+    updated_at: float
@@ -0,0 +1,91 @@
+import re
+from typing import Dict, List, Optional
+from .models import ContentSections, ContentSectionEvent
+
+INTRODUCTION = '도입부'
+BODY = '본문'
+CONCLUSION = '결론'
+
+# 줄 맨 앞에 단독으로 오는 마커만 섹션 구분자로 인정 (**[도입부]**, ## [본문1]: 같은 마크다운 장식 허용)
+MARKER_LINE = re.compile(r'^[#*\s]*\[(도입부|본문\s*(\d+)|결론)\][*\s:]*(.*)$')
+
+
+def section_names(body_count: int) -> List[str]:
+    return [INTRODUCTION] + [f'{BODY}{i + 1}' for i in range(body_count)] + [CONCLUSION]
+
+
+def build_content_sections(sections: Dict[str, str], fallback: ContentSections) -> ContentSections:
+    """누락된 섹션만 fallback의 같은 위치 섹션으로 채워 ContentSections를 만듭니다."""
+    body = [
+        sections.get(f'{BODY}{i + 1}', fallback_body)
+        for i, fallback_body in enumerate(fallback.body)
+    ]
+    # 가이드라인보다 많이 생성된 본문은 그대로 유지
+    numbered = sorted((int(name[len(BODY):]), content) for name, content in sections.items() if name.startswith(BODY))
+    extra = [content for number, content in numbered if number > len(fallback.body)]
+    return ContentSections(
+        introduction=sections.get(INTRODUCTION, fallback.introduction),
+        body=body + extra,
+        conclusion=sections.get(CONCLUSION, fallback.conclusion)
+    )
+
+
+class SectionStreamParser:
+    """[도입부]/[본문N]/[결론] 형식의 응답을 조각 단위로 받아 완성된 섹션을 내보내는 상태 기계
+
+    본문 중간의 대괄호는 마커로 취급하지 않으며, 다음 마커가 나오거나 close()가 호출될 때
+    직전 섹션이 완성된 것으로 봅니다.
+    """
+
+    def __init__(self):
+        self._pending_line = ""
+        self._current: Optional[str] = None
+        self._lines: List[str] = []
+        self.sections: Dict[str, str] = {}
+
+    def feed(self, chunk: str) -> List[ContentSectionEvent]:
+        if '\n' not in chunk:
+            self._pending_line += chunk
+            return []
+        
+        completed: List[ContentSectionEvent] = []
+        head, *lines = chunk.split('\n')
+        self._consume_line(self._pending_line + head, completed)
+        self._pending_line = lines.pop()
+        for line in lines:
+            self._consume_line(line, completed)
+        return completed
+
+    def close(self) -> List[ContentSectionEvent]:
+        completed: List[ContentSectionEvent] = []
+        if self._pending_line:
+            self._consume_line(self._pending_line, completed)
+            self._pending_line = ""
+        self._finish_section(completed)
+        return completed
+
+    def missing_sections(self, body_count: int) -> List[str]:
+        return [name for name in section_names(body_count) if name not in self.sections]
+
+    def _consume_line(self, line: str, completed: List[ContentSectionEvent]) -> None:
+        # 대부분의 줄은 '['로 시작하지 않으므로 정규식 검사 전에 걸러냄
+        marker = MARKER_LINE.match(line) if line.lstrip('#* \t').startswith('[') else None
+        if marker is None:
+            # 첫 마커 이전의 서두는 버림
+            if self._current is not None:
+                self._lines.append(line)
+            return
+        
+        self._finish_section(completed)
+        self._current = f'{BODY}{int(marker.group(2))}' if marker.group(2) else marker.group(1)
+        self._lines = [marker.group(3)] if marker.group(3) else []
+
+    def _finish_section(self, completed: List[ContentSectionEvent]) -> None:
+        if self._current is None:
+            return
+        content = '\n'.join(self._lines).strip()
+        if content:
+            self.sections[self._current] = content
+            completed.append(ContentSectionEvent(section=self._current, content=content))
+        self._current = None
+        self._lines = []
@@ -0,0 +1,46 @@
+import re
+from typing import Iterable, List
+
+# 문장 끝: 마침표/물음표/느낌표 또는 줄바꿈
+SENTENCE = re.compile(r'[^.!?。\n]+')
+# 문단 구분: 빈 줄
+PARAGRAPH_BREAK = re.compile(r'\n\s*\n')
+# 절을 잇는 연결 어미 뒤에 공백이나 쉼표가 오는 경우를 절 하나로 셈
+CLAUSE_ENDING = re.compile(r'(?:고|며|면서|지만|는데|은데|니까|어서|아서|여서|해서|므로|도록|거나|든지|으나)(?=[\s,])')
+
+# 한국어 블로그 글 기준값
+IDEAL_SENTENCE_LENGTH = 40     # 문장당 글자 수 (공백 제외)
+LONG_SENTENCE_LENGTH = 80
+IDEAL_CLAUSES_PER_SENTENCE = 1.5
+IDEAL_PARAGRAPH_LENGTH = 300   # 문단당 글자 수 (공백 제외)
+
+
+def score_readability(text: str) -> int:
+    """한글 글의 가독성 점수(0-100)를 계산합니다. 문장 길이, 절 밀도, 문단 길이를 선형 시간에 측정합니다."""
+    sentences = [length for length in (_char_count(s) for s in SENTENCE.findall(text)) if length > 1]
+    if not sentences:
+        return 0
+    
+    average_sentence = sum(sentences) / len(sentences)
+    long_ratio = sum(1 for length in sentences if length > LONG_SENTENCE_LENGTH) / len(sentences)
+    clauses_per_sentence = len(CLAUSE_ENDING.findall(text)) / len(sentences)
+    paragraphs = [length for length in (_char_count(p) for p in PARAGRAPH_BREAK.split(text)) if length]
+    average_paragraph = sum(paragraphs) / len(paragraphs)
+    
+    penalty = (
+        max(0.0, average_sentence - IDEAL_SENTENCE_LENGTH)
+        + long_ratio * 30
+        + max(0.0, clauses_per_sentence - IDEAL_CLAUSES_PER_SENTENCE) * 10
+        + max(0.0, average_paragraph - IDEAL_PARAGRAPH_LENGTH) / 20
+    )
+    return max(0, min(100, round(100 - penalty)))
+
+
+def score_many(texts: Iterable[str]) -> List[int]:
+    """여러 글(예: 같은 기사의 초안들)을 한 번에 채점합니다."""
+    return [score_readability(text) for text in texts]
+
+
+def _char_count(text: str) -> int:
+    # 문장/문단 안의 공백은 대부분 스페이스이므로 정규식 치환 대신 count 사용
+    return len(text) - text.count(' ') - text.count('\n') - text.count('\t')
@@ -0,0 +1,76 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+
+class CircuitOpenError(Exception):
+    """회로가 열려 있어 upstream 호출을 시도하지 않고 즉시 실패할 때 발생합니다."""
+
+
+class CircuitBreaker:
+    """연속 실패가 기준을 넘으면 일정 시간 호출을 차단하고, 이후 한 건의 시험 호출로 복구 여부를 확인합니다."""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int, recovery_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.recovery_seconds = recovery_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.rejected = 0
+        self._probe_in_flight = False
+
+    def allow(self) -> bool:
+        if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.recovery_seconds:
+            self.state = self.HALF_OPEN
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def reject_if_open(self) -> None:
+        """시험 호출 자리를 차지하지 않고 열린 회로만 확인합니다. 대기열에 들어가기 전에 사용합니다."""
+        if self.state == self.OPEN and time.monotonic() - self.opened_at < self.recovery_seconds:
+            self.rejected += 1
+            raise CircuitOpenError("Gemini 호출이 일시적으로 차단되었습니다.")
+
+    def record_success(self) -> None:
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+    @contextmanager
+    def guard(self) -> Iterator[None]:
+        if not self.allow():
+            raise CircuitOpenError("Gemini 호출이 일시적으로 차단되었습니다.")
+        try:
+            yield
+        except Exception:
+            self.record_failure()
+            raise
+        except BaseException:
+            # 취소된 시험 호출은 결과로 치지 않고 다음 호출이 다시 시험하도록 함
+            self._probe_in_flight = False
+            raise
+        else:
+            self.record_success()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'rejected': self.rejected,
+        }
@@ -0,0 +1,50 @@
+import time
+from typing import Dict, Optional, Tuple
+
+
+class ModelRouter:
+    """호출 종류(content, section, repair 등)별로 모델의 응답 시간 지수 이동 평균(EWMA)을 추적해,
+    기본 모델의 예상 시간이 남은 생성 시간 예산을 위협하면 빠른 모델을 고릅니다.
+
+    빠른 모델로 전환된 동안에는 기본 모델의 평균이 갱신되지 않으므로, probe_seconds마다 한 번씩
+    기본 모델을 다시 시도해 회복 여부를 확인합니다.
+    """
+
+    def __init__(self, alpha: float, budget_ratio: float, probe_seconds: float):
+        self.alpha = alpha
+        self.budget_ratio = budget_ratio
+        self.probe_seconds = probe_seconds
+        self._latency: Dict[Tuple[str, str], float] = {}
+        self._observed_at: Dict[Tuple[str, str], float] = {}
+        self.routed = 0
+        self.probes = 0
+
+    def observe(self, kind: str, model: str, seconds: float) -> None:
+        key = (kind, model)
+        previous = self._latency.get(key)
+        self._latency[key] = seconds if previous is None else self.alpha * seconds + (1 - self.alpha) * previous
+        self._observed_at[key] = time.monotonic()
+
+    def expected(self, kind: str, model: str) -> Optional[float]:
+        return self._latency.get((kind, model))
+
+    def choose(self, kind: str, primary: str, fast: str, remaining: float) -> str:
+        expected = self.expected(kind, primary)
+        if not fast or fast == primary or expected is None or expected <= remaining * self.budget_ratio:
+            return primary
+        fast_expected = self.expected(kind, fast)
+        if fast_expected is not None and fast_expected >= expected:
+            return primary
+        if time.monotonic() - self._observed_at[(kind, primary)] >= self.probe_seconds and expected < remaining:
+            # 예산 안에 끝날 가능성이 있을 때만 기본 모델 회복 여부 확인
+            self.probes += 1
+            return primary
+        self.routed += 1
+        return fast
+
+    def stats(self) -> Dict[str, object]:
+        return {
+            'expected_seconds': {f'{kind}:{model}': round(seconds, 3) for (kind, model), seconds in self._latency.items()},
+            'routed_to_fast': self.routed,
+            'probes': self.probes
+        }
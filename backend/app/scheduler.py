@@ -0,0 +1,145 @@
+import asyncio
+import heapq
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, Dict, List, Optional
+
+
+class QueueTimeoutError(asyncio.TimeoutError):
+    """호출 제한 시간 안에 할당량 대기열에서 차례가 오지 않아 upstream을 호출하지 못했을 때 발생합니다."""
+
+
+class Priority(IntEnum):
+    # 값이 작을수록 먼저 처리
+    INTERACTIVE = 0  # 제목/키워드처럼 짧은 대화형 호출
+    BULK = 1         # 본문 생성처럼 긴 작업
+
+
+class TokenBucket:
+    """분당 허용량만큼 연속적으로 채워지는 토큰 버킷. rate가 0이면 제한하지 않습니다."""
+
+    def __init__(self, rate_per_minute: float):
+        self.capacity = float(rate_per_minute)
+        self.rate = rate_per_minute / 60.0
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    def clamp(self, amount: float) -> float:
+        # 버킷 용량보다 큰 요청이 영원히 대기하지 않도록 제한
+        return min(amount, self.capacity) if self.rate else amount
+
+    def time_until(self, amount: float) -> float:
+        if not self.rate:
+            return 0.0
+        self._refill()
+        return max(0.0, (amount - self.tokens) / self.rate)
+
+    def consume(self, amount: float) -> None:
+        if self.rate:
+            self._refill()
+            self.tokens -= amount
+
+
+class QuotaScheduler:
+    """Gemini 분당 요청 수(RPM)/토큰 수(TPM) 한도와 동시 호출 수를 지키며 우선순위 순서로 호출을 허용합니다.
+
+    한도를 넘는 호출은 실패시키지 않고 대기열에 넣어 두었다가 할당량이 채워지면 진행합니다.
+    동시 호출 수 중 interactive_reserve개는 INTERACTIVE 호출 몫으로 남겨 두어, 긴 BULK 호출이 슬롯을 모두 차지해도
+    제목/키워드 호출은 기다리지 않습니다.
+    """
+
+    def __init__(self, max_concurrency: int, requests_per_minute: int, tokens_per_minute: int, interactive_reserve: int = 0):
+        self.max_concurrency = max_concurrency
+        # BULK 호출은 예약분을 뺀 만큼만 동시에 진행 (최소 1개)
+        self.bulk_concurrency = max(1, max_concurrency - interactive_reserve) if max_concurrency else 0
+        self._requests = TokenBucket(requests_per_minute)
+        self._tokens = TokenBucket(tokens_per_minute)
+        self._waiters: List[tuple] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._active = {priority: 0 for priority in Priority}
+        self._queued = {priority: 0 for priority in Priority}
+        self._admitted = {priority: 0 for priority in Priority}
+        self._wait_total = {priority: 0.0 for priority in Priority}
+        self._wait_max = {priority: 0.0 for priority in Priority}
+
+    async def acquire(self, priority: Priority, tokens: int) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), self._tokens.clamp(tokens), future, time.monotonic()))
+        self._queued[priority] += 1
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 허용 직후 취소된 경우 슬롯 반환
+                self.release(priority)
+            else:
+                self._queued[priority] -= 1
+            raise
+
+    def release(self, priority: Priority) -> None:
+        self._active[priority] -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._waiters:
+            priority, _, tokens, future, enqueued_at = self._waiters[0]
+            if future.done():
+                # 대기 중 취소된 호출
+                heapq.heappop(self._waiters)
+                continue
+            if self.max_concurrency and sum(self._active.values()) >= self.max_concurrency:
+                return
+            if priority == Priority.BULK and self.bulk_concurrency and self._active[Priority.BULK] >= self.bulk_concurrency:
+                # 맨 앞이 BULK면 대기 중인 INTERACTIVE 호출이 없으므로 예약분을 남기고 대기
+                return
+            wait = max(self._requests.time_until(1), self._tokens.time_until(tokens))
+            if wait > 0:
+                # 우선순위가 가장 높은 호출이 할당량을 기다리는 동안 뒤의 호출도 대기
+                self._schedule_retry(wait)
+                return
+
+            heapq.heappop(self._waiters)
+            self._requests.consume(1)
+            self._tokens.consume(tokens)
+            self._active[priority] += 1
+            waited = time.monotonic() - enqueued_at
+            self._queued[priority] -= 1
+            self._admitted[priority] += 1
+            self._wait_total[priority] += waited
+            self._wait_max[priority] = max(self._wait_max[priority], waited)
+            future.set_result(None)
+
+    def _schedule_retry(self, wait: float) -> None:
+        if self._timer is not None and not self._timer.cancelled():
+            return
+        
+        def retry() -> None:
+            self._timer = None
+            self._dispatch()
+        
+        self._timer = asyncio.get_running_loop().call_later(wait, retry)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            'active': sum(self._active.values()),
+            'bulk_concurrency': self.bulk_concurrency,
+            'queue_depth': sum(self._queued.values()),
+            'priorities': {
+                priority.name.lower(): {
+                    'active': self._active[priority],
+                    'queued': self._queued[priority],
+                    'admitted': self._admitted[priority],
+                    'avg_wait_seconds': round(self._wait_total[priority] / self._admitted[priority], 4) if self._admitted[priority] else 0.0,
+                    'max_wait_seconds': round(self._wait_max[priority], 4),
+                }
+                for priority in Priority
+            },
+        }
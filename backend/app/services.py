@@ -1,38 +1,371 @@
-import google.generativeai as genai
-import textstat
-import re
+import asyncio
+import threading
 import time
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, AsyncIterator, Awaitable, Callable, Optional, Set, Tuple, Type
+from pydantic import BaseModel
 from .config import settings
+from .lazy import Lazy
+from .cache import create_cache, make_cache_key
+from .singleflight import SingleFlight
+from .scheduler import Priority, QueueTimeoutError, QuotaScheduler
+from .resilience import CircuitBreaker, CircuitOpenError
+from .routing import ModelRouter
+from .keywords import get_matcher, normalize_text
+from .readability import score_readability
+from .titles import clean_title, rank_titles
+from .metrics import CACHE_REQUESTS, FALLBACKS, OUTPUT_PARSE, PARSE_FAILURES, collect_timings, stage, timed
+from .structured import load_json_object, named_sections_from_json, parse_model
+from .parser import SectionStreamParser, INTRODUCTION, BODY, CONCLUSION, section_names, build_content_sections
 from .models import (
-    ContentGenerationRequest, ContentGenerationResponse, 
-    ContentSections, SEOMetrics,
-    TitleGenerationRequest, TitleGenerationResponse,
+    ContentGenerationRequest, ContentGenerationResponse, GenerationMode,
+    ContentSections, ContentSectionEvent, SEOMetrics, PipelineRequest,
+    TitleGenerationRequest, TitleGenerationResponse, TitleCandidate,
     KeywordRecommendationRequest, KeywordRecommendationResponse
 )
 
+# 콘텐츠 품질 기준 (API 응답 검증과 보정 단계에서 공통 사용)
+MIN_SEO_SCORE = 80
+MIN_KEYWORD_DENSITY = 2
+MAX_KEYWORD_DENSITY = 5
+MIN_CHAR_COUNT = 1000
+MIN_READABILITY_SCORE = 70
+MAX_GENERATION_TIME = 60
+
+# 프롬프트를 수정하면 올려서 이전 프롬프트로 만든 캐시를 무효화
+PROMPT_VERSION = "2"
+
+# 할당량 계산용 예상 출력 토큰 수
+TITLE_OUTPUT_TOKENS = 100
+KEYWORD_OUTPUT_TOKENS = 100
+CONTENT_OUTPUT_TOKENS = 4000
+SECTION_OUTPUT_TOKENS = 1000
+
+def _supports_json_mime_type(genai: Any) -> bool:
+    # response_mime_type은 google-generativeai 0.5 이후 GenerationConfig에서 지원
+    return 'response_mime_type' in getattr(genai.types.GenerationConfig, '__dataclass_fields__', {})
+
+def _until(deadline: float) -> float:
+    return max(0.0, deadline - time.monotonic())
+
 class GeminiService:
     def __init__(self):
-        if settings.gemini_api_key:
+        # google.generativeai는 import에만 1초 가까이 걸리므로 첫 모델 호출(또는 warm_up) 때 준비
+        self._model_factory: Optional[Callable[[str], Any]] = None
+        self._client_lock = threading.Lock()
+        self._models: Dict[str, Any] = {}
+        # JSON 출력 모드: SDK가 지원하면 응답 형식을 JSON으로 강제하고, 아니면 프롬프트로만 요청
+        self.json_output = settings.gemini_output_mode == 'json'
+        self._json_generation_config: Optional[Dict[str, str]] = None
+        # 이벤트 루프를 막지 않도록 비동기 호출을 사용하고, 동시 호출 수와 분당 할당량을 지키며 우선순위대로 호출
+        self.scheduler = QuotaScheduler(
+            settings.gemini_max_concurrency,
+            settings.gemini_requests_per_minute,
+            settings.gemini_tokens_per_minute,
+            settings.gemini_interactive_reserved_slots
+        )
+        self.cache = create_cache(
+            settings.cache_backend, settings.cache_ttl_seconds,
+            settings.cache_max_entries, settings.cache_sqlite_path
+        )
+        self.single_flight = SingleFlight()
+        self.breaker = CircuitBreaker(settings.circuit_failure_threshold, settings.circuit_recovery_seconds)
+        # 본문 생성이 시간 예산을 넘길 것 같으면 빠른 모델로 전환
+        self.router = ModelRouter(settings.routing_latency_alpha, settings.routing_budget_ratio, settings.routing_probe_seconds)
+    
+    @property
+    def model_factory(self) -> Optional[Callable[[str], Any]]:
+        if self._model_factory is None and settings.gemini_api_key:
+            self._init_client()
+        return self._model_factory
+    
+    @model_factory.setter
+    def model_factory(self, factory: Optional[Callable[[str], Any]]) -> None:
+        self._model_factory = factory
+    
+    def _init_client(self) -> None:
+        with self._client_lock:
+            if self._model_factory is not None:
+                return
+            import google.generativeai as genai
             genai.configure(api_key=settings.gemini_api_key)
-            self.model = genai.GenerativeModel(settings.gemini_model)
-        else:
-            self.model = None
+            self._json_generation_config = {'response_mime_type': 'application/json'} if _supports_json_mime_type(genai) else None
+            self._model_factory = genai.GenerativeModel
     
     def _is_configured(self) -> bool:
-        return self.model is not None
+        # 클라이언트를 만들지 않고 판단 (API 키가 없으면 시뮬레이션 응답)
+        return self._model_factory is not None or bool(settings.gemini_api_key)
+    
+    def warm_up(self) -> Dict[str, float]:
+        """모델 클라이언트와 기본 모델을 미리 준비하고 단계별 소요 시간(초)을 반환합니다. 모델은 호출하지 않습니다."""
+        timings = {}
+        started = time.perf_counter()
+        if self._is_configured():
+            for name in {settings.gemini_model, settings.gemini_fast_model}:
+                self._model(name)
+        timings['model_client'] = time.perf_counter() - started
+        started = time.perf_counter()
+        # 첫 요청의 키워드/가독성 분석에 쓰이는 정규식과 매처 준비
+        get_matcher([])
+        score_readability('준비. 완료.')
+        timings['analyzers'] = time.perf_counter() - started
+        return timings
+    
+    def _model(self, name: str) -> Any:
+        if name not in self._models:
+            self._models[name] = self.model_factory(name)
+        return self._models[name]
+    
+    async def _model_async(self, name: str) -> Any:
+        if self._model_factory is None and settings.gemini_api_key:
+            # 첫 호출의 SDK import(수백 ms)가 다른 요청과 헬스체크를 막지 않도록 별도 스레드에서 준비 (_client_lock으로 한 번만)
+            await asyncio.to_thread(self._init_client)
+        return self._model(name)
+    
+    def _route(self, kind: str, start_time: float) -> str:
+        """본문 계열 호출(content, section, repair)에 사용할 모델을 남은 생성 시간 예산에 따라 고릅니다."""
+        remaining = start_time + MAX_GENERATION_TIME - time.time()
+        return self.router.choose(kind, settings.gemini_model, settings.gemini_fast_model, remaining)
+    
+    def _cache_key(self, namespace: str, request: BaseModel, model: str, exclude: Tuple[str, ...] = ()) -> str:
+        fields = request.model_dump(mode='json', exclude={'bypass_cache', 'include_timings', *exclude})
+        return make_cache_key(namespace, fields, model, PROMPT_VERSION)
+    
+    def _get_cached(self, cache_key: str, request: BaseModel) -> Optional[Dict[str, Any]]:
+        operation = cache_key.split(':', 1)[0]
+        if request.bypass_cache:
+            CACHE_REQUESTS.inc(operation=operation, result='bypass')
+            return None
+        cached = self.cache.get(cache_key)
+        CACHE_REQUESTS.inc(operation=operation, result='miss' if cached is None else 'hit')
+        return cached
+    
+    def _attach_timings(self, request: BaseModel, response: Any, timings: Dict[str, float]) -> Any:
+        if not request.include_timings:
+            return response
+        # 단일 호출로 합쳐진 요청들이 같은 응답 객체를 공유하므로 복사본에 설정
+        return response.model_copy(update={'timings': {name: round(seconds, 6) for name, seconds in timings.items()}})
+    
+    async def _coalesce(self, cache_key: str, request: BaseModel, create: Callable[[], Awaitable[Any]]) -> Any:
+        # 같은 요청이 동시에 들어오면 upstream 호출 하나의 결과를 공유 (새 결과를 원하는 요청은 제외)
+        if request.bypass_cache:
+            return await create()
+        return await self.single_flight.do(cache_key, create)
+    
+    def _estimate_tokens(self, prompt: str, output_tokens: int) -> int:
+        # 한국어는 대략 2글자당 1토큰으로 계산
+        return len(prompt) // 2 + output_tokens
+    
+    async def _generate(self, prompt: str, priority: Priority, output_tokens: int, timeout: float, model: str, kind: str, json_output: bool = False) -> str:
+        # 제한 시간은 대기열 대기와 모델 응답을 합친 시간, 회로 차단기는 모델 응답만으로 판단
+        with stage('model_call'):
+            response = await self._call_model(prompt, priority, output_tokens, timeout, model, kind, json_output)
+        return response.text.strip()
+    
+    async def _acquire_slot(self, priority: Priority, tokens: int, deadline: float) -> None:
+        # 회로가 열려 있으면 대기열에 들어가지 않고 즉시 실패
+        self.breaker.reject_if_open()
+        try:
+            await asyncio.wait_for(self.scheduler.acquire(priority, tokens), _until(deadline))
+        except asyncio.TimeoutError:
+            # 로컬 할당량 대기는 upstream 실패가 아니므로 회로 차단기에 기록하지 않음
+            raise QueueTimeoutError("할당량 대기열에서 제한 시간 안에 차례가 오지 않았습니다.") from None
+        if _until(deadline) <= 0:
+            self.scheduler.release(priority)
+            raise QueueTimeoutError("할당량 대기열에서 제한 시간을 모두 사용했습니다.")
+    
+    async def _call_model(self, prompt: str, priority: Priority, output_tokens: int, timeout: float, model: str, kind: str, json_output: bool = False) -> Any:
+        deadline = time.monotonic() + timeout
+        # 클라이언트를 먼저 준비해야 JSON 출력 지원 여부를 알 수 있음
+        client = await self._model_async(model)
+        options = {}
+        if json_output and self._json_generation_config:
+            options['generation_config'] = self._json_generation_config
+        await self._acquire_slot(priority, self._estimate_tokens(prompt, output_tokens), deadline)
+        try:
+            with self.breaker.guard():
+                # 대기열 대기를 뺀 모델 응답 시간만 기록 (제한 시간으로 취소된 경우 그때까지의 시간)
+                started = time.time()
+                try:
+                    response = await asyncio.wait_for(client.generate_content_async(prompt, **options), _until(deadline))
+                except (asyncio.CancelledError, asyncio.TimeoutError):
+                    self.router.observe(kind, model, time.time() - started)
+                    raise
+                self.router.observe(kind, model, time.time() - started)
+                return response
+        finally:
+            self.scheduler.release(priority)
+    
+    async def _generate_stream(self, prompt: str, model: str, timeout: float) -> AsyncIterator[str]:
+        deadline = time.monotonic() + timeout
+        client = await self._model_async(model)
+        # 스트리밍 중 청크를 처리하는 시간(섹션 파싱)도 model_call에 포함됨
+        with stage('model_call'):
+            await self._acquire_slot(Priority.BULK, self._estimate_tokens(prompt, CONTENT_OUTPUT_TOKENS), deadline)
+            try:
+                with self.breaker.guard():
+                    started = time.time()
+                    try:
+                        response = await asyncio.wait_for(client.generate_content_async(prompt, stream=True), _until(deadline))
+                        chunks = response.__aiter__()
+                        while True:
+                            # 응답이 멈춘 스트림이 요청을 붙잡지 않도록 청크마다 남은 시간만큼만 대기
+                            try:
+                                chunk = await asyncio.wait_for(chunks.__anext__(), _until(deadline))
+                            except StopAsyncIteration:
+                                break
+                            yield chunk.text
+                    except asyncio.TimeoutError:
+                        self.router.observe('content', model, time.time() - started)
+                        raise
+                    self.router.observe('content', model, time.time() - started)
+            finally:
+                self.scheduler.release(Priority.BULK)
+    
+    def _remaining_budget(self, start_time: float, timeout: float) -> float:
+        # 전체 생성 시간 기준(MAX_GENERATION_TIME)을 넘지 않도록 남은 시간으로 제한
+        return min(timeout, start_time + MAX_GENERATION_TIME - time.time())
+    
+    def _fallback_reason(self, error: Exception) -> str:
+        if isinstance(error, CircuitOpenError):
+            return 'circuit_open'
+        if isinstance(error, QueueTimeoutError):
+            return 'queue_timeout'
+        if isinstance(error, asyncio.TimeoutError):
+            return 'timeout'
+        return 'upstream_error'
+    
+    @timed('fallback')
+    def _cached_fallback(self, cache_key: str, response_type: Type[BaseModel], reason: str, **overrides: Any) -> Optional[Any]:
+        # 장애 시 만료된 캐시라도 있으면 시뮬레이션 결과보다 우선 제공
+        cached = self.cache.get(cache_key, allow_stale=True)
+        if cached is None:
+            return None
+        FALLBACKS.inc(operation=cache_key.split(':', 1)[0], reason=reason, source='cache')
+        return response_type(**{**cached, **overrides, 'is_fallback': True, 'fallback_reason': reason, 'fallback_source': 'cache'})
+    
+    @timed('fallback')
+    def _simulate_title(self, request: TitleGenerationRequest, start_time: float, reason: str) -> TitleGenerationResponse:
+        FALLBACKS.inc(operation='title', reason=reason, source='simulation')
+        title = f"{request.topic}에 대한 완벽 가이드: 전문가가 알려주는 핵심 포인트"
+        generation_time = time.time() - start_time
+        return TitleGenerationResponse(
+            title=title, candidates=[TitleCandidate(title=title, score=rank_titles([title], request.topic)[0][1])],
+            generation_time=generation_time, is_fallback=True, fallback_reason=reason, fallback_source='simulation'
+        )
+    
+    @timed('fallback')
+    def _simulate_keywords(self, request: KeywordRecommendationRequest, reason: str) -> KeywordRecommendationResponse:
+        FALLBACKS.inc(operation='keywords', reason=reason, source='simulation')
+        return KeywordRecommendationResponse(
+            primary_keyword=request.topic,
+            sub_keywords=[f"{request.topic} 방법", f"{request.topic} 효과", f"{request.topic} 추천"],
+            is_fallback=True, fallback_reason=reason, fallback_source='simulation'
+        )
     
     async def generate_seo_title(self, request: TitleGenerationRequest) -> TitleGenerationResponse:
+        with collect_timings() as timings:
+            response = await self._resolve_seo_title(request)
+        return self._attach_timings(request, response, timings)
+    
+    async def _resolve_seo_title(self, request: TitleGenerationRequest) -> TitleGenerationResponse:
         start_time = time.time()
         
         if not self._is_configured():
             # 시뮬레이션 모드 (API 키가 없을 때)
-            title = f"{request.topic}에 대한 완벽 가이드: 전문가가 알려주는 핵심 포인트"
-            generation_time = time.time() - start_time
-            return TitleGenerationResponse(title=title, generation_time=generation_time)
+            return self._simulate_title(request, start_time, 'not_configured')
+        
+        # 후보 수와 제외 목록이 달라도 같은 주제면 같은 후보 목록(pool)을 공유
+        cache_key = self._cache_key('titles', request, settings.gemini_title_model, exclude=('candidates', 'exclude_titles'))
+        excluded = {normalize_text(title) for title in request.exclude_titles}
+        cached = self._get_cached(cache_key, request)
+        if cached is not None:
+            response = self._title_response(cached, request, excluded, start_time)
+            if response is not None:
+                return response
+        
+        # 남은 후보가 없으면 이미 받은 제목을 피해서 새 후보 생성
+        flight_key = '|'.join([cache_key, *sorted(excluded)])
+        try:
+            pool = await self._coalesce(flight_key, request, lambda: self._create_title_pool(request, cache_key, excluded, cached))
+        except Exception as e:
+            # API 오류 시 만료된 후보 목록 또는 시뮬레이션으로 폴백
+            reason = self._fallback_reason(e)
+            return self._cached_title_fallback(cache_key, request, excluded, start_time, reason) or self._simulate_title(request, start_time, reason)
+        # 모델이 제외한 제목만 다시 내놓았다면 중복이라도 점수순으로 제공
+        return self._title_response(pool, request, excluded, start_time) or self._title_response(pool, request, set(), start_time)
+    
+    async def recommend_keywords(self, request: KeywordRecommendationRequest) -> KeywordRecommendationResponse:
+        with collect_timings() as timings:
+            response = await self._resolve_keywords(request)
+        return self._attach_timings(request, response, timings)
+    
+    async def _resolve_keywords(self, request: KeywordRecommendationRequest) -> KeywordRecommendationResponse:
+        if not self._is_configured():
+            # 시뮬레이션 모드
+            return self._simulate_keywords(request, 'not_configured')
+        
+        cache_key = self._cache_key('keywords', request, settings.gemini_keyword_model)
+        cached = self._get_cached(cache_key, request)
+        if cached is not None:
+            return KeywordRecommendationResponse(**cached)
+        
+        return await self._coalesce(cache_key, request, lambda: self._create_keywords(request, cache_key))
+    
+    async def generate_content(self, request: ContentGenerationRequest) -> ContentGenerationResponse:
+        with collect_timings() as timings:
+            response = await self._resolve_content(request)
+        return self._attach_timings(request, response, timings)
+    
+    async def _resolve_content(self, request: ContentGenerationRequest) -> ContentGenerationResponse:
+        start_time = time.time()
+        
+        # 컨텐츠 타입별 가이드라인
+        guidelines = self._get_content_guidelines(request.content_type.value)
         
-        prompt = f"""
-        다음 주제에 대해 SEO에 최적화된 블로그 제목을 생성해주세요:
+        if not self._is_configured():
+            # 시뮬레이션 모드
+            return self._generate_simulated_content(request, guidelines, start_time, 'not_configured')
+        
+        cache_key = self._cache_key('content', request, settings.gemini_model)
+        cached = self._get_cached(cache_key, request)
+        if cached is not None:
+            return ContentGenerationResponse(**{**cached, 'generation_time': time.time() - start_time})
+        
+        return await self._coalesce(cache_key, request, lambda: self._create_content(request, guidelines, cache_key, start_time))
+    
+    async def _create_title_pool(
+        self, request: TitleGenerationRequest, cache_key: str, excluded: Set[str], previous: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        count = max(request.candidates, settings.title_pool_size)
+        text = await self._generate(
+            self._build_title_prompt(request, count), Priority.INTERACTIVE, TITLE_OUTPUT_TOKENS * count,
+            settings.gemini_interactive_timeout_seconds, settings.gemini_title_model, 'title', json_output=self.json_output
+        )
+        titles = self._parse_titles(text)
+        if not titles:
+            raise ValueError('제목 후보를 찾지 못했습니다')
+        if previous is not None:
+            titles += [candidate['title'] for candidate in previous['candidates']]
+        pool = {
+            'candidates': [{'title': title, 'score': score} for title, score in rank_titles(titles, request.topic)],
+            'model': settings.gemini_title_model
+        }
+        self.cache.set(cache_key, pool)
+        return pool
+    
+    @timed('prompt_build')
+    def _build_title_prompt(self, request: TitleGenerationRequest, count: int) -> str:
+        if self.json_output:
+            output_format = '다음 JSON 형식으로만 출력해주세요: {"titles": ["제목1", "제목2"]}'
+        else:
+            output_format = '각 제목을 한 줄에 하나씩, 번호 없이 제목만 출력해주세요.'
+        avoid = ''
+        if request.exclude_titles:
+            listed = '\n'.join(f'- {title}' for title in request.exclude_titles)
+            avoid = f"\n        다음 제목과 겹치지 않는 새로운 제목을 만들어주세요:\n{listed}\n"
+        return f"""
+        다음 주제에 대해 SEO에 최적화된 블로그 제목을 서로 다른 표현으로 {count}개 생성해주세요:
         주제: {request.topic}
         
         요구사항:
@@ -41,34 +374,71 @@ class GeminiService:
         3. 클릭을 유도하는 매력적인 표현 사용
         4. 검색 의도를 반영한 제목
         5. 한국어로 작성
-        
-        제목만 출력해주세요.
+        {avoid}
+        {output_format}
         """
-        
-        try:
-            response = self.model.generate_content(prompt)
-            title = response.text.strip()
-            generation_time = time.time() - start_time
-            
-            return TitleGenerationResponse(
-                title=title,
-                generation_time=generation_time
-            )
-        except Exception as e:
-            # API 오류 시 시뮬레이션으로 폴백
-            title = f"{request.topic}에 대한 완벽 가이드: 전문가가 알려주는 핵심 포인트"
-            generation_time = time.time() - start_time
-            return TitleGenerationResponse(title=title, generation_time=generation_time)
     
-    async def recommend_keywords(self, request: KeywordRecommendationRequest) -> KeywordRecommendationResponse:
-        if not self._is_configured():
-            # 시뮬레이션 모드
-            return KeywordRecommendationResponse(
-                primary_keyword=request.topic,
-                sub_keywords=[f"{request.topic} 방법", f"{request.topic} 효과", f"{request.topic} 추천"]
-            )
+    @timed('parse')
+    def _parse_titles(self, text: str) -> List[str]:
+        mode = 'json' if self.json_output else 'text'
+        if self.json_output:
+            data, repaired = load_json_object(text)
+            titles = data.get('titles') if data is not None else None
+            if isinstance(titles, list):
+                titles = [clean_title(title) for title in titles if isinstance(title, str)]
+                if any(titles):
+                    OUTPUT_PARSE.inc(operation='title', mode=mode, result='repaired' if repaired else 'ok')
+                    return [title for title in titles if title]
+        # 텍스트 모드이거나 JSON이 아니면 한 줄에 하나씩
+        titles = [title for title in (clean_title(line) for line in text.splitlines()) if title and title not in ('{', '}', '[', ']')]
+        if titles:
+            OUTPUT_PARSE.inc(operation='title', mode=mode, result='text_fallback' if self.json_output else 'ok')
+        else:
+            OUTPUT_PARSE.inc(operation='title', mode=mode, result='failed')
+        return titles
+    
+    def _title_response(
+        self, pool: Dict[str, Any], request: TitleGenerationRequest, excluded: Set[str], start_time: float, **overrides: Any
+    ) -> Optional[TitleGenerationResponse]:
+        candidates = [
+            TitleCandidate(**candidate) for candidate in pool['candidates'] if normalize_text(candidate['title']) not in excluded
+        ][:request.candidates]
+        if not candidates:
+            return None
+        return TitleGenerationResponse(
+            title=candidates[0].title,
+            candidates=candidates,
+            generation_time=time.time() - start_time,
+            model=pool.get('model'),
+            **overrides
+        )
+    
+    @timed('fallback')
+    def _cached_title_fallback(
+        self, cache_key: str, request: TitleGenerationRequest, excluded: Set[str], start_time: float, reason: str
+    ) -> Optional[TitleGenerationResponse]:
+        # 장애 시 만료된 후보 목록이라도 있으면 시뮬레이션 결과보다 우선 제공 (이미 받은 제목이라도)
+        pool = self.cache.get(cache_key, allow_stale=True)
+        if pool is None:
+            return None
+        FALLBACKS.inc(operation='title', reason=reason, source='cache')
+        overrides = {'is_fallback': True, 'fallback_reason': reason, 'fallback_source': 'cache'}
+        return (
+            self._title_response(pool, request, excluded, start_time, **overrides)
+            or self._title_response(pool, request, set(), start_time, **overrides)
+        )
+    
+    async def _create_keywords(self, request: KeywordRecommendationRequest, cache_key: str) -> KeywordRecommendationResponse:
+        if self.json_output:
+            prompt = f"""
+        다음 주제에 대해 SEO 키워드를 추천해주세요:
+        주제: {request.topic}
         
-        prompt = f"""
+        다음 JSON 형식으로만 응답해주세요:
+        {{"primary_keyword": "핵심 키워드 1개", "sub_keywords": ["보조 키워드 1", "보조 키워드 2", "보조 키워드 3"]}}
+        """
+        else:
+            prompt = f"""
         다음 주제에 대해 SEO 키워드를 추천해주세요:
         주제: {request.topic}
         
@@ -78,76 +448,341 @@ class GeminiService:
         """
         
         try:
-            response = self.model.generate_content(prompt)
-            text = response.text.strip()
-            
-            # 응답 파싱
-            lines = text.split('\n')
-            primary_keyword = request.topic
-            sub_keywords = [f"{request.topic} 방법", f"{request.topic} 효과", f"{request.topic} 추천"]
-            
-            for line in lines:
-                if '핵심키워드:' in line:
-                    primary_keyword = line.split(':', 1)[1].strip()
-                elif '보조키워드:' in line:
-                    sub_keywords = [k.strip() for k in line.split(':', 1)[1].split(',')]
+            text = await self._generate(
+                prompt, Priority.INTERACTIVE, KEYWORD_OUTPUT_TOKENS, settings.gemini_interactive_timeout_seconds,
+                settings.gemini_keyword_model, 'keywords', json_output=self.json_output
+            )
+            primary_keyword, sub_keywords = self._parse_keywords(text, request)
             
-            return KeywordRecommendationResponse(
+            response = KeywordRecommendationResponse(
                 primary_keyword=primary_keyword,
-                sub_keywords=sub_keywords[:3] if len(sub_keywords) >= 3 else sub_keywords + [f"{request.topic} 추천"]
+                sub_keywords=sub_keywords[:3] if len(sub_keywords) >= 3 else sub_keywords + [f"{request.topic} 추천"],
+                model=settings.gemini_keyword_model
             )
-        except Exception:
-            # API 오류 시 시뮬레이션으로 폴백
-            return KeywordRecommendationResponse(
-                primary_keyword=request.topic,
-                sub_keywords=[f"{request.topic} 방법", f"{request.topic} 효과", f"{request.topic} 추천"]
+            self.cache.set(cache_key, response.model_dump(mode='json'))
+            return response
+        except Exception as e:
+            # API 오류 시 캐시된 결과 또는 시뮬레이션으로 폴백
+            reason = self._fallback_reason(e)
+            return (
+                self._cached_fallback(cache_key, KeywordRecommendationResponse, reason)
+                or self._simulate_keywords(request, reason)
             )
     
-    async def generate_content(self, request: ContentGenerationRequest) -> ContentGenerationResponse:
-        start_time = time.time()
+    def _parse_keywords(self, text: str, request: KeywordRecommendationRequest) -> Tuple[str, List[str]]:
+        if self.json_output:
+            parsed, repaired = parse_model(text, KeywordRecommendationResponse)
+            if parsed is not None and parsed.primary_keyword.strip() and parsed.sub_keywords:
+                OUTPUT_PARSE.inc(operation='keywords', mode='json', result='repaired' if repaired else 'ok')
+                return parsed.primary_keyword.strip(), [k.strip() for k in parsed.sub_keywords if k.strip()]
         
-        # 컨텐츠 타입별 가이드라인
+        # 텍스트 형식 파싱 (JSON 모드에서 JSON을 읽지 못한 경우에도 시도)
+        lines = text.split('\n')
+        primary_keyword = request.topic
+        sub_keywords = [f"{request.topic} 방법", f"{request.topic} 효과", f"{request.topic} 추천"]
+        found = 0
+        
+        for line in lines:
+            if '핵심키워드:' in line:
+                primary_keyword = line.split(':', 1)[1].strip()
+                found += 1
+            elif '보조키워드:' in line:
+                sub_keywords = [k.strip() for k in line.split(':', 1)[1].split(',')]
+                found += 1
+        
+        if found < 2:
+            result = 'failed'
+        else:
+            result = 'text_fallback' if self.json_output else 'ok'
+        OUTPUT_PARSE.inc(operation='keywords', mode='json' if self.json_output else 'text', result=result)
+        return primary_keyword, sub_keywords
+    
+    async def _create_content(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], cache_key: str, start_time: float) -> ContentGenerationResponse:
+        try:
+            if request.generation_mode == GenerationMode.FAN_OUT:
+                # 섹션별 병렬 생성: 가장 느린 섹션 시간만큼만 소요
+                model = self._route('section', start_time)
+                named = {event.section: event.content async for event in self._generate_sections_fan_out(request, guidelines, start_time, model)}
+            else:
+                # Gemini API로 컨텐츠 생성
+                model = self._route('content', start_time)
+                prompt = self._build_content_prompt(request, guidelines, json_output=self.json_output)
+                content_text = await self._generate(
+                    prompt, Priority.BULK, CONTENT_OUTPUT_TOKENS,
+                    self._remaining_budget(start_time, settings.gemini_content_timeout_seconds),
+                    model, 'content', json_output=self.json_output
+                )
+                
+                # 응답 파싱 및 구조화
+                named = self._parse_generated_content(content_text, request, json_output=self.json_output)
+            
+            # 빠진 섹션은 섹션별로 다시 생성
+            named, unfilled = await self._complete_sections(request, guidelines, named, start_time)
+            sections = build_content_sections(named, self._create_fallback_sections(request, guidelines))
+            
+            # 기준 미달 시 약한 섹션만 다시 생성
+            response = self._build_response(request, sections, start_time, model=model)
+            response = self._mark_incomplete(await self._repair_content(request, response, start_time), unfilled)
+            # 기준을 통과한 기본 모델 결과만 캐시해 미달/대체 모델/일부 누락 결과가 반복 제공되지 않도록 함
+            if model == settings.gemini_model and not response.is_fallback and not self._diagnose(response):
+                self.cache.set(cache_key, response.model_dump(mode='json'))
+            return response
+            
+        except Exception as e:
+            # API 오류 시 캐시된 결과 또는 시뮬레이션으로 폴백
+            reason = self._fallback_reason(e)
+            return (
+                self._cached_fallback(cache_key, ContentGenerationResponse, reason, generation_time=time.time() - start_time)
+                or self._generate_simulated_content(request, guidelines, start_time, reason)
+            )
+    
+    async def stream_content(self, request: ContentGenerationRequest) -> AsyncIterator[Tuple[str, Any]]:
+        """섹션이 완성되는 즉시 ('section', ContentSectionEvent)를, 마지막에 ('complete', 응답)을 내보냅니다."""
+        with collect_timings() as timings:
+            async for kind, payload in self._stream_content(request):
+                if kind == 'complete':
+                    payload = self._attach_timings(request, payload, timings)
+                yield kind, payload
+    
+    async def stream_pipeline(self, request: PipelineRequest) -> AsyncIterator[Tuple[str, Any]]:
+        """키워드 추천과 제목 생성을 동시에 실행해 끝나는 대로 ('keywords' | 'title', 응답)을 내보낸 뒤,
+        그 결과로 본문을 stream_content와 같은 형식으로 이어서 내보냅니다."""
+        keywords_task = asyncio.ensure_future(self.recommend_keywords(
+            KeywordRecommendationRequest(topic=request.topic, bypass_cache=request.bypass_cache)
+        ))
+        title_task = asyncio.ensure_future(self.generate_seo_title(
+            TitleGenerationRequest(topic=request.topic, bypass_cache=request.bypass_cache)
+        ))
+        stages = {keywords_task: 'keywords', title_task: 'title'}
+        pending = set(stages)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield stages[task], task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+        
+        keywords = keywords_task.result()
+        content_request = ContentGenerationRequest(
+            topic=request.topic,
+            title=title_task.result().title[:200],
+            content_type=request.content_type,
+            primary_keyword=keywords.primary_keyword[:100] or request.topic[:100],
+            sub_keywords=self._pipeline_sub_keywords(keywords, request.topic),
+            generation_mode=request.generation_mode,
+            bypass_cache=request.bypass_cache
+        )
+        async for item in self.stream_content(content_request):
+            yield item
+    
+    def _pipeline_sub_keywords(self, keywords: KeywordRecommendationResponse, topic: str) -> List[str]:
+        # 본문 요청은 보조 키워드 3개 이상이 필요하므로 모자라면 기본 키워드로 채움
+        sub_keywords = [k.strip() for k in keywords.sub_keywords if k.strip()]
+        for default in (f"{topic} 방법", f"{topic} 효과", f"{topic} 추천"):
+            if len(sub_keywords) >= 3:
+                break
+            if default not in sub_keywords:
+                sub_keywords.append(default)
+        return sub_keywords
+    
+    async def _stream_content(self, request: ContentGenerationRequest) -> AsyncIterator[Tuple[str, Any]]:
+        start_time = time.time()
         guidelines = self._get_content_guidelines(request.content_type.value)
         
         if not self._is_configured():
             # 시뮬레이션 모드
-            return self._generate_simulated_content(request, guidelines, start_time)
+            async for item in self._stream_simulated_content(request, guidelines, start_time, 'not_configured'):
+                yield item
+            return
         
-        # Gemini API로 컨텐츠 생성
-        prompt = self._build_content_prompt(request, guidelines)
+        emitted = False
+        try:
+            if request.generation_mode == GenerationMode.FAN_OUT:
+                model = self._route('section', start_time)
+                named = {}
+                async for event in self._generate_sections_fan_out(request, guidelines, start_time, model):
+                    named[event.section] = event.content
+                    emitted = True
+                    yield 'section', event
+            else:
+                model = self._route('content', start_time)
+                prompt = self._build_content_prompt(request, guidelines)
+                parser = SectionStreamParser()
+                
+                timeout = self._remaining_budget(start_time, settings.gemini_content_timeout_seconds)
+                async for chunk in self._generate_stream(prompt, model, timeout):
+                    # 다음 마커가 도착한 섹션은 완성된 것으로 보고 바로 전송
+                    for event in parser.feed(chunk):
+                        emitted = True
+                        yield 'section', event
+                for event in parser.close():
+                    yield 'section', event
+                
+                named = self._assemble_sections(parser, guidelines)
+        except Exception as e:
+            # 아직 아무 섹션도 보내지 않았다면 대체 응답으로 전환, 일부를 보낸 뒤라면 오류로 전달
+            if emitted:
+                raise
+            async for item in self._stream_simulated_content(request, guidelines, start_time, self._fallback_reason(e)):
+                yield item
+            return
+        
+        # 빠진 섹션을 다시 생성했으면 이어서 전송
+        completed, unfilled = await self._complete_sections(request, guidelines, named, start_time)
+        for name, content in completed.items():
+            if name not in named:
+                yield 'section', ContentSectionEvent(section=name, content=content)
+        sections = build_content_sections(completed, self._create_fallback_sections(request, guidelines))
         
+        # 보정된 섹션은 같은 이름으로 다시 전송해 클라이언트가 교체하도록 함
+        response = self._build_response(request, sections, start_time, model=model)
+        repaired = self._mark_incomplete(await self._repair_content(request, response, start_time), unfilled)
+        original = dict(self._iter_named_sections(response.sections))
+        for name, content in self._iter_named_sections(repaired.sections):
+            if original.get(name) != content:
+                yield 'section', ContentSectionEvent(section=name, content=content)
+        yield 'complete', repaired
+    
+    async def _stream_simulated_content(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], start_time: float, reason: str) -> AsyncIterator[Tuple[str, Any]]:
+        response = self._generate_simulated_content(request, guidelines, start_time, reason)
+        for name, content in self._iter_named_sections(response.sections):
+            yield 'section', ContentSectionEvent(section=name, content=content)
+        yield 'complete', response
+    
+    async def _generate_sections_fan_out(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], start_time: float, model: str) -> AsyncIterator[ContentSectionEvent]:
+        """목차를 먼저 생성한 뒤 도입부/본문/결론을 동시에 생성해 완료되는 순서대로 내보냅니다."""
+        outline_text = await self._generate(
+            self._build_outline_prompt(request, guidelines), Priority.BULK, TITLE_OUTPUT_TOKENS,
+            self._remaining_budget(start_time, settings.gemini_section_timeout_seconds),
+            model, 'outline'
+        )
+        headings = [line.strip().lstrip('#-*0123456789. ').strip() for line in outline_text.split('\n') if line.strip()]
+        if len(headings) != len(guidelines['body_parts']):
+            headings = list(guidelines['body_parts'])
+        
+        async def generate_section(name: str) -> Tuple[str, str]:
+            prompt = self._build_section_prompt(request, guidelines, name, headings)
+            timeout = self._remaining_budget(start_time, settings.gemini_section_timeout_seconds)
+            return name, await self._generate(prompt, Priority.BULK, SECTION_OUTPUT_TOKENS, timeout, model, 'section')
+        
+        tasks = [asyncio.ensure_future(generate_section(name)) for name in section_names(len(headings))]
         try:
-            response = self.model.generate_content(prompt)
-            content_text = response.text.strip()
-            
-            # 응답 파싱 및 구조화
-            sections = self._parse_generated_content(content_text, request)
-            
-            # SEO 메트릭 계산
-            full_content = sections.introduction + ' '.join(sections.body) + sections.conclusion
-            seo_metrics = self._calculate_seo_metrics(full_content, request.primary_keyword, request.sub_keywords)
-            
-            # 목차 생성
-            outline = self._generate_outline(sections)
-            
-            # 메타 설명 생성
-            meta_description = self._generate_meta_description(request.title, request.primary_keyword)
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    name, content = await next_done
+                except Exception:
+                    # 실패한 섹션은 _complete_sections에서 한 번 더 생성
+                    continue
+                if content:
+                    yield ContentSectionEvent(section=name, content=content)
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _repair_content(self, request: ContentGenerationRequest, response: ContentGenerationResponse, start_time: float) -> ContentGenerationResponse:
+        """SEO 기준에 미달한 원인을 진단해 해당 섹션만 다시 생성합니다. 횟수와 마감 시간 안에서만 반복합니다."""
+        deadline = start_time + settings.repair_deadline_seconds
+        
+        for round_number in range(1, settings.repair_max_rounds + 1):
+            failures = self._diagnose(response)
+            remaining = deadline - time.time()
+            if not failures or remaining <= 0:
+                break
             
-            generation_time = time.time() - start_time
+            named = dict(self._iter_named_sections(response.sections))
+            repairs = self._plan_repairs(failures, named, request)
+            if not repairs:
+                break
             
-            return ContentGenerationResponse(
-                title=request.title,
-                outline=outline,
-                sections=sections,
-                meta_description=meta_description,
-                seo_metrics=seo_metrics,
-                total_char_count=len(full_content),
-                generation_time=generation_time
+            prompts = [self._build_repair_prompt(request, named[name], instruction) for name, instruction in repairs.items()]
+            timeout = min(remaining, settings.gemini_section_timeout_seconds)
+            model = self._route('repair', start_time)
+            results = await asyncio.gather(
+                *(self._generate(prompt, Priority.BULK, SECTION_OUTPUT_TOKENS, timeout, model, 'repair') for prompt in prompts),
+                return_exceptions=True
             )
+            if all(isinstance(result, Exception) for result in results):
+                break
             
-        except Exception:
-            # API 오류 시 시뮬레이션으로 폴백
-            return self._generate_simulated_content(request, guidelines, start_time)
+            for name, result in zip(repairs, results):
+                if isinstance(result, str) and result:
+                    named[name] = result
+            sections = build_content_sections(named, response.sections)
+            response = self._build_response(request, sections, start_time, repair_rounds=round_number, model=response.model)
+        
+        return response
+    
+    def _diagnose(self, response: ContentGenerationResponse) -> List[str]:
+        failures = []
+        metrics = response.seo_metrics
+        if response.total_char_count < MIN_CHAR_COUNT:
+            failures.append('char_count')
+        if metrics.keyword_density < MIN_KEYWORD_DENSITY:
+            failures.append('keyword_density')
+        elif metrics.keyword_density > MAX_KEYWORD_DENSITY and metrics.seo_score < MIN_SEO_SCORE:
+            failures.append('keyword_overuse')
+        if metrics.readability_score < MIN_READABILITY_SCORE and metrics.seo_score < MIN_SEO_SCORE:
+            failures.append('readability')
+        return failures
+    
+    def _plan_repairs(self, failures: List[str], named: Dict[str, str], request: ContentGenerationRequest) -> Dict[str, str]:
+        """재생성할 섹션 이름과 보정 지시를 정합니다. 한 섹션에는 하나의 지시만 적용합니다."""
+        repairs: Dict[str, str] = {}
+        bodies = {name: content for name, content in named.items() if name.startswith(BODY)}
+        keywords = [request.primary_keyword] + request.sub_keywords
+        matcher = get_matcher(keywords)
+        matches = {name: matcher.find(content) for name, content in named.items()}
+        
+        if 'char_count' in failures and bodies:
+            shortest = min(bodies, key=lambda name: len(bodies[name]))
+            shortage = MIN_CHAR_COUNT - sum(len(content) for content in named.values())
+            target = len(bodies[shortest]) + max(shortage, 0) + 100
+            repairs[shortest] = f"내용을 보강해 {target}자 이상으로 확장해주세요."
+        
+        if 'keyword_density' in failures:
+            # 키워드가 가장 적게 들어간 섹션부터 최대 2개 재작성
+            def keyword_hits(name: str) -> int:
+                return sum(matches[name].counts.values())
+            for name in sorted((name for name in named if name not in repairs), key=keyword_hits)[:2]:
+                missing = [keyword for keyword in keywords if not matches[name].count(keyword)] or keywords
+                repairs[name] = f"다음 키워드를 자연스럽게 각각 2회 이상 포함하도록 다시 작성해주세요: {', '.join(missing)}"
+        
+        if 'keyword_overuse' in failures:
+            candidates = [name for name in named if name not in repairs]
+            if candidates:
+                densest = max(candidates, key=lambda name: matches[name].count(request.primary_keyword))
+                repairs[densest] = f"'{request.primary_keyword}' 반복을 줄이고 자연스러운 표현으로 다시 작성해주세요."
+        
+        if 'readability' in failures:
+            candidates = [name for name in named if name not in repairs]
+            if candidates:
+                longest = max(candidates, key=lambda name: len(named[name]))
+                repairs[longest] = "문장을 짧게 나누고 문단을 구분해 읽기 쉽게 다시 작성해주세요. 분량은 줄이지 마세요."
+        
+        return repairs
+    
+    @timed('prompt_build')
+    def _build_repair_prompt(self, request: ContentGenerationRequest, section: str, instruction: str) -> str:
+        return f"""
+주제: {request.topic}
+제목: {request.title}
+핵심 키워드: {request.primary_keyword}
+보조 키워드: {', '.join(request.sub_keywords)}
+
+다음은 블로그 글의 한 섹션입니다:
+{section}
+
+{instruction}
+소제목(## 으로 시작하는 줄)이 있다면 그대로 유지하고, 수정된 섹션 내용만 출력해주세요.
+"""
+    
+    def _iter_named_sections(self, sections: ContentSections) -> List[Tuple[str, str]]:
+        named = [(INTRODUCTION, sections.introduction)]
+        named.extend((f'{BODY}{i + 1}', body) for i, body in enumerate(sections.body))
+        named.append((CONCLUSION, sections.conclusion))
+        return named
     
     def _get_content_guidelines(self, content_type: str) -> Dict[str, Any]:
         if content_type == 'informational':
@@ -173,7 +808,33 @@ class GeminiService:
                 'conclusion': '구매 유도와 행동 촉구 메시지'
             }
     
-    def _build_content_prompt(self, request: ContentGenerationRequest, guidelines: Dict[str, Any]) -> str:
+    @timed('prompt_build')
+    def _build_content_prompt(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], json_output: bool = False) -> str:
+        # 스트리밍은 섹션 단위로 바로 내보낼 수 있도록 항상 마커 형식 사용
+        if json_output:
+            output_format = f"""다음 JSON 형식으로만 응답해주세요. body에는 본문 {len(guidelines['body_parts'])}개를 순서대로 넣고, 각 본문은 ## 소제목으로 시작해주세요:
+{{"introduction": "도입부 내용", "body": ["첫 번째 본문 내용", "두 번째 본문 내용", "..."], "conclusion": "결론 내용"}}
+"""
+        else:
+            output_format = """다음 형식으로 작성해주세요:
+[도입부]
+(도입부 내용)
+
+[본문1]
+(첫 번째 본문 내용)
+
+[본문2]
+(두 번째 본문 내용)
+
+[본문3]
+(세 번째 본문 내용)
+
+[본문4]
+(네 번째 본문 내용)
+
+[결론]
+(결론 내용)
+"""
         return f"""
 주제: {request.topic}
 제목: {request.title}
@@ -194,54 +855,131 @@ class GeminiService:
 4. SEO에 최적화된 구조
 5. 가독성이 좋은 문장
 
-다음 형식으로 작성해주세요:
-[도입부]
-(도입부 내용)
+{output_format}"""
+    
+    @timed('prompt_build')
+    def _build_outline_prompt(self, request: ContentGenerationRequest, guidelines: Dict[str, Any]) -> str:
+        body_parts = '\n'.join(f"{i + 1}. {part}" for i, part in enumerate(guidelines['body_parts']))
+        return f"""
+주제: {request.topic}
+제목: {request.title}
+핵심 키워드: {request.primary_keyword}
+보조 키워드: {', '.join(request.sub_keywords)}
 
-[본문1]
-(첫 번째 본문 내용)
+다음 본문 구성에 맞춰 블로그 글의 소제목 {len(guidelines['body_parts'])}개를 작성해주세요:
+{body_parts}
 
-[본문2]
-(두 번째 본문 내용)
+소제목만 한 줄에 하나씩 출력해주세요.
+"""
+    
+    @timed('prompt_build')
+    def _build_section_prompt(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], name: str, headings: List[str]) -> str:
+        outline = '\n'.join(f"- {heading}" for heading in [INTRODUCTION] + headings + [CONCLUSION])
+        if name == INTRODUCTION:
+            label, guide, min_chars, format_hint = name, guidelines['introduction'], 200, "소제목 없이 내용만"
+        elif name == CONCLUSION:
+            label, guide, min_chars, format_hint = name, guidelines['conclusion'], 200, "소제목 없이 내용만"
+        else:
+            index = int(name[len(BODY):]) - 1
+            sub_keyword = request.sub_keywords[index % len(request.sub_keywords)]
+            label = headings[index]
+            guide = f"{guidelines['body_parts'][index]} (보조 키워드 '{sub_keyword}'를 반드시 포함)"
+            min_chars, format_hint = 300, f"'## {label}' 소제목으로 시작해서"
+        
+        return f"""
+주제: {request.topic}
+제목: {request.title}
+글의 성격: {request.content_type.value}
+핵심 키워드: {request.primary_keyword}
+보조 키워드: {', '.join(request.sub_keywords)}
 
-[본문3]
-(세 번째 본문 내용)
+전체 목차:
+{outline}
 
-[본문4]
-(네 번째 본문 내용)
+위 목차 중 '{label}' 부분만 작성해주세요.
+작성 지침: {guide}
 
-[결론]
-(결론 내용)
+요구사항:
+1. {min_chars}자 이상
+2. 핵심 키워드를 자연스럽게 포함
+3. 다른 섹션의 내용은 반복하지 않기
+4. 가독성이 좋은 문장
+5. [도입부] 같은 섹션 표시 없이 {format_hint} 출력
 """
     
-    def _parse_generated_content(self, content_text: str, request: ContentGenerationRequest) -> ContentSections:
-        # 간단한 파싱 로직 (실제로는 더 정교하게 구현)
-        sections = content_text.split('[')
-        
-        introduction = ""
-        body = []
-        conclusion = ""
-        
-        for section in sections:
-            if section.startswith('도입부]'):
-                introduction = section.replace('도입부]', '').strip()
-            elif section.startswith('본문'):
-                body_content = re.sub(r'본문\d+\]', '', section).strip()
-                if body_content:
-                    body.append(body_content)
-            elif section.startswith('결론]'):
-                conclusion = section.replace('결론]', '').strip()
-        
-        # 파싱 실패 시 기본 구조로 폴백
-        if not introduction or not body or not conclusion:
-            guidelines = self._get_content_guidelines(request.content_type.value)
-            return self._create_fallback_sections(request, guidelines)
+    @timed('parse')
+    def _parse_generated_content(self, content_text: str, request: ContentGenerationRequest, json_output: bool = False) -> Dict[str, str]:
+        """응답에서 읽어 낸 섹션을 이름별로 반환합니다. 빠진 섹션은 _complete_sections에서 채웁니다."""
+        guidelines = self._get_content_guidelines(request.content_type.value)
+        if json_output:
+            data, repaired = load_json_object(content_text)
+            named = named_sections_from_json(data) if data else {}
+            if named:
+                # 잘린 JSON에서 살린 섹션은 그대로 사용
+                missing = [name for name in section_names(len(guidelines['body_parts'])) if name not in named]
+                for name in missing:
+                    PARSE_FAILURES.inc(section=name)
+                OUTPUT_PARSE.inc(operation='content', mode='json', result='repaired' if repaired or missing else 'ok')
+                return named
         
-        return ContentSections(
-            introduction=introduction,
-            body=body,
-            conclusion=conclusion
+        # 마커 형식 파싱 (JSON 모드에서 JSON을 읽지 못한 경우에도 시도)
+        parser = SectionStreamParser()
+        parser.feed(content_text)
+        parser.close()
+        return self._assemble_sections(parser, guidelines, mode='json' if json_output else 'text')
+    
+    def _assemble_sections(self, parser: SectionStreamParser, guidelines: Dict[str, Any], mode: str = 'text') -> Dict[str, str]:
+        # 생성된 섹션은 버리지 않고, 누락된 섹션은 지표로 기록
+        missing = parser.missing_sections(len(guidelines['body_parts']))
+        for name in missing:
+            PARSE_FAILURES.inc(section=name)
+        if not parser.sections:
+            result = 'failed'
+        elif mode == 'json':
+            result = 'text_fallback'
+        else:
+            result = 'partial' if missing else 'ok'
+        OUTPUT_PARSE.inc(operation='content', mode=mode, result=result)
+        return dict(parser.sections)
+    
+    async def _complete_sections(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], named: Dict[str, str], start_time: float) -> Tuple[Dict[str, str], List[str]]:
+        """빠진 섹션만 섹션 프롬프트로 다시 생성합니다. (채운 섹션을 포함한 결과, 끝내 채우지 못한 섹션 이름)을 반환합니다."""
+        missing = [name for name in section_names(len(guidelines['body_parts'])) if name not in named]
+        if not missing:
+            return named, []
+        headings = self._section_headings(named, guidelines)
+        timeout = self._remaining_budget(start_time, settings.gemini_section_timeout_seconds)
+        model = self._route('section', start_time)
+        results = await asyncio.gather(
+            *(
+                self._generate(self._build_section_prompt(request, guidelines, name, headings), Priority.BULK, SECTION_OUTPUT_TOKENS, timeout, model, 'section')
+                for name in missing
+            ),
+            return_exceptions=True
         )
+        completed = dict(named)
+        for name, result in zip(missing, results):
+            if isinstance(result, str) and result:
+                completed[name] = result
+        return completed, [name for name in missing if name not in completed]
+    
+    def _section_headings(self, named: Dict[str, str], guidelines: Dict[str, Any]) -> List[str]:
+        # 생성된 본문의 소제목을 목차로 쓰고, 빠진 본문은 가이드라인의 구성으로 채움
+        headings = []
+        for i, part in enumerate(guidelines['body_parts']):
+            first_line = named.get(f'{BODY}{i + 1}', '').strip().split('\n', 1)[0]
+            heading = first_line.lstrip('#').strip() if first_line.startswith('#') else ''
+            headings.append(heading or part)
+        return headings
+    
+    def _mark_incomplete(self, response: ContentGenerationResponse, unfilled: List[str]) -> ContentGenerationResponse:
+        # 다시 생성하지 못한 섹션이 기본 구조 문구로 남았으면 대체 응답으로 표시
+        if not unfilled:
+            return response
+        FALLBACKS.inc(operation='content', reason='missing_sections', source='partial')
+        return response.model_copy(update={
+            'is_fallback': True, 'fallback_reason': 'missing_sections', 'fallback_source': 'partial', 'missing_sections': unfilled
+        })
     
     def _create_fallback_sections(self, request: ContentGenerationRequest, guidelines: Dict[str, Any]) -> ContentSections:
         introduction = f"{request.title}에 대해 알아보겠습니다.\n\n{request.primary_keyword}는 현재 많은 사람들이 관심을 갖고 있는 주제입니다. {guidelines['introduction']}"
@@ -260,13 +998,24 @@ class GeminiService:
             conclusion=conclusion
         )
     
-    def _generate_simulated_content(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], start_time: float) -> ContentGenerationResponse:
+    @timed('fallback')
+    def _generate_simulated_content(self, request: ContentGenerationRequest, guidelines: Dict[str, Any], start_time: float, reason: str) -> ContentGenerationResponse:
+        FALLBACKS.inc(operation='content', reason=reason, source='simulation')
         sections = self._create_fallback_sections(request, guidelines)
-        
+        response = self._build_response(request, sections, start_time)
+        return response.model_copy(update={'is_fallback': True, 'fallback_reason': reason, 'fallback_source': 'simulation'})
+    
+    def _build_response(self, request: ContentGenerationRequest, sections: ContentSections, start_time: float, repair_rounds: int = 0, model: Optional[str] = None) -> ContentGenerationResponse:
+        # SEO 메트릭 계산
         full_content = sections.introduction + ' '.join(sections.body) + sections.conclusion
         seo_metrics = self._calculate_seo_metrics(full_content, request.primary_keyword, request.sub_keywords)
+        
+        # 목차 생성
         outline = self._generate_outline(sections)
+        
+        # 메타 설명 생성
         meta_description = self._generate_meta_description(request.title, request.primary_keyword)
+        
         generation_time = time.time() - start_time
         
         return ContentGenerationResponse(
@@ -276,22 +1025,23 @@ class GeminiService:
             meta_description=meta_description,
             seo_metrics=seo_metrics,
             total_char_count=len(full_content),
-            generation_time=generation_time
+            generation_time=generation_time,
+            repair_rounds=repair_rounds,
+            model=model
         )
     
+    @timed('seo_metrics')
     def _calculate_seo_metrics(self, content: str, primary_keyword: str, sub_keywords: List[str]) -> SEOMetrics:
-        # 키워드 밀도 계산
-        total_words = len(content.split())
-        primary_count = content.lower().count(primary_keyword.lower())
-        sub_count = sum(content.lower().count(keyword.lower()) for keyword in sub_keywords)
+        # 키워드 밀도 계산 (한 번의 순회로 모든 키워드와 어절 수를 셈)
+        matches = get_matcher([primary_keyword] + sub_keywords).find(content)
+        total_words = matches.token_count
+        primary_count = matches.count(primary_keyword)
+        sub_count = sum(matches.count(keyword) for keyword in sub_keywords)
         
         keyword_density = ((primary_count * 2 + sub_count) / total_words) * 100 if total_words > 0 else 0
         
-        # 가독성 점수 (textstat 사용)
-        try:
-            readability_score = max(0, min(100, int(textstat.flesch_reading_ease(content))))
-        except:
-            readability_score = 70  # 기본값
+        # 가독성 점수 (한글 문장 길이, 절 밀도, 문단 길이 기준)
+        readability_score = score_readability(content)
         
         # SEO 점수 계산 (간단한 로직)
         seo_score = 0
@@ -326,6 +1076,7 @@ class GeminiService:
             readability_score=readability_score
         )
     
+    @timed('outline')
     def _generate_outline(self, sections: ContentSections) -> List[str]:
         outline = ["1. 도입부"]
         
@@ -347,4 +1098,9 @@ class GeminiService:
         return meta[:160]  # 160자 제한
 
 # 싱글톤 서비스 인스턴스
-gemini_service = GeminiService()
\ No newline at end of file
+@lru_cache()
+def get_gemini_service() -> GeminiService:
+    return GeminiService()
+
+# 첫 사용 때 생성 (import만으로 설정을 읽거나 캐시/스케줄러를 만들지 않음)
+gemini_service: GeminiService = Lazy(get_gemini_service)  # type: ignore[assignment]
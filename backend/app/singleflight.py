@@ -0,0 +1,36 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 요청들이 하나의 upstream 호출 결과를 함께 받도록 합니다.
+
+    공유 호출은 처음 요청한 쪽이 아니라 키가 소유한 별도 작업(task)에서 실행하므로,
+    어느 요청이 취소되어도(클라이언트 연결 종료 등) 그 요청만 취소되고 나머지는 결과를 받습니다.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.leaders = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.create_task(func())
+            self._inflight[key] = task
+            self.leaders += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+        return await asyncio.shield(task)
+
+    def _finish(self, key: str, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # 기다리던 요청이 모두 취소된 경우 'exception was never retrieved' 경고 방지
+            task.exception()
+
+    def stats(self) -> Dict[str, int]:
+        return {'upstream_calls': self.leaders, 'coalesced': self.coalesced, 'inflight': len(self._inflight)}
@@ -0,0 +1,107 @@
+import json
+import re
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from .parser import BODY, CONCLUSION, INTRODUCTION
+
+T = TypeVar('T', bound=BaseModel)
+
+CODE_FENCE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+CLOSERS = {'{': '}', '[': ']'}
+# 잘린 응답을 복구할 때 되돌아가 볼 최대 쉼표 수 (매번 json.loads를 다시 시도하므로 제한)
+MAX_REPAIR_ATTEMPTS = 8
+
+
+def repair_truncated_json(text: str) -> List[str]:
+    """출력 토큰 한도 등으로 중간에 끊긴 JSON을 닫아 파싱 가능한 후보들을 만듭니다.
+
+    끝까지 살린 후보와 마지막으로 완성된 값(쉼표 위치)까지 잘라낸 후보들을 반환합니다.
+    문자열 중간에서 끊겼다면 문장이 잘린 값을 살리기보다 완성된 값까지만 쓰는 후보를 앞에 둡니다.
+    """
+    stack: List[str] = []
+    in_string = False
+    escaped = False
+    cut_points: List[Tuple[int, str]] = []
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+            continue
+        if char == '"':
+            in_string = True
+        elif char in CLOSERS:
+            stack.append(CLOSERS[char])
+        elif char in '}]' and stack:
+            stack.pop()
+        elif char == ',':
+            cut_points.append((index, ''.join(reversed(stack))))
+
+    tail = text[:-1] if escaped else text
+    if in_string:
+        tail += '"'
+    tail = tail.rstrip().rstrip(',')
+    if tail.endswith(':'):
+        tail += ' null'
+    closed = tail + ''.join(reversed(stack))
+    truncated = [text[:index] + closers for index, closers in reversed(cut_points[-MAX_REPAIR_ATTEMPTS:])]
+    return truncated + [closed] if in_string else [closed] + truncated
+
+
+def load_json_object(text: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+    """모델 응답에서 JSON 객체를 읽습니다. (객체, 복구 여부)를 반환하며 읽을 수 없으면 객체는 None입니다."""
+    text = CODE_FENCE.sub('', text.strip())
+    start = text.find('{')
+    if start < 0:
+        return None, False
+    text = text[start:]
+    try:
+        data = json.loads(text)
+        return (data, False) if isinstance(data, dict) else (None, False)
+    except json.JSONDecodeError:
+        pass
+    for candidate in repair_truncated_json(text):
+        try:
+            data = json.loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict):
+            return data, True
+    return None, False
+
+
+def parse_model(text: str, model_type: Type[T]) -> Tuple[Optional[T], bool]:
+    """JSON 응답을 Pydantic 모델로 검증합니다. (모델, 복구 여부)를 반환합니다."""
+    data, repaired = load_json_object(text)
+    if data is None:
+        return None, False
+    try:
+        return model_type.model_validate(data), repaired
+    except ValidationError:
+        return None, repaired
+
+
+def named_sections_from_json(data: Dict[str, Any]) -> Dict[str, str]:
+    """ContentSections 형식의 JSON을 섹션 이름별 내용으로 바꿉니다. 잘려서 빠진 섹션은 포함하지 않습니다."""
+    named: Dict[str, str] = {}
+    if isinstance(data.get('introduction'), str) and data['introduction'].strip():
+        named[INTRODUCTION] = data['introduction'].strip()
+    body = data.get('body')
+    if isinstance(body, list):
+        for i, section in enumerate(body):
+            if isinstance(section, dict):
+                # {"heading": ..., "content": ...} 형태로 답한 경우
+                heading = str(section.get('heading') or '').strip()
+                if heading and not heading.startswith('#'):
+                    heading = f'## {heading}'
+                section = '\n\n'.join(part for part in (heading, str(section.get('content') or '').strip()) if part)
+            if isinstance(section, str) and section.strip():
+                named[f'{BODY}{i + 1}'] = section.strip()
+    if isinstance(data.get('conclusion'), str) and data['conclusion'].strip():
+        named[CONCLUSION] = data['conclusion'].strip()
+    return named
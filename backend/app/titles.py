@@ -0,0 +1,83 @@
+import re
+from typing import List, Sequence, Set, Tuple
+
+from .keywords import TOKEN, get_matcher, normalize_text
+
+# 제목 프롬프트의 권장 길이
+IDEAL_MIN_LENGTH = 50
+IDEAL_MAX_LENGTH = 60
+# 권장 길이에서 이만큼 벗어나면 길이 점수 0
+LENGTH_TOLERANCE = 25
+
+# 목록 번호, 글머리표, 따옴표 등 후보 줄 앞뒤의 장식
+LIST_DECORATION = re.compile(r'^\s*(?:[-*•]|\d+[.)]|제목\s*\d*\s*:)?\s*["\'“”‘’]?|["\'“”‘’]?\s*$')
+
+
+def clean_title(line: str) -> str:
+    return LIST_DECORATION.sub('', line.strip()).strip()
+
+
+def _length_score(title: str) -> float:
+    length = len(title)
+    if IDEAL_MIN_LENGTH <= length <= IDEAL_MAX_LENGTH:
+        return 1.0
+    distance = IDEAL_MIN_LENGTH - length if length < IDEAL_MIN_LENGTH else length - IDEAL_MAX_LENGTH
+    return max(0.0, 1 - distance / LENGTH_TOLERANCE)
+
+
+def _keyword_score(title: str, keyword: str) -> float:
+    """키워드가 앞에 나올수록 높은 점수. 키워드 전체가 없으면 포함된 어절 비율만큼만 인정합니다."""
+    matches = get_matcher([keyword]).find(title)
+    positions = matches.positions.get(normalize_text(keyword)) or []
+    if positions:
+        return 1.0 if positions[0] == 0 else max(0.5, 1 - positions[0] / 40)
+    words = TOKEN.findall(normalize_text(keyword))
+    if not words:
+        return 0.0
+    found = get_matcher(words).find(title)
+    return 0.4 * sum(1 for word in words if found.count(word)) / len(words)
+
+
+def _repeat_ratio(title: str) -> float:
+    tokens = TOKEN.findall(normalize_text(title))
+    return 1 - len(set(tokens)) / len(tokens) if tokens else 0.0
+
+
+def _bigrams(title: str) -> Set[str]:
+    text = normalize_text(title).replace(' ', '')
+    return {text[i:i + 2] for i in range(len(text) - 1)}
+
+
+def _similarity(a: Set[str], b: Set[str]) -> float:
+    return len(a & b) / len(a | b) if a and b else 0.0
+
+
+def rank_titles(titles: Sequence[str], keyword: str) -> List[Tuple[str, int]]:
+    """제목 후보를 길이(50-60자), 키워드 위치, 중복도로 채점해 점수순 (제목, 점수 0-100) 목록을 반환합니다.
+
+    이미 고른 후보와 비슷한 후보는 감점해 비슷한 제목이 상위에 몰리지 않도록 하고, 같은 제목은 하나만 남깁니다.
+    """
+    seen: Set[str] = set()
+    unique: List[str] = []
+    for title in titles:
+        key = normalize_text(title)
+        if key and key not in seen:
+            seen.add(key)
+            unique.append(title)
+    base = {
+        title: 40 * _length_score(title) + 40 * _keyword_score(title, keyword) + 20 * max(0.0, 1 - 3 * _repeat_ratio(title))
+        for title in unique
+    }
+    bigrams = {title: _bigrams(title) for title in unique}
+
+    ranked: List[Tuple[str, int]] = []
+    remaining = list(unique)
+    while remaining:
+        def adjusted(title: str) -> float:
+            closest = max((_similarity(bigrams[title], bigrams[chosen]) for chosen, _ in ranked), default=0.0)
+            return base[title] - 30 * max(0.0, closest - 0.3) / 0.7
+
+        best = max(remaining, key=adjusted)
+        ranked.append((best, max(0, min(100, round(adjusted(best))))))
+        remaining.remove(best)
+    return ranked
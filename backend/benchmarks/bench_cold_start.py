@@ -0,0 +1,144 @@
+"""서버리스 콜드 스타트 비용(앱 import, 서버 시작, 첫 요청 지연)을 측정합니다.
+
+측정마다 새 파이썬 프로세스를 띄워 import 캐시가 없는 상태에서 시작합니다.
+- simulation: API 키 없이 시뮬레이션 응답 (모델 클라이언트를 만들지 않음)
+- model: API 키가 있을 때 첫 제목 요청에서 SDK import와 클라이언트 준비 비용을 냄
+- warm_up: WARM_UP_ON_STARTUP=true로 서버 시작 시 미리 준비
+
+model/warm_up은 실제 SDK를 import하고 설정하지만, 모델 호출만 지연 없는 가짜 모델로 바꿔 네트워크를 쓰지 않습니다.
+--top-imports를 주면 python -X importtime 결과에서 누적 시간이 긴 모듈도 함께 보여 줍니다.
+
+실행: python -m benchmarks.bench_cold_start --runs 5 --output cold_start.json (backend 디렉터리에서)
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+MODES = ("simulation", "model", "warm_up")
+STAGES = ("import", "startup", "first_request", "total", "process")
+TITLE_REQUEST = {"topic": "다이어트 식단", "bypass_cache": True}
+
+
+def child(mode: str) -> None:
+    """새 프로세스에서 한 번 측정하고 결과를 JSON 한 줄로 출력합니다."""
+    started = time.perf_counter()
+    os.environ["CACHE_BACKEND"] = "memory"
+    os.environ["JOB_WORKER_CONCURRENCY"] = "0"
+    os.environ["JOB_STORE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="aimax-cold-"), "jobs.sqlite3")
+    os.environ["WARM_UP_ON_STARTUP"] = "true" if mode == "warm_up" else "false"
+    if mode == "simulation":
+        os.environ.pop("GEMINI_API_KEY", None)
+    else:
+        os.environ["GEMINI_API_KEY"] = "cold-start"
+
+    from app.main import app
+    imported = time.perf_counter()
+
+    from fastapi.testclient import TestClient
+
+    if mode != "simulation":
+        from app.services import get_gemini_service
+        from benchmarks.fake_model import FakeGenerativeModel
+        from benchmarks.load_test import make_responder
+
+        # SDK import와 설정은 그대로 두고 만들어진 클라이언트만 가짜 모델로 교체
+        service = get_gemini_service()
+        init_client = service._init_client
+        model = FakeGenerativeModel(latency=0.0, responder=make_responder(2000))
+
+        def init_with_fake_model() -> None:
+            init_client()
+            service.model_factory = lambda name: model
+
+        service._init_client = init_with_fake_model
+
+    prepared = time.perf_counter()
+    with TestClient(app) as client:
+        ready = time.perf_counter()
+        response = client.post("/api/generate-title", json=TITLE_REQUEST)
+        answered = time.perf_counter()
+    response.raise_for_status()
+
+    print(json.dumps({
+        "import": imported - started,
+        "startup": ready - prepared,
+        "first_request": answered - ready,
+        # 벤치마크 준비(가짜 모델 설치) 시간은 제외
+        "total": (imported - started) + (answered - prepared),
+        "fallback": response.json().get("is_fallback"),
+    }))
+
+
+def measure(mode: str) -> Dict[str, float]:
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_cold_start", "--child", mode],
+        check=True, capture_output=True, text=True
+    ).stdout
+    result = json.loads(output.strip().splitlines()[-1])
+    # 인터프리터 시작과 종료까지 포함한 전체 프로세스 시간
+    result["process"] = time.perf_counter() - started
+    return result
+
+
+def top_imports(count: int) -> List[Dict[str, float]]:
+    """app.main과 app.main이 직접 import한 모듈 중 누적 import 시간이 긴 순서"""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        check=True, capture_output=True, text=True
+    ).stderr
+    totals: Dict[str, int] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, field = line[len("import time:"):].split("|")
+        # 이름 앞 들여쓰기 두 칸이 import 깊이 하나
+        depth = (len(field) - len(field.lstrip()) - 1) // 2
+        if depth <= 1:
+            totals[field.strip()] = int(cumulative)
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:count]
+    return [{"module": name, "seconds": microseconds / 1_000_000} for name, microseconds in ranked]
+
+
+def run(modes: List[str], runs: int, imports: int) -> Dict[str, object]:
+    report: Dict[str, object] = {"python": sys.version.split()[0], "runs": runs, "modes": {}}
+    print(f"{'mode':<11}" + "".join(f"{stage:>15}" for stage in STAGES))
+    for mode in modes:
+        samples = [measure(mode) for _ in range(runs)]
+        medians = {stage: statistics.median(sample[stage] for sample in samples) for stage in STAGES}
+        report["modes"][mode] = {
+            "median_s": {stage: round(seconds, 4) for stage, seconds in medians.items()},
+            "fallback": samples[0]["fallback"],
+        }
+        print(f"{mode:<11}" + "".join(f"{medians[stage] * 1000:13.0f}ms" for stage in STAGES))
+    if imports:
+        report["top_imports"] = top_imports(imports)
+        print("\nimport 누적 시간 상위 모듈 (app.main)")
+        for entry in report["top_imports"]:
+            print(f"  {entry['seconds'] * 1000:8.0f}ms  {entry['module']}")
+    return report
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--modes", default=",".join(MODES), help=f"측정할 방식 (쉼표 구분: {', '.join(MODES)})")
+    parser.add_argument("--runs", type=int, default=5, help="방식마다 프로세스를 새로 띄워 측정할 횟수 (중앙값 보고)")
+    parser.add_argument("--top-imports", type=int, default=0, help="import 시간이 긴 모듈을 몇 개까지 보여 줄지")
+    parser.add_argument("--output", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--child", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.child)
+    else:
+        report = run([mode.strip() for mode in args.modes.split(",") if mode.strip()], args.runs, args.top_imports)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, ensure_ascii=False, indent=2)
+            print(f"결과 저장: {args.output}")
@@ -0,0 +1,152 @@
+"""느린 가짜 모델로 동시 요청 처리와 중복 호출 병합을 확인합니다.
+
+- 동시 요청: N개의 서로 다른 요청이 요청 1개 시간(의 tolerance배) 안에 끝나고, 생성 중에도 이벤트 루프가 막히지 않는지
+- 중복 병합: 같은 요청 N개가 동시에 들어오면 upstream 호출은 1회, bypass_cache 요청은 각자 1회씩 호출하고,
+  처음 요청한 쪽이 취소되어도 나머지 요청은 결과를 받는지
+- 슬롯 예약: 본문 생성(BULK) 호출이 동시 호출 한도를 채우려 해도 제목 요청(INTERACTIVE)이 기다리지 않는지
+
+하나라도 기준을 벗어나면 0이 아닌 코드로 종료하므로 모델 호출이 다시 동기(블로킹)로 바뀌는 등의 회귀를 잡을 수 있습니다.
+
+실행: python -m benchmarks.bench_concurrency (backend 디렉터리에서)
+"""
+import argparse
+import asyncio
+import sys
+import time
+from typing import List, Tuple
+
+from app.models import TitleGenerationRequest
+from app.scheduler import Priority, QuotaScheduler
+from app.services import GeminiService
+from benchmarks.fake_model import FakeGenerativeModel
+
+
+def make_service(parallel: int, latency: float, interactive_reserve: int = 0) -> Tuple[GeminiService, FakeGenerativeModel]:
+    service = GeminiService()
+    model = FakeGenerativeModel(latency=latency, text="가짜 제목")
+    service.model_factory = lambda name: model
+    service.scheduler = QuotaScheduler(parallel, requests_per_minute=0, tokens_per_minute=0, interactive_reserve=interactive_reserve)
+    return service, model
+
+
+async def max_loop_lag(stop: asyncio.Event, interval: float = 0.01) -> float:
+    """stop이 설정될 때까지 interval마다 깨어나며 예정보다 늦게 깨어난 최대 시간을 잽니다."""
+    lag = 0.0
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lag = max(lag, time.perf_counter() - expected)
+    return lag
+
+
+async def check_parallel(parallel: int, latency: float, tolerance: float, max_lag: float) -> List[str]:
+    service, model = make_service(parallel, latency)
+
+    start = time.perf_counter()
+    await service.generate_seo_title(TitleGenerationRequest(topic="다이어트", bypass_cache=True))
+    single = time.perf_counter() - start
+
+    # 헬스체크처럼 가벼운 작업이 생성 중에도 제때 실행되는지 측정
+    stop = asyncio.Event()
+    lag_task = asyncio.create_task(max_loop_lag(stop))
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        service.generate_seo_title(TitleGenerationRequest(topic=f"다이어트 {i}"))
+        for i in range(parallel)
+    ))
+    batch = time.perf_counter() - start
+    stop.set()
+    lag = await lag_task
+
+    print(f"단일 요청: {single:.2f}초")
+    print(f"동시 요청 {parallel}개: {batch:.2f}초 (단일 대비 {batch / single:.2f}배, 기준 {tolerance:.1f}배 이하)")
+    print(f"생성 중 이벤트 루프 최대 지연: {lag * 1000:.2f}ms (기준 {max_lag * 1000:.0f}ms 이하)")
+
+    failures = []
+    if batch > single * tolerance:
+        failures.append(f"동시 요청 {parallel}개가 단일 요청의 {batch / single:.2f}배 걸림")
+    if lag > max_lag:
+        failures.append(f"생성 중 이벤트 루프가 {lag * 1000:.0f}ms 동안 막힘")
+    return failures
+
+
+async def check_coalescing(parallel: int, latency: float) -> List[str]:
+    failures = []
+
+    service, model = make_service(parallel, latency)
+    await asyncio.gather(*(
+        service.generate_seo_title(TitleGenerationRequest(topic="인기 주제"))
+        for _ in range(parallel)
+    ))
+    print(f"같은 요청 {parallel}개: upstream 호출 {model.calls}회 ({service.single_flight.stats()})")
+    if model.calls != 1:
+        failures.append(f"같은 요청 {parallel}개가 upstream을 {model.calls}회 호출함 (기대 1회)")
+
+    service, model = make_service(parallel, latency)
+    await asyncio.gather(*(
+        service.generate_seo_title(TitleGenerationRequest(topic="인기 주제", bypass_cache=True))
+        for _ in range(parallel)
+    ))
+    print(f"bypass_cache 요청 {parallel}개: upstream 호출 {model.calls}회")
+    if model.calls != parallel:
+        failures.append(f"bypass_cache 요청 {parallel}개가 upstream을 {model.calls}회 호출함 (기대 {parallel}회)")
+
+    # 처음 요청한 쪽이 취소되어도(클라이언트 연결 종료) 함께 기다리던 요청은 결과를 받아야 함
+    service, model = make_service(parallel, latency)
+    tasks = [
+        asyncio.create_task(service.generate_seo_title(TitleGenerationRequest(topic="취소 주제")))
+        for _ in range(parallel)
+    ]
+    await asyncio.sleep(latency / 10)
+    tasks[0].cancel()
+    results = await asyncio.gather(*tasks[1:], return_exceptions=True)
+    errors = [result for result in results if isinstance(result, BaseException)]
+    print(f"첫 요청 취소 후 나머지 {parallel - 1}개: 실패 {len(errors)}개, upstream 호출 {model.calls}회")
+    if errors:
+        failures.append(f"첫 요청이 취소되자 함께 기다리던 요청 {len(errors)}개가 실패함 ({errors[0]!r})")
+    return failures
+
+
+async def check_reserve(parallel: int, latency: float, tolerance: float, reserve: int) -> List[str]:
+    service, model = make_service(parallel, latency, reserve)
+
+    # 동시 호출 한도의 두 배만큼 BULK 호출을 넣어 예약분이 없으면 슬롯이 모두 차도록 함
+    bulk = [
+        asyncio.create_task(service._generate(f"본문 {i}", Priority.BULK, 100, latency * 10, "bench", 'section'))
+        for i in range(parallel * 2)
+    ]
+    await asyncio.sleep(latency / 10)
+    start = time.perf_counter()
+    response = await service.generate_seo_title(TitleGenerationRequest(topic="다이어트", bypass_cache=True))
+    elapsed = time.perf_counter() - start
+    stats = service.scheduler.stats()['priorities']['bulk']
+    await asyncio.gather(*bulk)
+
+    print(f"BULK 호출 {parallel * 2}개 진행 중 제목 요청: {elapsed:.2f}초 (예약 슬롯 {reserve}개, 그때 BULK 동시 호출 {stats['active']}개)")
+    failures = []
+    if response.is_fallback or elapsed > latency * tolerance:
+        failures.append(f"BULK 호출이 슬롯을 채운 동안 제목 요청이 {elapsed:.2f}초 걸림 (대체 응답: {response.is_fallback})")
+    if stats['active'] > parallel - reserve:
+        failures.append(f"BULK 호출이 예약분을 침범해 {stats['active']}개 동시 진행")
+    return failures
+
+
+async def run(parallel: int, latency: float, tolerance: float, max_lag: float, reserve: int) -> List[str]:
+    failures = await check_parallel(parallel, latency, tolerance, max_lag)
+    failures += await check_coalescing(parallel, latency)
+    failures += await check_reserve(parallel, latency, tolerance, reserve)
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--parallel", type=int, default=8)
+    parser.add_argument("--latency", type=float, default=1.0)
+    parser.add_argument("--tolerance", type=float, default=1.5, help="동시 요청 시간이 단일 요청 시간의 몇 배까지 허용되는지")
+    parser.add_argument("--max-lag-ms", type=float, default=100.0, help="생성 중 허용하는 이벤트 루프 최대 지연 (ms)")
+    parser.add_argument("--reserve", type=int, default=2, help="INTERACTIVE 호출 몫으로 남겨 둘 슬롯 수")
+    args = parser.parse_args()
+    failures = asyncio.run(run(args.parallel, args.latency, args.tolerance, args.max_lag_ms / 1000, args.reserve))
+    for failure in failures:
+        print(f"실패: {failure}")
+    sys.exit(1 if failures else 0)
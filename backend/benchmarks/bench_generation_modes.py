@@ -0,0 +1,68 @@
+"""single 모드와 fan_out 모드의 콘텐츠 생성 시간을 비교합니다.
+
+가짜 모델은 출력 글자 수에 비례해 응답 시간이 늘어나므로, 한 번에 긴 글을 쓰는
+single 모드와 섹션을 동시에 쓰는 fan_out 모드의 차이를 볼 수 있습니다.
+SEO 보정(섹션 재생성) 시간이 섞이지 않도록 기본으로 보정을 끄고(--repair-rounds 0) 측정합니다.
+
+실행: python -m benchmarks.bench_generation_modes (backend 디렉터리에서)
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from app.config import settings
+from app.models import ContentGenerationRequest, GenerationMode
+from app.services import GeminiService
+from benchmarks.fake_model import FakeGenerativeModel
+
+SECTION_TEXT = "다이어트 식단은 꾸준함이 중요합니다. 다이어트 방법과 다이어트 효과를 함께 살펴봅니다. " * 6
+
+
+def respond(prompt: str) -> str:
+    if '"introduction"' in prompt:
+        # single 모드 (JSON 출력): 전체 글을 한 번에 작성
+        body = [f"## 소제목 {i}\n{SECTION_TEXT}" for i in range(1, 5)]
+        return json.dumps({"introduction": SECTION_TEXT, "body": body, "conclusion": SECTION_TEXT}, ensure_ascii=False)
+    if "[도입부]\n(도입부 내용)" in prompt:
+        # single 모드: 전체 글을 한 번에 작성
+        body = "".join(f"[본문{i}]\n## 소제목 {i}\n{SECTION_TEXT}\n\n" for i in range(1, 5))
+        return f"[도입부]\n{SECTION_TEXT}\n\n{body}[결론]\n{SECTION_TEXT}"
+    if "소제목만 한 줄에 하나씩" in prompt:
+        return "\n".join(f"소제목 {i}" for i in range(1, 5))
+    return SECTION_TEXT
+
+
+async def measure(mode: GenerationMode, latency: float, seconds_per_char: float) -> float:
+    service = GeminiService()
+    model = FakeGenerativeModel(latency=latency, responder=respond, seconds_per_char=seconds_per_char)
+    service.model_factory = lambda name: model
+    request = ContentGenerationRequest(
+        topic="다이어트",
+        title="다이어트 완벽 가이드",
+        content_type="informational",
+        primary_keyword="다이어트",
+        sub_keywords=["다이어트 방법", "다이어트 효과", "다이어트 식단"],
+        generation_mode=mode,
+    )
+    start = time.perf_counter()
+    result = await service.generate_content(request)
+    elapsed = time.perf_counter() - start
+    print(f"{mode.value:<8} {elapsed:6.2f}초  글자 수 {result.total_char_count:,}  모델 호출 {model.calls}회  보정 {result.repair_rounds}회")
+    return elapsed
+
+
+async def run(latency: float, seconds_per_char: float) -> None:
+    single = await measure(GenerationMode.SINGLE, latency, seconds_per_char)
+    fan_out = await measure(GenerationMode.FAN_OUT, latency, seconds_per_char)
+    print(f"fan_out / single = {fan_out / single:.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--latency", type=float, default=0.5, help="호출당 고정 지연 (초)")
+    parser.add_argument("--seconds-per-char", type=float, default=0.001, help="출력 글자당 생성 시간 (초)")
+    parser.add_argument("--repair-rounds", type=int, default=0, help="SEO 보정 최대 횟수 (0이면 생성 방식만 비교)")
+    args = parser.parse_args()
+    settings.repair_max_rounds = args.repair_rounds
+    asyncio.run(run(args.latency, args.seconds_per_char))
@@ -0,0 +1,58 @@
+"""기존 str.count 방식과 KeywordMatcher의 키워드 집계 비용을 비교합니다.
+
+KeywordMatcher는 어절 안의 부분 일치를 세지 않도록 정규화와 어절 단위 집계를 하므로,
+그 비용(정규화 + 어절 수)과 키워드 정규식 검색 비용을 나눠서도 보여 줍니다.
+새 초안은 정규화 캐시 없이, 재채점은 같은 초안을 다시 채점할 때(보정 계획, 바뀌지 않은 섹션)의 비용으로
+정규화를 재사용하므로 키워드 검색 비용만 듭니다.
+
+실행: python -m benchmarks.bench_keywords (backend 디렉터리에서)
+"""
+import argparse
+import timeit
+
+from app.keywords import get_matcher, prepare_text
+
+PRIMARY = "다이어트"
+SUBS = ["다이어트 방법", "다이어트 효과", "다이어트 식단"]
+SENTENCE = "다이어트를 시작하려면 다이어트 방법을 먼저 알아야 합니다. 건강한 식단과 운동이 다이어트 효과를 높입니다. "
+
+
+def legacy_counts(content: str):
+    # 기존 _calculate_seo_metrics 의 집계 방식
+    total_words = len(content.split())
+    primary_count = content.lower().count(PRIMARY.lower())
+    sub_count = sum(content.lower().count(keyword.lower()) for keyword in SUBS)
+    return total_words, primary_count, sub_count
+
+
+def matcher_counts(content: str):
+    matches = get_matcher([PRIMARY] + SUBS).find(content)
+    return matches.token_count, matches.count(PRIMARY), sum(matches.count(keyword) for keyword in SUBS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--drafts", type=int, default=5, help="기사 한 편당 채점할 초안 수")
+    args = parser.parse_args()
+
+    for repeat_sentence in (10, 40, 160):
+        content = SENTENCE * repeat_sentence
+        print(f"문서 길이 {len(content):,}자  legacy={legacy_counts(content)}  matcher={matcher_counts(content)}")
+
+        def fresh(func):
+            # 초안마다 새 글이므로 정규화 캐시를 비우고 측정
+            def run():
+                prepare_text.cache_clear()
+                return func()
+            return run
+
+        cases = (
+            ("legacy str.count", lambda: legacy_counts(content)),
+            ("KeywordMatcher 새 초안", fresh(lambda: matcher_counts(content))),
+            ("  정규화 + 어절 수", fresh(lambda: prepare_text(content))),
+            ("KeywordMatcher 재채점", lambda: matcher_counts(content)),
+        )
+        for name, func in cases:
+            elapsed = timeit.timeit(lambda: [func() for _ in range(args.drafts)], number=args.repeat)
+            print(f"  {name:<22} 초안 {args.drafts}개 {elapsed / args.repeat * 1e3:7.3f}ms")
@@ -0,0 +1,124 @@
+"""기존 split 기반 파서와 SectionStreamParser의 처리 시간을 비교합니다.
+
+측정 전에 파서 동작도 확인합니다. 무작위로 나눈 조각을 넣은 결과가 전체를 한 번에 넣은 결과와 같은지,
+본문 중간의 대괄호가 유지되는지, 빠진 섹션이 보고되는지 확인하고 어긋나면 0이 아닌 코드로 종료합니다.
+
+실행: python -m benchmarks.bench_parser [--check-only] (backend 디렉터리에서)
+"""
+import argparse
+import random
+import re
+import sys
+import timeit
+
+from app.parser import SectionStreamParser
+
+
+def legacy_parse(content_text: str):
+    # 기존 GeminiService._parse_generated_content 의 split 기반 로직
+    sections = content_text.split('[')
+    introduction = ""
+    body = []
+    conclusion = ""
+    for section in sections:
+        if section.startswith('도입부]'):
+            introduction = section.replace('도입부]', '').strip()
+        elif section.startswith('본문'):
+            body_content = re.sub(r'본문\d+\]', '', section).strip()
+            if body_content:
+                body.append(body_content)
+        elif section.startswith('결론]'):
+            conclusion = section.replace('결론]', '').strip()
+    return introduction, body, conclusion
+
+
+def stream_parse(content_text: str, chunk_size: int = 0):
+    parser = SectionStreamParser()
+    if chunk_size:
+        for i in range(0, len(content_text), chunk_size):
+            parser.feed(content_text[i:i + chunk_size])
+    else:
+        parser.feed(content_text)
+    parser.close()
+    return parser
+
+
+def random_chunks(text: str, rng: random.Random):
+    position = 0
+    while position < len(text):
+        size = rng.randint(1, 40)
+        yield text[position:position + size]
+        position += size
+
+
+def check(seed: int, rounds: int) -> list:
+    """파서 동작을 확인하고 실패한 항목 설명 목록을 반환합니다."""
+    failures = []
+    rng = random.Random(seed)
+    prose = "식단표는 [참고] 표시를 붙여 두면 좋습니다.\n[팁] 줄 맨 앞의 대괄호도 마커가 아니면 본문입니다. a[0]처럼요.\n"
+    documents = [
+        build_document(3),
+        "서두는 버립니다.\n**[도입부]**\n" + prose + "## [본문1]: 식단\n" + prose + "[본문2]\n" + prose + "[결론]\n" + prose,
+        # 본문2와 결론이 빠진 응답
+        "[도입부]\n" + prose + "[본문1]\n" + prose + "[본문3]\n" + prose + "[본문4]\n" + prose,
+    ]
+    for number, document in enumerate(documents, start=1):
+        whole = stream_parse(document)
+        for _ in range(rounds):
+            parser = SectionStreamParser()
+            events = [event for chunk in random_chunks(document, rng) for event in parser.feed(chunk)]
+            events += parser.close()
+            if parser.sections != whole.sections:
+                failures.append(f"문서 {number}: 무작위 조각 파싱 결과가 전체 파싱 결과와 다름")
+                break
+            if {event.section: event.content for event in events} != whole.sections:
+                failures.append(f"문서 {number}: 조각 파싱 중 보낸 섹션이 최종 섹션과 다름")
+                break
+
+    prose_parsed = stream_parse(documents[1]).sections
+    if any(not all(text in content for text in ("[참고]", "[팁]", "a[0]")) for content in prose_parsed.values()):
+        failures.append("본문 중간의 대괄호가 유지되지 않음")
+    if set(prose_parsed) != {"도입부", "본문1", "본문2", "결론"}:
+        failures.append(f"마크다운으로 꾸민 마커를 인식하지 못함: {sorted(prose_parsed)}")
+    missing = stream_parse(documents[2]).missing_sections(4)
+    if missing != ["본문2", "결론"]:
+        failures.append(f"빠진 섹션 보고가 다름: {missing}")
+    return failures
+
+
+def build_document(paragraph_repeat: int) -> str:
+    paragraph = "다이어트 식단은 꾸준함이 중요합니다. 하루 세 끼를 규칙적으로 드세요.\n" * paragraph_repeat
+    parts = ["[도입부]\n" + paragraph]
+    parts += [f"[본문{i}]\n## {i}. 소제목\n" + paragraph for i in range(1, 5)]
+    parts.append("[결론]\n" + paragraph)
+    return "\n".join(parts)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--check-rounds", type=int, default=200, help="문서마다 무작위로 나눠 파싱해 볼 횟수")
+    parser.add_argument("--check-only", action="store_true", help="동작 확인만 하고 시간은 측정하지 않음")
+    args = parser.parse_args()
+
+    failures = check(args.seed, args.check_rounds)
+    for failure in failures:
+        print(f"실패: {failure}")
+    if failures:
+        sys.exit(1)
+    print(f"파서 동작 확인 통과 (문서 3개 x 무작위 분할 {args.check_rounds}회)")
+    if args.check_only:
+        sys.exit(0)
+
+    for paragraph_repeat in (5, 20, 80):
+        document = build_document(paragraph_repeat)
+        cases = {
+            "legacy split": lambda: legacy_parse(document),
+            "stream (전체)": lambda: stream_parse(document),
+            "stream (64자 조각)": lambda: stream_parse(document, 64),
+        }
+        print(f"문서 길이 {len(document):,}자")
+        for name, func in cases.items():
+            elapsed = timeit.timeit(func, number=args.repeat)
+            print(f"  {name:<16} {elapsed / args.repeat * 1e6:8.1f}µs/회")
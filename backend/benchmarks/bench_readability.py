@@ -0,0 +1,49 @@
+"""textstat.flesch_reading_ease 와 한글 가독성 채점기의 결과와 처리 시간을 비교합니다.
+
+textstat은 앱 의존성에서 제외되었으므로 비교하려면 별도로 설치하세요 (pip install textstat).
+실행: python -m benchmarks.bench_readability (backend 디렉터리에서)
+"""
+import argparse
+import timeit
+
+from app.readability import score_many, score_readability
+
+try:
+    import textstat
+except ImportError:
+    textstat = None
+
+PARAGRAPH = (
+    "다이어트를 시작할 때 가장 중요한 것은 꾸준함입니다. "
+    "하루 세 끼를 규칙적으로 먹고, 간식은 줄이는 것이 좋습니다. "
+    "운동은 처음부터 무리하지 말고 걷기부터 시작해보세요.\n\n"
+)
+
+
+def build_article(target_chars: int) -> str:
+    return PARAGRAPH * (target_chars // len(PARAGRAPH) + 1)
+
+
+def measure(scorer, articles) -> float:
+    """글마다 한 번씩 채점한 평균 시간(ms). textstat의 lru_cache를 피하려고 서로 다른 글을 씁니다."""
+    elapsed = timeit.timeit(lambda: [scorer(article) for article in articles], number=1)
+    return elapsed / len(articles) * 1e3
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=100)
+    args = parser.parse_args()
+
+    for target in (1000, 3000, 10000):
+        article = build_article(target)
+        articles = [f"{article}{i}번째 글입니다." for i in range(args.repeat)]
+        print(f"문서 길이 {len(article):,}자  score_readability={score_readability(article)}", end="")
+        if textstat:
+            print(f"  textstat={textstat.flesch_reading_ease(article)}")
+            print(f"  textstat           {measure(textstat.flesch_reading_ease, articles):8.3f}ms/글")
+        else:
+            print("  (textstat 미설치)")
+        print(f"  score_readability  {measure(score_readability, articles):8.3f}ms/글")
+        elapsed = timeit.timeit(lambda: score_many(articles), number=1)
+        print(f"  score_many         {elapsed / len(articles) * 1e3:8.3f}ms/글")
@@ -0,0 +1,96 @@
+import asyncio
+import random
+import time
+from typing import Callable, Optional
+
+
+class FakeModelError(Exception):
+    """error_rate에 따라 발생시키는 가짜 API 오류"""
+
+
+class FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class FakeStreamResponse:
+    """응답을 일정 크기의 조각으로 나눠 지연 시간에 걸쳐 흘려보냅니다."""
+
+    def __init__(self, text: str, latency: float, chunk_size: int):
+        self.chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)] or [""]
+        self.delay = latency / len(self.chunks)
+
+    async def __aiter__(self):
+        for chunk in self.chunks:
+            await asyncio.sleep(self.delay)
+            yield FakeResponse(chunk)
+
+
+class FakeGenerativeModel:
+    """실제 API 대신 일정 시간 대기 후 고정 응답을 돌려주는 모델
+
+    seed를 주면 지연 시간 편차와 오류 발생 여부가 호출 순서에 대해 재현 가능합니다.
+    """
+
+    def __init__(
+        self,
+        latency: float = 1.0,
+        text: str = "테스트 응답",
+        chunk_size: int = 64,
+        responder: Optional[Callable[[str], str]] = None,
+        seconds_per_char: float = 0.0,
+        error_rate: float = 0.0,
+        response_size: Optional[int] = None,
+        jitter: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.latency = latency
+        self.text = text
+        self.chunk_size = chunk_size
+        # 프롬프트별로 다른 응답이 필요할 때 사용
+        self.responder = responder
+        # 출력 길이에 비례하는 생성 시간 (토큰 생성 속도 흉내)
+        self.seconds_per_char = seconds_per_char
+        # 호출 중 이 비율만큼 지연 시간 절반 뒤 FakeModelError 발생
+        self.error_rate = error_rate
+        # 고정 응답(text)을 이 글자 수로 반복/절단 (responder 응답에는 적용하지 않음)
+        self.response_size = response_size
+        # 지연 시간을 ±jitter 비율만큼 무작위로 흔듦
+        self.jitter = jitter
+        self.random = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+
+    def _respond(self, prompt) -> tuple:
+        self.calls += 1
+        if self.responder:
+            text = self.responder(prompt)
+        elif self.response_size is not None:
+            text = (self.text * (self.response_size // max(len(self.text), 1) + 1))[:self.response_size]
+        else:
+            text = self.text
+        latency = self.latency + len(text) * self.seconds_per_char
+        if self.jitter:
+            latency *= 1 + self.random.uniform(-self.jitter, self.jitter)
+        failed = self.random.random() < self.error_rate
+        if failed:
+            self.errors += 1
+        return text, latency, failed
+
+    def generate_content(self, prompt, **kwargs) -> FakeResponse:
+        text, latency, failed = self._respond(prompt)
+        if failed:
+            time.sleep(latency / 2)
+            raise FakeModelError("가짜 모델 오류")
+        time.sleep(latency)
+        return FakeResponse(text)
+
+    async def generate_content_async(self, prompt, stream: bool = False, **kwargs):
+        text, latency, failed = self._respond(prompt)
+        if failed:
+            await asyncio.sleep(latency / 2)
+            raise FakeModelError("가짜 모델 오류")
+        if stream:
+            return FakeStreamResponse(text, latency, self.chunk_size)
+        await asyncio.sleep(latency)
+        return FakeResponse(text)
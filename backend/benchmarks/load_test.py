@@ -0,0 +1,248 @@
+"""가짜 모델로 제목/키워드/본문 API에 동시 요청 수를 늘려 가며 부하를 주고 결과를 JSON으로 저장합니다.
+
+실제 할당량을 쓰지 않도록 genai.GenerativeModel을 FakeGenerativeModel로 바꾸고,
+앱은 httpx ASGI 전송으로 같은 프로세스에서 호출합니다. 단계마다 p50/p95/p99 지연 시간,
+처리량(요청/초), 이벤트 루프 지연을 기록하므로 버전 간 결과 파일을 비교해 성능 저하를 찾을 수 있습니다.
+
+실행: python -m benchmarks.load_test --concurrency 1,8,32 --output load_test.json (backend 디렉터리에서)
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import os
+import platform
+import subprocess
+import tempfile
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, List, Sequence
+
+from benchmarks.fake_model import FakeGenerativeModel
+
+# SEO 기준(키워드 포함률 2-5%, 가독성 70점 이상)을 통과하는 두 문단 (약 330자)
+PARAGRAPH = (
+    "하루 세 끼를 규칙적으로 먹는 습관이 중요합니다. 아침을 거르면 점심에 과식하기 쉽습니다. "
+    "다이어트 기간에는 채소와 단백질을 충분히 챙겨야 합니다. 물은 하루 여덟 잔 정도 마시는 것이 좋습니다. "
+    "저녁은 잠들기 세 시간 전에 가볍게 마치는 편이 좋습니다. 간식이 당길 때는 견과류를 조금 드세요.\n\n"
+    "식단 기록을 남기면 먹는 양을 쉽게 파악할 수 있습니다. 가벼운 산책을 매일 하면 효과가 커집니다. "
+    "잠을 충분히 자는 것도 체중 관리에 도움이 됩니다. 목표는 작게 나누어 천천히 세우는 것이 좋습니다. "
+    "주말에도 평소와 비슷한 시간에 일어나 보세요. 작은 변화가 모이면 큰 차이를 만듭니다.\n\n"
+)
+SECTION_COUNT = 6  # 도입부 + 본문 4개 + 결론
+
+
+def make_responder(content_chars: int) -> Callable[[str], str]:
+    section = PARAGRAPH * max(1, round(content_chars / SECTION_COUNT / len(PARAGRAPH)))
+
+    def respond(prompt: str) -> str:
+        if '"titles"' in prompt:
+            titles = [f"다이어트 식단 완벽 가이드 {i}: 전문가가 알려주는 핵심 포인트" for i in range(1, 6)]
+            return json.dumps({"titles": titles}, ensure_ascii=False)
+        if "제목만 출력" in prompt:
+            return "다이어트 식단 완벽 가이드: 전문가가 알려주는 핵심 포인트"
+        if '"primary_keyword"' in prompt:
+            return json.dumps({"primary_keyword": "다이어트", "sub_keywords": ["식단", "운동", "건강"]}, ensure_ascii=False)
+        if "핵심키워드:" in prompt:
+            return "핵심키워드: 다이어트\n보조키워드: 식단, 운동, 건강"
+        if "소제목만 한 줄에 하나씩" in prompt:
+            return "\n".join(f"소제목 {i}" for i in range(1, 5))
+        if '"introduction"' in prompt:
+            body = [f"## 소제목 {i}\n{section}" for i in range(1, 5)]
+            return json.dumps({"introduction": section, "body": body, "conclusion": section}, ensure_ascii=False)
+        if "[도입부]\n(도입부 내용)" in prompt:
+            body = "".join(f"[본문{i}]\n## 소제목 {i}\n{section}" for i in range(1, 5))
+            return f"[도입부]\n{section}{body}[결론]\n{section}"
+        # fan_out 섹션 생성과 보정 요청
+        return section
+
+    return respond
+
+
+def configure_environment(args: argparse.Namespace) -> FakeGenerativeModel:
+    """앱을 처음 사용하기 전에 호출해야 합니다. 설정과 서비스 싱글턴, 모델 클라이언트가 처음 사용할 때 만들어지기 때문입니다."""
+    os.environ["GEMINI_API_KEY"] = "load-test"
+    os.environ["GEMINI_MAX_CONCURRENCY"] = str(args.model_concurrency)
+    if not args.respect_quota:
+        os.environ["GEMINI_REQUESTS_PER_MINUTE"] = "0"
+        os.environ["GEMINI_TOKENS_PER_MINUTE"] = "0"
+    os.environ["CACHE_BACKEND"] = "memory"
+    os.environ["JOB_WORKER_CONCURRENCY"] = "0"
+    os.environ["JOB_STORE_PATH"] = os.path.join(tempfile.mkdtemp(prefix="aimax-load-"), "jobs.sqlite3")
+
+    import google.generativeai as genai
+
+    model = FakeGenerativeModel(
+        latency=args.latency,
+        responder=make_responder(args.content_chars),
+        seconds_per_char=args.seconds_per_char,
+        error_rate=args.error_rate,
+        jitter=args.jitter,
+        seed=args.seed,
+    )
+    # 작업별 모델 이름과 관계없이 같은 가짜 모델 사용
+    genai.GenerativeModel = lambda *a, **kw: model
+    return model
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """nearest-rank 방식 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q / 100 * len(ordered)) - 1)]
+
+
+class LoopLagMonitor:
+    """일정 간격으로 잠들었다 깨어나는 시간이 얼마나 늦어지는지로 이벤트 루프가 막힌 정도를 측정합니다."""
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.samples: List[float] = []
+
+    async def run(self) -> None:
+        while True:
+            start = time.perf_counter()
+            await asyncio.sleep(self.interval)
+            self.samples.append(max(0.0, time.perf_counter() - start - self.interval))
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "p50_ms": round(percentile(self.samples, 50) * 1000, 3),
+            "p99_ms": round(percentile(self.samples, 99) * 1000, 3),
+            "max_ms": round(max(self.samples, default=0.0) * 1000, 3),
+        }
+
+
+TOPICS = itertools.count()
+
+
+def title_payload(i: int) -> Dict[str, Any]:
+    return {"topic": f"다이어트 {i}"}
+
+
+def content_payload(i: int) -> Dict[str, Any]:
+    return {
+        "topic": f"다이어트 {i}",
+        "title": f"다이어트 식단 가이드 {i}",
+        "content_type": "informational",
+        "primary_keyword": "다이어트",
+        "sub_keywords": ["식단", "운동", "건강"],
+    }
+
+
+ENDPOINTS = {
+    "/api/generate-title": title_payload,
+    "/api/recommend-keywords": title_payload,
+    "/api/generate-content": content_payload,
+}
+
+
+async def run_level(client, model: FakeGenerativeModel, endpoint: str, concurrency: int, total: int) -> Dict[str, Any]:
+    payload = ENDPOINTS[endpoint]
+    pending = iter(range(total))
+    latencies: List[float] = []
+    status_codes: Counter = Counter()
+    fallbacks = 0
+
+    async def worker() -> None:
+        nonlocal fallbacks
+        for _ in pending:
+            # 매번 다른 주제를 보내 캐시와 중복 호출 병합 없이 측정
+            start = time.perf_counter()
+            response = await client.post(endpoint, json=payload(next(TOPICS)))
+            latencies.append(time.perf_counter() - start)
+            status_codes[response.status_code] += 1
+            if response.status_code == 200 and response.json().get("is_fallback"):
+                fallbacks += 1
+
+    monitor = LoopLagMonitor()
+    monitor_task = asyncio.create_task(monitor.run())
+    calls_before = model.calls
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    monitor_task.cancel()
+
+    return {
+        "endpoint": endpoint,
+        "concurrency": concurrency,
+        "requests": total,
+        "elapsed_s": round(elapsed, 3),
+        "throughput_rps": round(total / elapsed, 2),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 1),
+        "max_ms": round(max(latencies) * 1000, 1),
+        "status_codes": {str(code): count for code, count in sorted(status_codes.items())},
+        "fallbacks": fallbacks,
+        "model_calls": model.calls - calls_before,
+        "loop_lag": monitor.summary(),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+async def run(args: argparse.Namespace, model: FakeGenerativeModel) -> Dict[str, Any]:
+    import httpx
+    from app.main import app
+
+    endpoints = [endpoint for endpoint in ENDPOINTS if endpoint.rsplit("-", 1)[-1] in args.endpoints]
+    results = []
+    async with httpx.AsyncClient(app=app, base_url="http://load-test", timeout=None) as client:
+        for concurrency in args.concurrency:
+            for endpoint in endpoints:
+                result = await run_level(client, model, endpoint, concurrency, max(args.requests, concurrency))
+                results.append(result)
+                print(
+                    f"{endpoint:<26} 동시 {concurrency:>4}  {result['throughput_rps']:>8.1f} req/s  "
+                    f"p50 {result['p50_ms']:>8.1f}ms  p95 {result['p95_ms']:>8.1f}ms  p99 {result['p99_ms']:>8.1f}ms  "
+                    f"루프 지연 p99 {result['loop_lag']['p99_ms']:>6.2f}ms  상태 {result['status_codes']}"
+                )
+
+    return {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "python": platform.python_version(),
+            "settings": {
+                key: value for key, value in vars(args).items() if key != "output"
+            },
+        },
+        "results": results,
+    }
+
+
+def parse_int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=parse_int_list, default=[1, 4, 16, 64], help="쉼표로 구분한 동시 요청 수 단계")
+    parser.add_argument("--requests", type=int, default=64, help="단계별 엔드포인트당 요청 수 (동시 요청 수보다 작으면 동시 요청 수)")
+    parser.add_argument("--endpoints", type=lambda v: v.split(","), default=["title", "keywords", "content"], help="title,keywords,content 중 선택")
+    parser.add_argument("--latency", type=float, default=0.2, help="모델 호출당 고정 지연 (초)")
+    parser.add_argument("--seconds-per-char", type=float, default=0.0, help="출력 글자당 생성 시간 (초)")
+    parser.add_argument("--jitter", type=float, default=0.2, help="지연 시간 편차 비율")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모델 호출 실패 비율")
+    parser.add_argument("--content-chars", type=int, default=2000, help="본문 응답 글자 수")
+    parser.add_argument("--model-concurrency", type=int, default=0, help="GEMINI_MAX_CONCURRENCY (0이면 제한 없음)")
+    parser.add_argument("--respect-quota", action="store_true", help="설정된 RPM/TPM 한도를 그대로 적용")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="load_test_results.json")
+    args = parser.parse_args()
+
+    model = configure_environment(args)
+    report = asyncio.run(run(args, model))
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"결과 저장: {args.output}")
@@ -0,0 +1,213 @@
+"""주제 목록으로 백엔드에서 글을 생성하고, 생성되는 대로 네이버 카페에 임시등록합니다.
+
+생성(제목/키워드 → 본문)은 백엔드에 동시에 여러 건 요청하고, 완성된 글은 크기가 정해진 대기열을 거쳐
+브라우저 작업자에게 넘어갑니다. N+1번째 글을 생성하는 동안 N번째 글을 등록하므로 전체 시간이
+생성 시간과 등록 시간의 합이 아니라 둘 중 긴 쪽에 가까워집니다. 등록이 밀리면 대기열이 차서 생성도 잠시 멈추고,
+브라우저 작업자가 모두 종료되면(로그인 실패 등) 남은 주제는 생성하지 않습니다.
+
+실행: python generate_and_publish.py --topics 주제목록.xlsx --backend-url http://localhost:8000 [--headless]
+(주제 목록: A열 주제, B열 글의 성격(informational, sales), C열 사진 경로, D열 장소명. 나머지 옵션은 naver_writing.py와 같음)
+"""
+import argparse
+import asyncio
+import json
+import queue
+import re
+import threading
+import time
+
+import httpx
+
+from ledger import Ledger
+from naver_writing import RowResult, add_publisher_arguments, peek_rows, resumable_rows, run_publisher
+from row_source import Row, read_topic_rows
+
+HEADING = re.compile(r'^#+\s*', re.MULTILINE)
+
+
+class TopicLedger(Ledger):
+    """생성할 때마다 달라지는 제목 대신 (행 번호, 주제)로 행을 구분하는 처리 기록"""
+
+    def __init__(self, path):
+        super().__init__(path)
+        self.topics = {}
+
+    def _key(self, entry):
+        return entry['row'], entry.get('topic')
+
+    def _append(self, entry):
+        entry.setdefault('topic', self.topics.get(entry['row']))
+        super()._append(entry)
+
+    def status(self, row):
+        entry = self.last.get((row.index, row.topic))
+        return entry['status'] if entry else None
+
+
+class GenerationError(Exception):
+    pass
+
+
+def article_text(article):
+    """ContentGenerationResponse의 섹션을 카페 본문으로 이어 붙입니다. 마크다운 소제목 기호는 뺍니다."""
+    sections = article['sections']
+    parts = [sections['introduction'], *sections['body'], sections['conclusion']]
+    return '\n\n'.join(HEADING.sub('', part).strip() for part in parts if part.strip())
+
+
+async def _post(client, path, payload):
+    response = await client.post(path, json=payload)
+    if response.status_code != 200:
+        try:
+            detail = response.json().get('detail')
+        except ValueError:
+            detail = response.text
+        raise GenerationError(f"{path} {response.status_code}: {json.dumps(detail, ensure_ascii=False) if not isinstance(detail, str) else detail}")
+    return response.json()
+
+
+async def generate_article(client, topic_row, args):
+    # 제목과 키워드는 서로 기다릴 필요가 없으므로 함께 요청
+    title, keywords = await asyncio.gather(
+        _post(client, '/api/generate-title', {'topic': topic_row.topic}),
+        _post(client, '/api/recommend-keywords', {'topic': topic_row.topic}),
+    )
+    article = await _post(client, '/api/generate-content', {
+        'topic': topic_row.topic,
+        'title': title['title'],
+        'content_type': topic_row.content_type or args.content_type,
+        'primary_keyword': keywords['primary_keyword'],
+        'sub_keywords': keywords['sub_keywords'],
+        'generation_mode': args.generation_mode,
+    })
+    if article.get('is_fallback') and article.get('fallback_source') == 'simulation' and not args.allow_fallback:
+        raise GenerationError(f"백엔드가 대체 응답을 반환했습니다 ({article.get('fallback_reason')})")
+    return article
+
+
+def _put_ready(ready, row, halted):
+    """등록 대기열에 자리가 날 때까지 기다려 넣습니다. 등록이 멈추면(halted) 넣지 않고 False를 반환합니다."""
+    while not halted.is_set():
+        try:
+            ready.put(row, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+
+async def _generate_all(topic_rows, args, ready, failures, generation_seconds, ledger, halted):
+    semaphore = asyncio.Semaphore(args.generate_concurrency)
+    tasks = set()
+
+    async def generate(topic_row):
+        # 생성 자리는 등록 대기열에 글을 넣은 뒤에 반환하므로, 대기열이 가득 차 있는 동안은 새 글 생성도 멈춤
+        try:
+            started = time.perf_counter()
+            try:
+                article = await generate_article(client, topic_row, args)
+            except (GenerationError, httpx.HTTPError, KeyError) as e:
+                print(f"{topic_row.index}번째 행 '{topic_row.topic}' 글 생성 실패: {e}")
+                failure = RowResult(topic_row.index, topic_row.topic, False, f"글 생성 오류: {e}")
+                ledger.record(failure)
+                failures.append(failure)
+                return
+            finally:
+                generation_seconds[topic_row.index] = time.perf_counter() - started
+            print(f"{topic_row.index}번째 행 글 생성 완료 ({generation_seconds[topic_row.index]:.1f}초): {article['title']}")
+            row = Row(topic_row.index, article['title'], article_text(article), topic_row.image_path, topic_row.location)
+            # 등록 대기열이 가득 차면 자리가 날 때까지 (이벤트 루프를 막지 않고) 대기
+            if not await asyncio.to_thread(_put_ready, ready, row, halted):
+                print(f"{topic_row.index}번째 행은 등록 작업자가 없어 등록하지 않습니다. --resume으로 다시 처리할 수 있습니다.")
+        finally:
+            semaphore.release()
+
+    async with httpx.AsyncClient(base_url=args.backend_url, timeout=args.request_timeout) as client:
+        # 주제 목록도 생성할 수 있는 만큼만 읽음
+        for topic_row in topic_rows:
+            await semaphore.acquire()
+            if halted.is_set():
+                # 등록 작업자가 모두 종료되었으면 남은 주제는 생성하지 않음 (생성 중인 글만 마무리)
+                semaphore.release()
+                break
+            task = asyncio.create_task(generate(topic_row))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+        if tasks:
+            await asyncio.gather(*tasks)
+
+
+def start_generation(topic_rows, args, ready, failures, generation_seconds, ledger, halted):
+    def run():
+        try:
+            asyncio.run(_generate_all(topic_rows, args, ready, failures, generation_seconds, ledger, halted))
+        except Exception as e:
+            print(f"글 생성 중 오류 발생: {e}")
+        finally:
+            _put_ready(ready, None, halted)
+
+    thread = threading.Thread(target=run, name='generator', daemon=True)
+    thread.start()
+    return thread
+
+
+def generated_rows(ready, halted):
+    """생성된 글을 차례로 내줍니다. 등록이 멈추면(halted) 이미 생성되어 대기열에 있는 글까지만 내주고 끝냅니다."""
+    while True:
+        try:
+            row = ready.get(timeout=0.5)
+        except queue.Empty:
+            if halted.is_set():
+                return
+            continue
+        if row is None:
+            return
+        yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="주제 목록으로 글을 생성해 네이버 카페에 임시등록")
+    parser.add_argument('--topics', required=True, help="주제 목록 파일 (xlsx 또는 csv, 첫 줄은 머리글)")
+    parser.add_argument('--backend-url', default='http://localhost:8000')
+    parser.add_argument('--content-type', default='informational', choices=['informational', 'sales'], help="B열이 비어 있을 때 글의 성격")
+    parser.add_argument('--generation-mode', default='single', choices=['single', 'fan_out'])
+    parser.add_argument('--generate-concurrency', type=int, default=4, help="동시에 진행할 글 생성 요청 수")
+    parser.add_argument('--buffer', type=int, default=4, help="등록을 기다릴 수 있는 생성 완료 글 수")
+    parser.add_argument('--request-timeout', type=float, default=120.0, help="백엔드 요청 제한 시간 (초)")
+    parser.add_argument('--allow-fallback', action='store_true', help="백엔드가 모델 대신 만든 대체(시뮬레이션) 글도 등록")
+    add_publisher_arguments(parser)
+    args = parser.parse_args()
+
+    ledger = TopicLedger(args.ledger or f"{args.topics}.ledger.jsonl")
+    topic_rows = read_topic_rows(args.topics)
+    if args.resume:
+        topic_rows = resumable_rows(topic_rows, ledger, args.retry_interrupted)
+    topic_rows = peek_rows(topic_rows)
+    if topic_rows is None:
+        return
+
+    def remember_topics(rows):
+        # 등록 결과를 주제와 함께 기록하도록 행 번호별 주제 보관
+        for topic_row in rows:
+            ledger.topics[topic_row.index] = topic_row.topic
+            yield topic_row
+
+    ready = queue.Queue(maxsize=max(1, args.buffer))
+    failures = []
+    generation_seconds = {}
+    # 등록 작업자가 모두 종료되거나 중단 요청이 있으면 설정되어 글 생성을 멈춤
+    halted = threading.Event()
+    started = time.perf_counter()
+    start_generation(remember_topics(topic_rows), args, ready, failures, generation_seconds, ledger, halted)
+    results, _ = run_publisher(generated_rows(ready, halted), args, ledger, failures, halted)
+
+    posting_seconds = sum(result.seconds for result in results if result.worker is not None)
+    print(
+        f"전체 {time.perf_counter() - started:.1f}초 "
+        f"(글 생성 합계 {sum(generation_seconds.values()):.1f}초, 등록 합계 {posting_seconds:.1f}초, "
+        f"생성 동시 {args.generate_concurrency}건, 등록 작업자 {args.workers}명)"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,79 @@
+"""행별 처리 결과를 남기는 기록 파일(JSON Lines).
+
+행을 시작할 때 started, 끝나면 posted 또는 failed(사유, 스크린샷 경로)를 한 줄씩 덧붙이고 바로 디스크에 씁니다.
+posted 기록의 warnings에는 임시등록은 되었지만 넣지 못한 사진/장소의 오류가 남습니다.
+중간에 멈춘 실행을 --resume으로 이어 갈 때 이 기록으로 이미 등록한 행을 건너뜁니다.
+"""
+import json
+import os
+import threading
+import time
+
+STARTED = 'started'
+POSTED = 'posted'
+FAILED = 'failed'
+
+
+class Ledger:
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        # 행 키별 마지막 기록
+        self.last = {}
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # 기록 도중 중단되어 잘린 줄
+                    self.last[self._key(entry)] = entry
+        self._file = None
+
+    def _key(self, entry):
+        # 같은 행 번호라도 제목이 바뀌었으면 다른 글로 봄
+        return entry['row'], entry['title']
+
+    def _append(self, entry):
+        entry['at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        line = json.dumps(entry, ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'a', encoding='utf-8')
+                if self._file.tell() and not self._ends_with_newline():
+                    # 잘린 마지막 줄과 새 기록이 한 줄로 붙지 않도록
+                    self._file.write('\n')
+            self._file.write(line + '\n')
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self.last[self._key(entry)] = entry
+
+    def _ends_with_newline(self):
+        with open(self.path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+
+    def start(self, row, worker=None, account=None):
+        self._append({'row': row.index, 'title': row.title, 'status': STARTED, 'worker': worker, 'account': account})
+
+    def record(self, result):
+        self._append({
+            'row': result.index,
+            'title': result.title,
+            'status': POSTED if result.ok else FAILED,
+            'error': result.error,
+            'screenshot': result.screenshot,
+            'warnings': result.warnings,
+            'seconds': round(result.seconds, 2),
+            'worker': result.worker,
+            'account': result.account,
+        })
+
+    def status(self, row):
+        """행의 마지막 상태 (기록이 없거나 제목이 바뀌었으면 None)"""
+        entry = self.last.get(self._key({'row': row.index, 'title': row.title}))
+        return entry['status'] if entry else None
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
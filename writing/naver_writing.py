@@ -1,214 +1,360 @@
-import time
+"""엑셀의 각 행(제목, 내용, 사진 경로, 장소명)으로 네이버 카페에 글을 임시등록합니다.
+
+고정 대기(time.sleep) 대신 요소가 준비되거나 업로드/저장이 끝나는 조건을 기다리고,
+사진은 OS 파일 대화상자 대신 파일 입력(input[type=file])에 경로를 직접 넣으므로 헤드리스로도 실행할 수 있습니다.
+
+처리 결과는 행마다 기록 파일에 남으므로 중단된 실행은 --resume으로 이어서 처리할 수 있습니다.
+
+실행: python naver_writing.py --excel 네이버카페글쓰기.xlsx [--headless] [--resume]
+모의 페이지로 확인: python naver_writing.py --excel rows.xlsx --headless \\
+    --login-url file://$PWD/mock/login.html --write-url file://$PWD/mock/cafe_editor.html
+"""
+import argparse
+import itertools
 import os
-import pandas as pd
+from dataclasses import dataclass, field
+from typing import List, Optional
+from urllib.parse import urlsplit
+
 from selenium import webdriver
+from selenium.common.exceptions import NoAlertPresentException, TimeoutException
+from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import pyperclip  # 클립보드 사용을 위한 라이브러리
-import pyautogui
-from selenium.webdriver.common.action_chains import ActionChains
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+from webdriver_manager.chrome import ChromeDriverManager
+
+from ledger import Ledger, POSTED, STARTED
+from row_source import read_rows
 
 # 엑셀 파일 경로
-excel_file_path = r'C:\Users\Yunjadong\Desktop\네이버카페글쓰기.xlsx'
-
-# 엑셀 파일 읽기
-try:
-    df = pd.read_excel(excel_file_path)
-    print(f"엑셀 파일을 성공적으로 읽었습니다. 총 {len(df)} 개의 행이 있습니다.")
-except Exception as e:
-    print(f"엑셀 파일 읽기 오류: {e}")
-    exit(1)
-
-# 네이버 로그인 정보 설정
-naver_id = "yunjadong"
-naver_pw = "test1234"
-
-# 웹드라이버 설정
-options = webdriver.ChromeOptions()
-# options.add_argument('--headless')  # 필요시 헤드리스 모드 활성화
-options.add_argument('--no-sandbox')
-options.add_argument('--disable-dev-shm-usage')
-
-# 웹드라이버 초기화
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
-
-try:
-    # 네이버 로그인 페이지 접속
-    driver.get('https://nid.naver.com/nidlogin.login')
-    time.sleep(2)  # 페이지 로딩 대기
-    
-    # 아이디 입력 필드 찾기
-    id_field = driver.find_element(By.ID, 'id')
-    id_field.click()
-    
-    # 클립보드에 아이디 복사 후 붙여넣기
-    pyperclip.copy(naver_id)
-    id_field.send_keys(Keys.CONTROL, 'v')
-    time.sleep(1)
-    
-    # 비밀번호 입력 필드 찾기
-    pw_field = driver.find_element(By.ID, 'pw')
-    pw_field.click()
-    
-    # 클립보드에 비밀번호 복사 후 붙여넣기
-    pyperclip.copy(naver_pw)
-    pw_field.send_keys(Keys.CONTROL, 'v')
-    time.sleep(1)
-    
-    # 로그인 버튼 클릭
-    login_button = driver.find_element(By.ID, 'log.login')
-    login_button.click()
-    
-    # 로그인 완료 대기
-    time.sleep(3)
-    
+EXCEL_FILE_PATH = r'C:\Users\Yunjadong\Desktop\네이버카페글쓰기.xlsx'
+
+LOGIN_URL = 'https://nid.naver.com/nidlogin.login'
+WRITE_URL = 'https://cafe.naver.com/ca-fe/cafes/30883250/menus/1/articles/write?boardType=L'
+
+# 로그인에 성공하면 생기는 인증 쿠키 (캡차/기기 확인 등으로 로그인 페이지에 머물러도 발급되었으면 로그인된 상태)
+LOGIN_COOKIE = 'NID_AUT'
+
+# 조건 대기 최대 시간 (초). 조건이 충족되면 바로 다음 단계로 넘어감
+WAIT_TIMEOUT = 10
+UPLOAD_TIMEOUT = 30
+
+# 글쓰기 페이지 요소 (스마트에디터 ONE)
+TITLE_FIELD = (By.CSS_SELECTOR, 'textarea.textarea_input')
+CONTENT_PLACEHOLDER = (By.CSS_SELECTOR, 'span.se-placeholder.__se_placeholder.se-ff-system.se-fs15.se-placeholder-focused')
+IMAGE_BUTTON = (By.CSS_SELECTOR, 'button[data-name="image"]')
+FILE_INPUT = (By.CSS_SELECTOR, 'input[type="file"]')
+UPLOADED_IMAGE = (By.CSS_SELECTOR, 'img.se-image-resource')
+MAP_BUTTON = (By.CSS_SELECTOR, 'button[data-name="map"]')
+MAP_INPUT = (By.CSS_SELECTOR, 'input[placeholder="장소명을 입력하세요."]')
+MAP_FIRST_RESULT = (By.CSS_SELECTOR, 'li.se-place-map-search-result-item:first-child')
+MAP_ADD_BUTTON = (By.CSS_SELECTOR, 'button.se-place-add-button')
+POPUP_CONFIRM = (By.CSS_SELECTOR, 'button.se-popup-button.se-popup-button-confirm')
+TEMP_SAVE_BUTTON = (By.CSS_SELECTOR, 'button.btn_temp_save')
+# 임시등록 완료 안내 (알림창이 뜨는 경우도 함께 확인)
+TEMP_SAVE_DONE = (By.CSS_SELECTOR, '.layer_toast, .temp_save_layer')
+
+
+def create_driver(headless=False, profile=None):
+    options = webdriver.ChromeOptions()
+    if profile:
+        # 로그인 상태가 남는 Chrome 프로필 (동시에 한 브라우저만 쓸 수 있음)
+        options.add_argument(f'--user-data-dir={profile}')
+    if headless:
+        options.add_argument('--headless=new')
+        options.add_argument('--window-size=1280,1024')
+    options.add_argument('--no-sandbox')
+    options.add_argument('--disable-dev-shm-usage')
+    return webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=options)
+
+
+def fill_input(driver, element, value):
+    # 입력 이벤트를 발생시키며 값 설정 (클립보드 붙여넣기와 같은 효과, 헤드리스에서도 동작)
+    driver.execute_script(
+        "arguments[0].focus();"
+        "arguments[0].value = arguments[1];"
+        "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+        "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+        element, value
+    )
+
+
+def login(driver, naver_id, naver_pw, login_url=LOGIN_URL, timeout=WAIT_TIMEOUT):
+    driver.get(login_url)
+    wait = WebDriverWait(driver, timeout)
+
+    # 아이디/비밀번호 입력
+    fill_input(driver, wait.until(EC.element_to_be_clickable((By.ID, 'id'))), naver_id)
+    fill_input(driver, wait.until(EC.element_to_be_clickable((By.ID, 'pw'))), naver_pw)
+
+    # 로그인 버튼 클릭 후 로그인된 상태가 될 때까지 대기
+    # (비밀번호 오류, 캡차, 기기 확인 페이지도 URL은 바뀌므로 URL 변화만으로는 성공으로 보지 않음)
+    wait.until(EC.element_to_be_clickable((By.ID, 'log.login'))).click()
+    try:
+        WebDriverWait(driver, timeout).until(lambda d: is_logged_in_page(d, login_url))
+    except TimeoutException:
+        raise RuntimeError(f"로그인하지 못했습니다 (현재 페이지: {driver.current_url})") from None
     print("네이버 로그인 성공!")
-    
-    # 각 행의 데이터로 글 작성 시작
-    for index, row in df.iterrows():
-        if index == 0:  # 첫 번째 행은 헤더일 수 있으므로 건너뛰기
-            continue
-            
-        # 데이터 추출
-        title = row[0]  # A열: 제목
-        content = row[1]  # B열: 내용
-        image_path = row[2]  # C열: 사진 경로
-        location = row[3]  # D열: 장소명
-        
-        print(f"\n{index}번째 행 처리 중: 제목 - {title}")
-        
-        # 네이버 카페 게시판 글쓰기 페이지로 이동
-        driver.get('https://cafe.naver.com/ca-fe/cafes/30883250/menus/1/articles/write?boardType=L')
-        time.sleep(3)  # 페이지 로딩 대기
-        
-        # 제목 입력 필드 찾기
+
+
+def is_logged_in_page(driver, login_url=LOGIN_URL):
+    """인증 쿠키가 있거나 로그인 페이지의 호스트(모의 페이지는 파일)를 벗어났으면 True를 반환합니다."""
+    if driver.get_cookie(LOGIN_COOKIE):
+        return True
+    current, login_page = urlsplit(driver.current_url), urlsplit(login_url)
+    if login_page.netloc:
+        return current.netloc != login_page.netloc
+    return current.path != login_page.path
+
+
+def upload_image(driver, image_path, timeout=UPLOAD_TIMEOUT):
+    before = len(driver.find_elements(*UPLOADED_IMAGE))
+    inputs = driver.find_elements(*FILE_INPUT)
+    if not inputs:
+        # 사진 버튼이 파일 입력을 만들 때 OS 파일 대화상자가 뜨지 않도록 click()을 잠시 막아 둠
+        driver.execute_script(
+            "window.__fileInputClick = HTMLInputElement.prototype.click;"
+            "HTMLInputElement.prototype.click = function () {"
+            "  if (this.type !== 'file') { return window.__fileInputClick.call(this); }"
+            "};"
+        )
         try:
-            title_field = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'textarea.textarea_input'))
-            )
-            title_field.click()
-            
-            # 제목 입력
-            title_field.send_keys(title)
-            print(f"제목 '{title}' 입력 완료")
-            time.sleep(1)
-        except Exception as e:
-            print(f"제목 입력 중 오류 발생: {e}")
-            driver.save_screenshot(f"제목입력오류_{index}.png")
-            continue  # 다음 행으로 넘어가기
-        
-        # 내용 입력 필드 찾기
+            WebDriverWait(driver, WAIT_TIMEOUT).until(EC.element_to_be_clickable(IMAGE_BUTTON)).click()
+            inputs = WebDriverWait(driver, WAIT_TIMEOUT).until(EC.presence_of_all_elements_located(FILE_INPUT))
+        finally:
+            driver.execute_script("HTMLInputElement.prototype.click = window.__fileInputClick;")
+
+    # 숨겨진 파일 입력에 절대 경로를 넣고 에디터에 사진이 추가될 때까지 대기
+    inputs[-1].send_keys(os.path.abspath(image_path))
+    WebDriverWait(driver, timeout).until(lambda d: len(d.find_elements(*UPLOADED_IMAGE)) > before)
+
+
+def add_location(driver, location, timeout=WAIT_TIMEOUT):
+    wait = WebDriverWait(driver, timeout)
+    wait.until(EC.element_to_be_clickable(MAP_BUTTON)).click()
+
+    # 장소명 입력 후 검색 결과가 나타날 때까지 대기
+    location_input = wait.until(EC.visibility_of_element_located(MAP_INPUT))
+    location_input.send_keys(location)
+    location_input.send_keys(Keys.ENTER)
+
+    # 검색 결과에서 첫 번째 항목 선택
+    first_result = wait.until(EC.element_to_be_clickable(MAP_FIRST_RESULT))
+    first_result.click()
+    wait.until(lambda d: first_result.find_element(*MAP_ADD_BUTTON).is_displayed())
+    first_result.find_element(*MAP_ADD_BUTTON).click()
+
+    # 확인 버튼 클릭 후 팝업이 닫힐 때까지 대기
+    confirm_button = wait.until(EC.element_to_be_clickable(POPUP_CONFIRM))
+    confirm_button.click()
+    wait.until(EC.invisibility_of_element(confirm_button))
+
+
+def temp_save(driver, timeout=WAIT_TIMEOUT):
+    WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(TEMP_SAVE_BUTTON)).click()
+
+    # 저장 완료 안내가 뜰 때까지 대기 (알림창이면 확인)
+    WebDriverWait(driver, timeout).until(EC.any_of(EC.alert_is_present(), EC.visibility_of_element_located(TEMP_SAVE_DONE)))
+    try:
+        driver.switch_to.alert.accept()
+    except NoAlertPresentException:
+        pass
+
+    # 여기에 실제 등록 버튼 클릭 코드를 추가할 수 있습니다.
+    # 테스트 단계에서는 임시등록만 하고, 실제 등록은 주석 처리해두세요.
+    # WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.CSS_SELECTOR, 'button.btn_register'))).click()
+
+
+@dataclass
+class RowResult:
+    index: int
+    title: str
+    ok: bool
+    error: Optional[str] = None
+    screenshot: Optional[str] = None
+    # 임시등록은 되었지만 선택 항목(사진, 장소)을 넣지 못한 경우의 오류 (스크린샷 경로 포함)
+    warnings: List[str] = field(default_factory=list)
+    seconds: float = 0.0
+    worker: Optional[int] = None
+    account: Optional[str] = None
+
+
+def save_screenshot(driver, name, index):
+    path = f"{name}_{index}.png"
+    try:
+        driver.save_screenshot(path)
+    except Exception:
+        return None
+    return path
+
+
+def publish_row(driver, index, title, content, image_path, location, write_url=WRITE_URL, timeout=WAIT_TIMEOUT):
+    """한 행을 글쓰기 페이지에 입력하고 임시등록합니다.
+
+    제목/내용 입력이나 임시등록에 실패하면 ok=False인 결과를 반환하고, 사진/장소를 넣지 못하면 임시등록한 뒤 warnings에 남깁니다.
+    """
+    print(f"\n{index}번째 행 처리 중: 제목 - {title}")
+
+    # 네이버 카페 게시판 글쓰기 페이지로 이동
+    driver.get(write_url)
+    wait = WebDriverWait(driver, timeout)
+
+    # 제목 입력
+    try:
+        title_field = wait.until(EC.element_to_be_clickable(TITLE_FIELD))
+        title_field.click()
+        title_field.send_keys(title)
+        print(f"제목 '{title}' 입력 완료")
+    except Exception as e:
+        print(f"제목 입력 중 오류 발생: {e}")
+        # 다음 행으로 넘어가기
+        return RowResult(index, title, False, f"제목 입력 오류: {e}", save_screenshot(driver, "제목입력오류", index))
+
+    # 내용 입력 (ActionChains로 포커스된 에디터에 입력)
+    try:
+        wait.until(EC.element_to_be_clickable(CONTENT_PLACEHOLDER)).click()
+        ActionChains(driver).send_keys(content).perform()
+        print("내용 입력 완료")
+    except Exception as e:
+        print(f"내용 입력 중 오류 발생: {e}")
+        # 본문 없는 글이 임시등록되지 않도록 다음 행으로 넘어가기
+        return RowResult(index, title, False, f"내용 입력 오류: {e}", save_screenshot(driver, "내용입력오류", index))
+
+    warnings = []
+
+    def warn(message, name):
+        screenshot = save_screenshot(driver, name, index)
+        warnings.append(f"{message} (스크린샷: {screenshot})" if screenshot else message)
+
+    # 이미지 경로가 있고 파일이 존재하는 경우에만 이미지 추가
+    if image_path and not os.path.exists(image_path):
+        print(f"이미지 파일 '{image_path}'이(가) 없어 이미지 없이 등록합니다.")
+        warnings.append(f"이미지 파일 없음: {image_path}")
+    elif image_path:
         try:
-            content_field = WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, 'span.se-placeholder.__se_placeholder.se-ff-system.se-fs15.se-placeholder-focused'))
-            )
-            content_field.click()
-            
-            # ActionChains를 이용하여 내용 입력
-            actions = ActionChains(driver)
-            actions.send_keys(content).perform()
-            print(f"내용 입력 완료")
-            time.sleep(1)
+            upload_image(driver, image_path)
+            print(f"이미지 '{image_path}' 추가 완료")
         except Exception as e:
-            print(f"내용 입력 중 오류 발생: {e}")
-            driver.save_screenshot(f"내용입력오류_{index}.png")
-        
-        # 이미지 경로가 있고 파일이 존재하는 경우에만 이미지 추가
-        if pd.notna(image_path) and os.path.exists(image_path):
-            try:
-                # 사진 추가 버튼 클릭
-                image_button = driver.find_element(By.CSS_SELECTOR, 'button[data-name="image"]')
-                image_button.click()
-                time.sleep(2)  # 2초 기다리기
-                
-                # 클립보드에 파일 경로 복사
-                pyperclip.copy(image_path)
-                time.sleep(1)  # 잠시 대기
-                
-                # Ctrl + V를 눌러서 붙여넣기
-                pyautogui.hotkey('ctrl', 'v')
-                time.sleep(1)  # 잠시 대기
-                
-                # 엔터 키를 눌러서 확인
-                pyautogui.press('enter')
-                time.sleep(2)
-                print(f"이미지 '{image_path}' 추가 완료")
-            except Exception as e:
-                print(f"이미지 추가 중 오류 발생: {e}")
-                driver.save_screenshot(f"이미지추가오류_{index}.png")
-        
-        # 장소명이 있는 경우에만 장소 추가
-        if pd.notna(location) and location.strip() != "":
-            try:
-                # 장소 추가 버튼 클릭
-                location_button = driver.find_element(By.CSS_SELECTOR, 'button[data-name="map"]')
-                location_button.click()
-                time.sleep(2)
-                
-                # 장소명 입력
-                location_input = driver.find_element(By.CSS_SELECTOR, 'input[placeholder="장소명을 입력하세요."]')
-                location_input.send_keys(location)
-                location_input.send_keys(Keys.ENTER)
-                time.sleep(3)
-                
-                # 검색 결과에서 첫 번째 항목 선택
-                try:
-                    # 첫 번째 검색 결과 항목 찾기
-                    first_result = driver.find_element(By.CSS_SELECTOR, 'li.se-place-map-search-result-item:first-child')
-                    first_result.click()
-                    time.sleep(1)
-                    
-                    # 첫 번째 항목의 추가 버튼 클릭
-                    add_button = first_result.find_element(By.CSS_SELECTOR, 'button.se-place-add-button')
-                    add_button.click()
-                    time.sleep(2)
-                    
-                    # 확인 버튼 클릭
-                    confirm_button = driver.find_element(By.CSS_SELECTOR, 'button.se-popup-button.se-popup-button-confirm')
-                    confirm_button.click()
-                    time.sleep(2)
-                    print(f"장소 '{location}' 추가 완료")
-                except Exception as e:
-                    print(f"장소 검색 결과 선택 중 오류 발생: {e}")
-                    driver.save_screenshot(f"장소선택오류_{index}.png")
-            except Exception as e:
-                print(f"장소 추가 중 오류 발생: {e}")
-                driver.save_screenshot(f"장소추가오류_{index}.png")
-        
-        # 임시등록 또는 등록 버튼 클릭
+            print(f"이미지 추가 중 오류 발생: {e}")
+            warn(f"이미지 추가 오류: {e}", "이미지추가오류")
+
+    # 장소명이 있는 경우에만 장소 추가
+    if location:
         try:
-            # 임시등록 버튼 클릭
-            temp_save_button = driver.find_element(By.CSS_SELECTOR, 'button.btn_temp_save')
-            temp_save_button.click()
-            print(f"{index}번째 행 글 임시등록 완료")
-            time.sleep(3)  # 버튼 클릭 후 대기
-            
-            # 여기에 실제 등록 버튼 클릭 코드를 추가할 수 있습니다.
-            # 테스트 단계에서는 임시등록만 하고, 실제 등록은 주석 처리해두세요.
-            """
-            register_button = driver.find_element(By.CSS_SELECTOR, 'button.btn_register')
-            register_button.click()
-            print(f"{index}번째 행 글 등록 완료")
-            time.sleep(3)
-            """
+            add_location(driver, location, timeout)
+            print(f"장소 '{location}' 추가 완료")
         except Exception as e:
-            print(f"글 등록 중 오류 발생: {e}")
-            driver.save_screenshot(f"글등록오류_{index}.png")
-        
-        # 다음 글 작성을 위해 잠시 대기
-        time.sleep(2)
-    
-    print("\n모든 행의 처리가 완료되었습니다.")
-    
-except Exception as e:
-    print(f"전체 프로세스 중 오류 발생: {e}")
-    
-finally:
-    # 작업 완료 후 브라우저 종료 (선택적)
-    input("작업이 완료되었습니다. 브라우저를 닫으려면 아무 키나 누르세요...")
-    driver.quit()
+            print(f"장소 추가 중 오류 발생: {e}")
+            warn(f"장소 추가 오류: {e}", "장소추가오류")
+
+    # 임시등록
+    try:
+        temp_save(driver, timeout)
+        print(f"{index}번째 행 글 임시등록 완료")
+        return RowResult(index, title, True, warnings=warnings)
+    except Exception as e:
+        print(f"글 등록 중 오류 발생: {e}")
+        return RowResult(index, title, False, f"글 등록 오류: {e}", save_screenshot(driver, "글등록오류", index))
+
+
+def resumable_rows(rows, ledger, retry_interrupted=False):
+    """이전 실행 기록을 보고 이미 임시등록한 행을 건너뜁니다. 시작만 기록된 행은 등록 여부를 알 수 없어 기본적으로 건너뜁니다."""
+    skipped = 0
+    for row in rows:
+        status = ledger.status(row)
+        if status == POSTED:
+            skipped += 1
+            continue
+        if status == STARTED and not retry_interrupted:
+            print(f"{row.index}번째 행은 이전 실행에서 처리 중 중단되어 건너뜁니다. 등록 여부를 확인한 뒤 --retry-interrupted로 다시 시도하세요.")
+            continue
+        yield row
+    print(f"이미 임시등록된 {skipped}개 행을 건너뛰었습니다.")
+
+
+def peek_rows(rows):
+    """첫 행을 미리 읽어 파일 형식 오류는 브라우저를 띄우기 전에 알리고, 처리할 행이 없으면 None을 반환합니다."""
+    try:
+        first = next(rows, None)
+    except Exception as e:
+        print(f"엑셀 파일 읽기 오류: {e}")
+        raise SystemExit(1)
+    if first is None:
+        print("처리할 행이 없습니다.")
+        return None
+    return itertools.chain([first], rows)
+
+
+def add_publisher_arguments(parser):
+    from sessions import SESSION_KEY_ENV
+
+    parser.add_argument('--headless', action='store_true', help="브라우저 창 없이 실행")
+    parser.add_argument('--login-url', default=LOGIN_URL)
+    parser.add_argument('--write-url', default=WRITE_URL)
+    parser.add_argument('--timeout', type=float, default=WAIT_TIMEOUT, help="단계별 최대 대기 시간 (초)")
+    parser.add_argument('--workers', type=int, default=1, help="동시에 띄울 브라우저 수 (작업자마다 따로 로그인)")
+    parser.add_argument('--accounts', help='계정 목록 JSON 파일 ([{"id": ...}]). 작업자에게 차례로 배정 (기본: NAVER_ID/NAVER_PW 환경 변수)')
+    parser.add_argument('--session-dir', default='sessions', help=f"암호화한 로그인 쿠키 저장 폴더 ({SESSION_KEY_ENV} 환경 변수가 있을 때 사용)")
+    parser.add_argument('--profile-dir', help="쿠키 대신 계정/작업자별 Chrome 프로필을 저장해 로그인 상태를 유지할 폴더")
+    parser.add_argument('--min-interval', type=float, default=0.0, help="같은 계정으로 글을 등록하는 최소 간격 (초)")
+    parser.add_argument('--max-per-hour', type=int, default=0, help="계정별 시간당 최대 등록 수 (0이면 제한 없음)")
+    parser.add_argument('--ledger', help="행별 처리 기록 파일 (기본: 입력 파일 이름 + .ledger.jsonl)")
+    parser.add_argument('--resume', action='store_true', help="처리 기록에서 이미 임시등록한 행은 건너뛰고 이어서 처리")
+    parser.add_argument('--retry-interrupted', action='store_true', help="--resume 시 처리 중 중단되어 등록 여부를 알 수 없는 행도 다시 처리")
+    parser.add_argument('--report', help="행별 결과와 처리량을 저장할 JSON 파일")
+    parser.add_argument('--keep-open', action='store_true', help="완료 후 키 입력이 있을 때까지 브라우저 유지")
+
+
+def run_publisher(rows, args, ledger, extra_results=(), halted=None):
+    """작업자 풀로 행을 임시등록하고 요약을 출력합니다. extra_results(등록 전 단계에서 실패한 행 등)는 등록이 끝난 뒤 결과에 합칩니다.
+
+    halted는 작업자가 모두 종료되었거나 중단 요청이 있을 때 설정됩니다 (run_pool 참고).
+    """
+    from publisher_pool import AccountPacer, env_account, load_accounts, print_summary, run_pool, write_report
+    from sessions import SESSION_KEY_ENV, CookieStore
+
+    try:
+        accounts = load_accounts(args.accounts) if args.accounts else [env_account()]
+    except (OSError, ValueError, KeyError) as e:
+        print(f"계정 정보 오류: {e}")
+        raise SystemExit(1)
+    store = CookieStore.from_env(args.session_dir)
+    if store is None and not args.profile_dir:
+        print(f"{SESSION_KEY_ENV}가 없어 로그인 세션을 저장하지 않습니다. 매 실행마다 로그인합니다.")
+
+    pacer = AccountPacer(args.min_interval, args.max_per_hour)
+    try:
+        results, elapsed = run_pool(rows, accounts, args.workers, pacer, args, ledger, store, halted)
+    finally:
+        ledger.close()
+    results = sorted([*results, *extra_results], key=lambda result: result.index)
+
+    print_summary(results, elapsed, args.workers)
+    print(f"처리 기록: {ledger.path}")
+    if args.report:
+        write_report(args.report, results, elapsed, args.workers)
+    return results, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="엑셀 행으로 네이버 카페 글 임시등록")
+    parser.add_argument('--excel', default=EXCEL_FILE_PATH, help="글 목록 파일 (xlsx 또는 csv, 첫 줄은 머리글. A: 제목, B: 내용, C: 사진 경로, D: 장소명)")
+    add_publisher_arguments(parser)
+    args = parser.parse_args()
+
+    ledger = Ledger(args.ledger or f"{args.excel}.ledger.jsonl")
+    rows = read_rows(args.excel)
+    if args.resume:
+        rows = resumable_rows(rows, ledger, args.retry_interrupted)
+
+    # 글 목록 파일은 작업자가 처리하는 동안 한 줄씩 읽음
+    rows = peek_rows(rows)
+    if rows is not None:
+        run_publisher(rows, args, ledger)
+
 
+if __name__ == '__main__':
+    main()
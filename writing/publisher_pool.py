@@ -0,0 +1,268 @@
+"""여러 브라우저 작업자가 하나의 행 대기열을 나눠 처리하는 카페 글 등록 풀.
+
+작업자마다 브라우저를 따로 띄워 배정된 계정으로 로그인하고, 같은 계정을 쓰는 작업자끼리는
+AccountPacer로 등록 간격과 시간당 등록 수를 함께 지킵니다. naver_writing.py의 --workers 옵션으로 실행합니다.
+"""
+import json
+import os
+import queue
+import re
+import statistics
+import threading
+import time
+from collections import Counter, deque
+
+from naver_writing import RowResult, create_driver, publish_row
+from sessions import open_session, profile_path
+
+
+def account_password(account_id):
+    # 계정별 비밀번호 환경 변수 (예: NAVER_PW_MYID), 없으면 NAVER_PW
+    name = 'NAVER_PW_' + re.sub(r'\W', '_', account_id).upper()
+    return os.environ.get(name) or os.environ.get('NAVER_PW')
+
+
+def env_account():
+    account_id = os.environ.get('NAVER_ID')
+    if not account_id:
+        raise ValueError("NAVER_ID 환경 변수 또는 --accounts 계정 목록이 필요합니다")
+    return account_id, account_password(account_id)
+
+
+def load_accounts(path):
+    """계정 목록 JSON을 읽습니다. 비밀번호("pw")를 생략하면 환경 변수에서 찾고, 저장된 세션만으로 쓸 수도 있습니다."""
+    with open(path, encoding='utf-8') as f:
+        accounts = [(account['id'], account.get('pw') or account_password(account['id'])) for account in json.load(f)]
+    if not accounts:
+        raise ValueError(f"계정 목록이 비어 있습니다: {path}")
+    return accounts
+
+
+class AccountPacer:
+    """계정별로 글 등록 최소 간격과 시간당 최대 등록 수를 지키도록 다음 등록 시각을 예약합니다."""
+
+    def __init__(self, min_interval=0.0, max_per_hour=0):
+        self.min_interval = min_interval
+        self.max_per_hour = max_per_hour
+        self._lock = threading.Lock()
+        self._next_at = {}
+        self._history = {}
+
+    def reserve(self, account):
+        """다음 등록 차례를 예약하고 그때까지 기다려야 하는 시간(초)을 반환합니다."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_at.get(account, now))
+            history = self._history.setdefault(account, deque())
+            if self.max_per_hour:
+                while history and history[0] <= start - 3600:
+                    history.popleft()
+                if len(history) >= self.max_per_hour:
+                    # 한 시간 안의 가장 오래된 등록이 빠질 때까지 미룸
+                    start = history.popleft() + 3600
+            history.append(start)
+            self._next_at[account] = start + self.min_interval
+            return start - now
+
+    def wait(self, account, stop):
+        delay = self.reserve(account)
+        if delay > 0:
+            if delay >= 1:
+                print(f"계정 {account}: 등록 간격 유지를 위해 {delay:.0f}초 대기")
+            stop.wait(delay)
+
+
+def _start_session(worker_id, account, options, store):
+    profile_dir = getattr(options, 'profile_dir', None)
+    # 같은 계정을 쓰는 작업자끼리도 프로필은 따로 (한 프로필은 브라우저 하나만 열 수 있음)
+    profile = profile_path(profile_dir, f"{account[0]}-{worker_id}") if profile_dir else None
+    driver = create_driver(options.headless, profile)
+    try:
+        reused = open_session(driver, account[0], account[1], options, store)
+    except Exception:
+        driver.quit()
+        raise
+    print(f"작업자 {worker_id}: {account[0]} 계정으로 {'저장된 세션 사용' if reused else '로그인'}")
+    return driver
+
+
+def _worker(worker_id, account, rows, results, pacer, options, stop, drivers, ledger, store):
+    try:
+        driver = _start_session(worker_id, account, options, store)
+    except Exception as e:
+        print(f"작업자 {worker_id}: 로그인 실패로 종료 ({e})")
+        return
+
+    while True:
+        row = rows.get()
+        if row is None:
+            break
+        if not stop.is_set():
+            pacer.wait(account[0], stop)
+        if stop.is_set():
+            # 중단 요청 후 꺼낸 행은 처리하지 않고 다음 실행(--resume)으로 넘김
+            continue
+
+        if ledger is not None:
+            ledger.start(row, worker_id, account[0])
+        started = time.perf_counter()
+        try:
+            result = publish_row(driver, *row, write_url=options.write_url, timeout=options.timeout)
+        except Exception as e:
+            # 페이지 이동 실패나 브라우저 종료 등 행 단위로 처리하지 못한 오류는 브라우저를 새로 띄워 계속 진행
+            result = RowResult(row.index, row.title, False, f"브라우저 오류: {e}")
+            driver.quit()
+            try:
+                driver = _start_session(worker_id, account, options, store)
+            except Exception as e:
+                print(f"작업자 {worker_id}: 다시 로그인하지 못해 종료 ({e})")
+                driver = None
+        result.seconds = time.perf_counter() - started
+        result.worker = worker_id
+        result.account = account[0]
+        if ledger is not None:
+            ledger.record(result)
+        results.append(result)
+        print(f"{row.index}번째 행 소요 시간: {result.seconds:.1f}초 (작업자 {worker_id})")
+        if driver is None:
+            return
+
+    if store is not None:
+        # 실행 중 갱신된 쿠키를 다음 실행에서 쓰도록 저장
+        try:
+            store.save(driver, account[0])
+        except Exception as e:
+            print(f"작업자 {worker_id}: 세션 저장 실패 ({e})")
+    drivers.append(driver)
+
+
+def _put(pending, item, threads):
+    while True:
+        try:
+            pending.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            if not any(thread.is_alive() for thread in threads):
+                return False
+
+
+def _feed(rows, pending, threads, halted=None):
+    """행을 작업자 수의 두 배까지만 대기열에 채워 가며 넣고, 끝나면 작업자마다 종료 신호(None)를 넣습니다.
+
+    모든 작업자가 종료되어 더 넣을 수 없으면 halted를 설정하고 넣지 못한 행 목록을 반환합니다.
+    halted를 확인하는 행 공급자(글 생성 등)는 이미 만든 행까지만 내주고 멈춥니다.
+    """
+    for row in rows:
+        if not _put(pending, row, threads):
+            if halted is not None:
+                halted.set()
+            return [row, *rows]
+    for thread in threads:
+        if not _put(pending, None, threads):
+            break
+    return []
+
+
+def _drain(pending):
+    rows = []
+    while True:
+        try:
+            row = pending.get_nowait()
+        except queue.Empty:
+            return rows
+        if row is not None:
+            rows.append(row)
+
+
+def run_pool(rows, accounts, workers, pacer, options, ledger=None, store=None, halted=None):
+    """행을 작업자들에게 나눠 처리하고 (행 번호순 결과 목록, 전체 소요 시간)을 반환합니다.
+
+    rows는 한 번에 모두 읽지 않고 처리하는 만큼 가져갑니다. 모든 작업자가 로그인 실패 등으로 종료되어
+    처리하지 못한 행은 실패 결과로 포함되고, Ctrl+C로 중단하면 진행 중인 행까지만 처리합니다.
+    두 경우 모두 halted(threading.Event)를 설정해 행 공급자가 더 만들지 않도록 알립니다.
+    """
+    workers = max(1, workers)
+    pending = queue.Queue(maxsize=workers * 2)
+    results = []
+    drivers = []
+    stop = threading.Event()
+
+    started = time.perf_counter()
+    threads = [
+        threading.Thread(
+            target=_worker, name=f"publisher-{i}",
+            args=(i, accounts[(i - 1) % len(accounts)], pending, results, pacer, options, stop, drivers, ledger, store)
+        )
+        for i in range(1, workers + 1)
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        unprocessed = _feed(rows, pending, threads, halted)
+        for thread in threads:
+            # join을 짧게 나눠 기다려야 Ctrl+C가 바로 전달됨
+            while thread.is_alive():
+                thread.join(0.5)
+    except KeyboardInterrupt:
+        print("\n중단 요청: 진행 중인 행까지만 처리합니다. 나머지는 --resume으로 이어서 처리할 수 있습니다.")
+        stop.set()
+        if halted is not None:
+            halted.set()
+        unprocessed = _drain(pending)
+        for thread in threads:
+            pending.put_nowait(None)
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+
+    unprocessed += _drain(pending)
+    results.extend(RowResult(row.index, row.title, False, "처리되지 않음") for row in unprocessed)
+
+    # 작업 완료 후 브라우저 종료
+    if getattr(options, 'keep_open', False) and drivers:
+        input("작업이 완료되었습니다. 브라우저를 닫으려면 아무 키나 누르세요...")
+    for driver in drivers:
+        driver.quit()
+    return sorted(results, key=lambda result: result.index), elapsed
+
+
+def summarize(results, elapsed, workers):
+    timed = [result.seconds for result in results if result.worker is not None]
+    posted = sum(1 for result in results if result.ok)
+    return {
+        'rows': len(results),
+        'posted': posted,
+        'failed': len(results) - posted,
+        'workers': workers,
+        'elapsed_s': round(elapsed, 1),
+        'rows_per_minute': round(len(timed) / elapsed * 60, 2) if elapsed else 0.0,
+        'row_seconds_p50': round(statistics.median(timed), 1) if timed else 0.0,
+        'row_seconds_max': round(max(timed), 1) if timed else 0.0,
+        'per_worker': dict(sorted(Counter(result.worker for result in results if result.worker is not None).items())),
+        'per_account': dict(Counter(result.account for result in results if result.ok)),
+    }
+
+
+def print_summary(results, elapsed, workers):
+    summary = summarize(results, elapsed, workers)
+    print(
+        f"\n모든 행의 처리가 완료되었습니다. ({summary['posted']}/{summary['rows']}건 임시등록, "
+        f"{summary['elapsed_s']}초, 분당 {summary['rows_per_minute']}건, 작업자 {workers}명)"
+    )
+    print(f"행당 소요 시간: 중앙값 {summary['row_seconds_p50']}초, 최대 {summary['row_seconds_max']}초")
+    for result in results:
+        if not result.ok:
+            screenshot = f" (스크린샷: {result.screenshot})" if result.screenshot else ""
+            print(f"  실패 {result.index}번째 행 '{result.title}': {result.error}{screenshot}")
+        for warning in result.warnings:
+            print(f"  일부 누락 {result.index}번째 행 '{result.title}': {warning}")
+
+
+def write_report(path, results, elapsed, workers):
+    report = {
+        'summary': summarize(results, elapsed, workers),
+        'rows': [vars(result) for result in results],
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, default=str)
+    print(f"결과 저장: {path}")
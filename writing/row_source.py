@@ -0,0 +1,69 @@
+"""글쓰기 행을 xlsx/CSV 파일에서 한 줄씩 읽습니다.
+
+파일 전체를 메모리에 올리지 않도록 xlsx는 openpyxl 읽기 전용 모드, CSV는 csv 모듈로 스트리밍합니다.
+첫 줄은 머리글로 건너뛰고, 각 행의 index는 시트의 실제 행 번호(머리글이 1)라 다음 실행에서도 같은 행을 가리킵니다.
+"""
+import csv
+import os
+from collections import namedtuple
+
+# A열: 제목, B열: 내용, C열: 사진 경로, D열: 장소명
+Row = namedtuple('Row', ['index', 'title', 'content', 'image_path', 'location'])
+COLUMNS = len(Row._fields) - 1
+# 글을 생성해 올릴 때: A열: 주제, B열: 글의 성격 (informational, sales), C열: 사진 경로, D열: 장소명
+TopicRow = namedtuple('TopicRow', ['index', 'topic', 'content_type', 'image_path', 'location'])
+TOPIC_COLUMNS = len(TopicRow._fields) - 1
+
+
+def _cell(value):
+    if value is None:
+        return None
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    text = str(value).strip()
+    return text or None
+
+
+def _iter_xlsx(path):
+    from openpyxl import load_workbook
+
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        yield from workbook.active.iter_rows(values_only=True)
+    finally:
+        workbook.close()
+
+
+def _iter_csv(path):
+    # 엑셀에서 저장한 CSV의 BOM 제거
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        yield from csv.reader(f)
+
+
+def _read(path, width):
+    extension = os.path.splitext(path)[1].lower()
+    if extension in ('.xlsx', '.xlsm'):
+        values = _iter_xlsx(path)
+    elif extension == '.csv':
+        values = _iter_csv(path)
+    else:
+        raise ValueError(f"지원하지 않는 파일 형식입니다 (xlsx, csv): {path}")
+
+    for number, cells in enumerate(values, start=1):
+        if number == 1:
+            continue  # 머리글
+        cells = [_cell(value) for value in list(cells)[:width]]
+        cells += [None] * (width - len(cells))
+        if not any(cells):
+            continue  # 빈 줄
+        yield number, cells
+
+
+def read_rows(path):
+    for number, cells in _read(path, COLUMNS):
+        yield Row(number, *cells)
+
+
+def read_topic_rows(path):
+    for number, cells in _read(path, TOPIC_COLUMNS):
+        yield TopicRow(number, *cells)
@@ -0,0 +1,111 @@
+"""네이버 로그인 세션을 저장해 다음 실행에서 다시 로그인하지 않도록 합니다.
+
+두 가지 방식을 지원합니다.
+- 쿠키 저장: 로그인 후 브라우저 쿠키를 NAVER_SESSION_KEY(Fernet 키)로 암호화해 계정별 파일로 저장하고,
+  다음 실행에서 복원합니다. 키 만들기: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+- 브라우저 프로필: --profile-dir 아래 계정별 Chrome 프로필을 그대로 다시 씁니다.
+
+어느 쪽이든 글쓰기 페이지가 로그인 페이지로 넘어가지 않고 열리는지 확인한 뒤에만 세션을 재사용합니다.
+"""
+import json
+import os
+import re
+
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from naver_writing import LOGIN_URL, TITLE_FIELD, WAIT_TIMEOUT, WRITE_URL, login
+
+SESSION_KEY_ENV = 'NAVER_SESSION_KEY'
+
+
+def _account_file(directory, account_id, extension=''):
+    # 계정 아이디를 파일 이름으로 쓸 수 있게 정리
+    return os.path.join(directory, re.sub(r'[^\w.-]', '_', account_id) + extension)
+
+
+def profile_path(profile_dir, account_id):
+    return os.path.abspath(_account_file(profile_dir, account_id))
+
+
+class CookieStore:
+    """계정별 쿠키를 Fernet으로 암호화해 저장합니다. 키가 바뀌었거나 파일이 손상되면 저장된 세션이 없는 것으로 봅니다."""
+
+    def __init__(self, directory, key):
+        from cryptography.fernet import Fernet
+
+        self.directory = directory
+        self._fernet = Fernet(key)
+
+    @classmethod
+    def from_env(cls, directory):
+        key = os.environ.get(SESSION_KEY_ENV)
+        return cls(directory, key) if key else None
+
+    def load(self, account_id):
+        from cryptography.fernet import InvalidToken
+
+        path = _account_file(self.directory, account_id, '.session')
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'rb') as f:
+                return json.loads(self._fernet.decrypt(f.read()))
+        except (InvalidToken, ValueError):
+            print(f"{account_id} 계정의 저장된 세션을 읽을 수 없어 다시 로그인합니다.")
+            return None
+
+    def save(self, driver, account_id):
+        # 현재 페이지 도메인뿐 아니라 nid.naver.com 등 모든 도메인의 쿠키를 저장
+        cookies = driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+        os.makedirs(self.directory, exist_ok=True)
+        path = _account_file(self.directory, account_id, '.session')
+        with open(path + '.tmp', 'wb') as f:
+            f.write(self._fernet.encrypt(json.dumps(cookies).encode('utf-8')))
+        os.replace(path + '.tmp', path)
+        os.chmod(path, 0o600)
+
+
+def restore_cookies(driver, cookies):
+    # CDP로 설정하면 쿠키마다 해당 도메인 페이지를 열 필요가 없음
+    fields = ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite', 'expires')
+    driver.execute_cdp_cmd('Network.setCookies', {
+        'cookies': [{field: cookie[field] for field in fields if field in cookie} for cookie in cookies]
+    })
+
+
+def is_logged_in(driver, write_url=WRITE_URL, login_url=LOGIN_URL, timeout=WAIT_TIMEOUT):
+    """글쓰기 페이지를 열어 편집기가 나타나면 True, 로그인 페이지로 넘어가면 False를 반환합니다."""
+    login_host = login_url.split('?')[0]
+    driver.get(write_url)
+    try:
+        WebDriverWait(driver, timeout).until(EC.any_of(
+            EC.presence_of_element_located(TITLE_FIELD),
+            lambda d: d.current_url.startswith(login_host)
+        ))
+    except Exception:
+        return False
+    return not driver.current_url.startswith(login_host)
+
+
+def open_session(driver, account_id, password, options, store=None):
+    """저장된 세션(쿠키 또는 프로필)이 유효하면 그대로 쓰고, 아니면 로그인한 뒤 세션을 저장합니다.
+
+    로그인 없이 세션을 재사용했으면 True를 반환합니다.
+    """
+    cookies = store.load(account_id) if store is not None else None
+    if cookies:
+        restore_cookies(driver, cookies)
+    if (cookies or getattr(options, 'profile_dir', None)) and is_logged_in(driver, options.write_url, options.login_url, options.timeout):
+        print(f"{account_id} 계정의 저장된 세션을 사용합니다.")
+        return True
+
+    if not password:
+        raise RuntimeError(f"{account_id} 계정의 저장된 세션이 없고 비밀번호가 설정되지 않았습니다")
+    if cookies:
+        # 만료된 쿠키가 새 로그인에 섞이지 않도록 정리
+        driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+    login(driver, account_id, password, options.login_url, options.timeout)
+    if store is not None:
+        store.save(driver, account_id)
+    return False